@@ -0,0 +1,86 @@
+"""Compare the block codec against the generic base conversion it replaced.
+
+Run from the root of the repository with::
+
+    $ python benchmarks/block_codec.py
+"""
+import os
+import timeit
+
+import mnemonicode
+from mnemonicode._utils import from_base, to_base
+from mnemonicode._wordlist import index_to_word, word_to_index
+
+
+def _legacy_block_to_indices(block):
+    num = from_base(256, reversed(block))
+    indices = list(reversed(to_base(1626, num)))
+    length = {1: 1, 2: 2, 3: 3, 4: 3}[len(block)]
+    indices += [0] * (length - len(indices))
+    if len(block) == 3:
+        indices[-1] += 1626
+    return indices
+
+
+def _legacy_words_to_block(words):
+    indices = list(word_to_index(word) for word in words)
+    length = {
+        1: 1,
+        2: 2,
+        3: 3 if indices[-1] >= 1626 else 4,
+    }[len(words)]
+    if length == 3:
+        indices[2] -= 1626
+    num = from_base(1626, reversed(indices))
+    block = bytes(reversed(to_base(256, num)))
+    return block.ljust(length, b'\x00')
+
+
+def _bench(name, func, blocks, number=5):
+    def run():
+        for block in blocks:
+            func(block)
+
+    best = min(timeit.repeat(run, number=1, repeat=number))
+    per_block = best / len(blocks) * 1e9
+    print("{name:<40} {per_block:8.1f} ns/block".format(
+        name=name, per_block=per_block,
+    ))
+    return per_block
+
+
+def main():
+    count = 100000
+    for size in (1, 2, 3, 4):
+        blocks = [os.urandom(size) for _ in range(count)]
+        for block in blocks:
+            assert (
+                list(mnemonicode._block_to_indices(block)) ==
+                _legacy_block_to_indices(block)
+            )
+
+        print("{size} byte blocks".format(size=size))
+        old = _bench(
+            "  encode (from_base/to_base)", _legacy_block_to_indices, blocks,
+        )
+        new = _bench(
+            "  encode (_block_to_indices)", mnemonicode._block_to_indices,
+            blocks,
+        )
+        print("  speedup: {ratio:.2f}x".format(ratio=old / new))
+
+        groups = [
+            tuple(index_to_word(i) for i in _legacy_block_to_indices(block))
+            for block in blocks
+        ]
+        old = _bench(
+            "  decode (from_base/to_base)", _legacy_words_to_block, groups,
+        )
+        new = _bench(
+            "  decode (_words_to_block)", mnemonicode._words_to_block, groups,
+        )
+        print("  speedup: {ratio:.2f}x".format(ratio=old / new))
+
+
+if __name__ == '__main__':
+    main()
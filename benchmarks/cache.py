@@ -0,0 +1,92 @@
+"""Measure the effect of `enable_cache` on a skewed (Zipfian) workload.
+
+Run from the root of the repository with::
+
+    $ python benchmarks/cache.py
+"""
+import itertools
+import os
+import random
+import timeit
+
+import mnemonicode
+
+
+def _zipf_sample(population, count, exponent, rng):
+    weights = list(itertools.accumulate(
+        1.0 / (rank ** exponent) for rank in range(1, len(population) + 1)
+    ))
+    return rng.choices(population, cum_weights=weights, k=count)
+
+
+def _bench(name, func, number=5):
+    best = min(timeit.repeat(func, number=1, repeat=number))
+    print("{name:<44} {seconds:8.3f} s".format(name=name, seconds=best))
+    return best
+
+
+def _run(records, strings):
+    mnemonicode.disable_cache()
+    base_format = _bench(
+        "  mnformat loop, no cache",
+        lambda: [mnemonicode.mnformat(record) for record in records],
+    )
+    base_format_many = _bench(
+        "  mnformat_many, no cache",
+        lambda: list(mnemonicode.mnformat_many(records)),
+    )
+    base_parse = _bench(
+        "  mnparse loop, no cache",
+        lambda: [mnemonicode.mnparse(string) for string in strings],
+    )
+
+    for maxsize in (1024, 65536):
+        mnemonicode.enable_cache(maxsize=maxsize)
+        cached_format = _bench(
+            "  mnformat loop, maxsize={maxsize}".format(maxsize=maxsize),
+            lambda: [mnemonicode.mnformat(record) for record in records],
+        )
+        cached_format_many = _bench(
+            "  mnformat_many, maxsize={maxsize}".format(maxsize=maxsize),
+            lambda: list(mnemonicode.mnformat_many(records)),
+        )
+        cached_parse = _bench(
+            "  mnparse loop, maxsize={maxsize}".format(maxsize=maxsize),
+            lambda: [mnemonicode.mnparse(string) for string in strings],
+        )
+        info = mnemonicode.cache_info()
+        print((
+            "    speedups: mnformat {a:.2f}x, mnformat_many {b:.2f}x, "
+            "mnparse {c:.2f}x"
+        ).format(
+            a=base_format / cached_format,
+            b=base_format_many / cached_format_many,
+            c=base_parse / cached_parse,
+        ))
+        for name, stats in (('encode', info.encode), ('decode', info.decode)):
+            print((
+                "    {name} hit rate {rate:.1%}, {evictions} evictions"
+            ).format(
+                name=name, rate=stats.hits / (stats.hits + stats.misses),
+                evictions=stats.evictions,
+            ))
+
+    mnemonicode.disable_cache()
+
+
+def main():
+    rng = random.Random(0)
+    population = [os.urandom(4) for _ in range(1000000)]
+
+    for exponent in (0.8, 1.2):
+        records = _zipf_sample(population, 200000, exponent, rng)
+        strings = [mnemonicode.mnformat(record) for record in records]
+        print((
+            "200000 4 byte records, Zipf exponent {exponent}, "
+            "{unique} distinct"
+        ).format(exponent=exponent, unique=len(set(records))))
+        _run(records, strings)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Measure the peak resident memory of the `mnencode` and `mndecode` scripts
+as the size of their input grows.
+
+Run from the root of the repository, with the package installed, with::
+
+    $ python benchmarks/cli_memory.py [SIZE_IN_MIB ...]
+
+Inputs to `mnencode` are sparse files of zeros, so they take no space on
+disk.  Inputs to `mndecode` are the encoded text of the same, and take a
+little over six times their decoded size.  Output is written to
+``/dev/null``.  Peak memory is read from ``ru_maxrss`` of the script's own
+process, which Linux reports in KiB.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import mnemonicode
+
+# Runs a command, with output discarded, and prints the peak resident memory
+# of the child.  Each command gets a process of its own so that the peak
+# isn't carried over from one run to the next.
+_MEASURE = """
+import resource, subprocess, sys
+with open(sys.argv[1], 'rb') as f:
+    subprocess.check_call(sys.argv[2:], stdin=f, stdout=subprocess.DEVNULL)
+print(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+"""
+
+
+def _peak_rss(path, command):
+    return int(subprocess.check_output(
+        [sys.executable, '-c', _MEASURE, path] + command,
+    ))
+
+
+def _write_encoded(f, size):
+    # Writes the encoding of `size` bytes of zeros.
+    chunk = mnemonicode.mnformat(bytes(1 << 20))
+    for index in range(size >> 20):
+        if index:
+            f.write('--')
+        f.write(chunk)
+
+
+def _report(name, path, command):
+    start = time.perf_counter()
+    peak = _peak_rss(path, command)
+    elapsed = time.perf_counter() - start
+    print("  {name:<30} {elapsed:8.1f} s, peak RSS {peak:8.1f} MiB".format(
+        name=name, elapsed=elapsed, peak=peak / 1024,
+    ))
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [16, 64, 256]
+
+    directory = tempfile.mkdtemp()
+    try:
+        for size in sizes:
+            binary = os.path.join(directory, 'data')
+            with open(binary, 'wb') as f:
+                f.truncate(size << 20)
+            text = os.path.join(directory, 'text')
+            with open(text, 'w') as f:
+                _write_encoded(f, size << 20)
+
+            print("{size} MiB".format(size=size))
+            _report("mnencode", binary, ['mnencode'])
+            _report("mndecode", text, ['mndecode'])
+
+            os.unlink(binary)
+            os.unlink(text)
+    finally:
+        os.rmdir(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""Compare a `Codec` using a custom wordlist against the module level
+functions using the standard one.
+
+Run from the root of the repository with::
+
+    $ python benchmarks/codec.py
+"""
+import os
+import timeit
+
+import mnemonicode
+from mnemonicode._wordlist import _WORDLIST
+
+
+def _bench(name, func, number=5):
+    best = min(timeit.repeat(func, number=1, repeat=number))
+    print("{name:<40} {seconds:8.4f} s".format(name=name, seconds=best))
+    return best
+
+
+def main():
+    # A stand in for a localized wordlist, with non-ASCII characters.
+    codec = mnemonicode.Codec([word.upper() + "é" for word in _WORDLIST])
+
+    for size, count in [(16, 20000), (1024, 500), (1 << 20, 1)]:
+        records = [os.urandom(size) for _ in range(count)]
+        strings = [mnemonicode.mnformat(record) for record in records]
+        custom = [codec.format(record) for record in records]
+        for record, string in zip(records, custom):
+            assert codec.parse(string) == record
+
+        print("{count} records of {size} bytes".format(
+            count=count, size=size,
+        ))
+        _bench("  mnformat", lambda: list(map(mnemonicode.mnformat, records)))
+        _bench("  Codec.format", lambda: list(map(codec.format, records)))
+        _bench("  mnparse", lambda: list(map(mnemonicode.mnparse, strings)))
+        _bench("  Codec.parse", lambda: list(map(codec.parse, custom)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""Compare columnar encoding and decoding against building one string per row
+with `mnformat` and copying it into a buffer.
+
+Run from the root of the repository with::
+
+    $ python benchmarks/columnar.py
+"""
+import array
+import os
+import timeit
+
+import mnemonicode
+import mnemonicode.columnar
+
+
+def _bench(name, func, number=5):
+    best = min(timeit.repeat(func, number=1, repeat=number))
+    print("{name:<40} {seconds:8.3f} s".format(name=name, seconds=best))
+    return best
+
+
+def _encode_rows(records):
+    offsets = array.array('i', [0])
+    data = bytearray()
+    for record in records:
+        data += mnemonicode.mnformat(record).encode('utf-8')
+        offsets.append(len(data))
+    return offsets, data
+
+
+def _decode_rows(offsets, data):
+    out_offsets = array.array('i', [0])
+    out = bytearray()
+    for row in range(len(offsets) - 1):
+        out += mnemonicode.mnparse(
+            data[offsets[row]:offsets[row + 1]].decode('utf-8')
+        )
+        out_offsets.append(len(out))
+    return out_offsets, out
+
+
+def main():
+    count = 200000
+    records = [os.urandom(8) for _ in range(count)]
+    column = mnemonicode.columnar.encode_column(records)
+    assert column == _encode_rows(records)
+    assert (
+        mnemonicode.columnar.decode_column(*column) == _decode_rows(*column)
+    )
+
+    print("{count} records of 8 bytes".format(count=count))
+    old = _bench("  encode, one str per row", lambda: _encode_rows(records))
+    new = _bench(
+        "  encode_column",
+        lambda: mnemonicode.columnar.encode_column(records),
+    )
+    print("  speedup: {ratio:.2f}x".format(ratio=old / new))
+
+    old = _bench("  decode, one str per row", lambda: _decode_rows(*column))
+    new = _bench(
+        "  decode_column",
+        lambda: mnemonicode.columnar.decode_column(*column),
+    )
+    print("  speedup: {ratio:.2f}x".format(ratio=old / new))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""Measure prefix completion and abbreviated decoding.
+
+Run from the root of the repository with::
+
+    $ python benchmarks/complete.py
+"""
+import os
+import random
+import timeit
+
+import mnemonicode
+from mnemonicode._wordlist import _WORDLIST
+
+
+def _bench(name, func, args, number=5):
+    def run():
+        for arg in args:
+            func(arg)
+
+    best = min(timeit.repeat(run, number=1, repeat=number))
+    per_call = best / len(args) * 1e9
+    print("{name:<40} {per_call:8.1f} ns/call".format(
+        name=name, per_call=per_call,
+    ))
+    return per_call
+
+
+def _linear_complete(prefix):
+    return sorted(word for word in _WORDLIST if word.startswith(prefix))
+
+
+def _abbreviate(word):
+    # Returns the shortest prefix that identifies the word.
+    for end in range(1, len(word)):
+        if len(mnemonicode.complete(word[:end])) == 1:
+            return word[:end]
+    return word
+
+
+def main():
+    count = 20000
+    words = [random.choice(_WORDLIST) for _ in range(count)]
+
+    for length in (1, 2, 3, 4):
+        prefixes = [word[:length] for word in words]
+        print("{length} character prefixes".format(length=length))
+        _bench("  linear scan", _linear_complete, prefixes[:count // 10])
+        _bench("  complete", mnemonicode.complete, prefixes)
+
+    strings = [
+        mnemonicode.mnformat(os.urandom(16)) for _ in range(count // 10)
+    ]
+    abbreviated = [
+        '--'.join(
+            '-'.join(map(_abbreviate, group.split('-')))
+            for group in string.split('--')
+        )
+        for string in strings
+    ]
+    print("parsing 16 byte strings")
+    _bench("  mnparse", mnemonicode.mnparse, strings)
+    _bench(
+        "  mnparse, abbreviated",
+        lambda string: mnemonicode.mnparse(string, abbreviated=True),
+        abbreviated,
+    )
+
+
+if __name__ == '__main__':
+    main()
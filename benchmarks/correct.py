@@ -0,0 +1,72 @@
+"""Compare typo correction using the deletion neighbourhood index against a
+linear scan of the wordlist.
+
+Run from the root of the repository with::
+
+    $ python benchmarks/correct.py
+"""
+import random
+import string
+import timeit
+import tracemalloc
+
+from mnemonicode._wordlist import (
+    _WORDLIST, _correct, _make_correction_index, _single_edit,
+)
+
+
+def _linear_correct(word):
+    return tuple(
+        candidate for candidate in sorted(_WORDLIST)
+        if _single_edit(word, candidate)
+    )
+
+
+def _typo(word):
+    i = random.randrange(len(word))
+    char = random.choice(string.ascii_lowercase)
+    return random.choice([
+        word[:i] + char + word[i + 1:],
+        word[:i] + char + word[i:],
+        word[:i] + word[i + 1:],
+        word[:i] + word[i + 1:i + 2] + word[i] + word[i + 2:],
+    ])
+
+
+def _bench(name, func, args, number=5):
+    def run():
+        for arg in args:
+            func(arg)
+
+    best = min(timeit.repeat(run, number=1, repeat=number))
+    per_call = best / len(args) * 1e9
+    print("{name:<40} {per_call:8.1f} ns/call".format(
+        name=name, per_call=per_call,
+    ))
+    return per_call
+
+
+def main():
+    tracemalloc.start()
+    start = timeit.default_timer()
+    index = _make_correction_index(_WORDLIST)
+    elapsed = timeit.default_timer() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("{name:<40} {elapsed:8.1f} ms, {size} bytes".format(
+        name="building index", elapsed=elapsed * 1e3, size=size,
+    ))
+
+    def indexed_correct(word):
+        return _correct(index, _WORDLIST, word)
+
+    typos = [_typo(random.choice(_WORDLIST)) for _ in range(2000)]
+    for typo in typos:
+        assert indexed_correct(typo) == _linear_correct(typo)
+
+    _bench("linear scan", _linear_correct, typos[:200])
+    _bench("deletion neighbourhood index", indexed_correct, typos)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Measure the throughput of `mnfind` on a synthetic log file, compared with
+simply reading the file.
+
+Run from the root of the repository with::
+
+    $ python benchmarks/find.py [size in megabytes]
+"""
+import functools
+import os
+import random
+import sys
+import tempfile
+import time
+
+import mnemonicode
+
+
+_WORDS = (
+    "GET POST request completed failed user session timeout connection "
+    "error warning info debug the a to from with status retry cache"
+).split()
+
+
+def _write_log(f, size):
+    rng = random.Random(0)
+    written = 0
+    count = 0
+    while written < size:
+        line = "2020-01-01T00:00:{second:02d} {words}".format(
+            second=rng.randrange(60),
+            words=" ".join(rng.choice(_WORDS) for _ in range(12)),
+        )
+        if rng.random() < 0.05:
+            line += " id=" + mnemonicode.mnformat(os.urandom(8))
+            count += 1
+        line = (line + "\n").encode('ascii')
+        f.write(line)
+        written += len(line)
+    return count
+
+
+def _chunks(path, size=1 << 20):
+    with open(path, 'rb') as f:
+        for chunk in iter(functools.partial(f.read, size), b''):
+            yield chunk.decode('latin-1')
+
+
+def _bench(name, func, size):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print("{name:<40} {rate:8.1f} MB/s".format(
+        name=name, rate=size / elapsed / 1e6,
+    ))
+    return result
+
+
+def main():
+    size = int(sys.argv[1]) * 1000000 if len(sys.argv) > 1 else 64000000
+
+    with tempfile.NamedTemporaryFile(delete=False) as f:
+        count = _write_log(f, size)
+    try:
+        _bench("read and decode", lambda: sum(
+            map(len, _chunks(f.name))
+        ), size)
+        found = _bench("mnfind", lambda: sum(
+            1 for _ in mnemonicode.mnfind(_chunks(f.name))
+        ), size)
+        assert found == count, (found, count)
+    finally:
+        os.unlink(f.name)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Measure the memory that each forked worker has to allocate for itself to
+encode and decode, on top of what it shares with the parent process.
+
+Run from the root of the repository with::
+
+    $ python benchmarks/fork_memory.py [WORKERS]
+
+Memory is read from ``/proc/self/smaps_rollup``, so this only works on Linux.
+``Private_Dirty`` counts pages that belong to the worker alone, either
+because it allocated them or because it wrote to a page it inherited and the
+kernel had to copy it.
+"""
+import os
+import sys
+
+import mnemonicode
+
+
+def _private_dirty():
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            if line.startswith('Private_Dirty:'):
+                return int(line.split()[1])
+    raise RuntimeError("Private_Dirty missing from smaps_rollup")
+
+
+def _work():
+    data = os.urandom(4096)
+    for _ in range(10):
+        assert mnemonicode.mnparse(mnemonicode.mnformat(data)) == data
+
+
+def _worker(write_fd):
+    before = _private_dirty()
+    _work()
+    after = _private_dirty()
+    os.write(write_fd, "{before} {after}\n".format(
+        before=before, after=after,
+    ).encode('ascii'))
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+
+    read_fd, write_fd = os.pipe()
+    pids = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            try:
+                _worker(write_fd)
+            finally:
+                os._exit(0)
+        pids.append(pid)
+    os.close(write_fd)
+
+    for pid in pids:
+        os.waitpid(pid, 0)
+    with os.fdopen(read_fd) as f:
+        samples = [tuple(map(int, line.split())) for line in f]
+
+    growth = sorted(after - before for before, after in samples)
+    print((
+        "{workers} workers: private memory after fork {before} kB, "
+        "grew by median {median} kB (min {min}, max {max}) while working"
+    ).format(
+        workers=workers, before=samples[0][0], median=growth[len(growth) // 2],
+        min=growth[0], max=growth[-1],
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""Compare `mnformat_many` against calling `mnformat` in a loop.
+
+Run from the root of the repository with::
+
+    $ python benchmarks/format_many.py
+"""
+import os
+import timeit
+
+import mnemonicode
+
+
+def _bench(name, func, number=5):
+    best = min(timeit.repeat(func, number=1, repeat=number))
+    print("{name:<40} {seconds:8.3f} s".format(name=name, seconds=best))
+    return best
+
+
+def main():
+    count = 200000
+    for size in (4, 8, 16):
+        records = [os.urandom(size) for _ in range(count)]
+        assert (
+            list(mnemonicode.mnformat_many(records)) ==
+            [mnemonicode.mnformat(record) for record in records]
+        )
+
+        print("{count} records of {size} bytes".format(
+            count=count, size=size,
+        ))
+        old = _bench(
+            "  loop over mnformat",
+            lambda: [mnemonicode.mnformat(record) for record in records],
+        )
+        new = _bench(
+            "  mnformat_many",
+            lambda: list(mnemonicode.mnformat_many(records)),
+        )
+        print("  speedup: {ratio:.2f}x".format(ratio=old / new))
+
+
+if __name__ == '__main__':
+    main()
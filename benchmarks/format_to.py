@@ -0,0 +1,58 @@
+"""Compare writing encoded data with `mnformat_to` against formatting a string
+with `mnformat` and encoding it.
+
+Run from the root of the repository with::
+
+    $ python benchmarks/format_to.py
+"""
+import os
+import timeit
+import tracemalloc
+
+import mnemonicode
+
+
+def _bench(name, func, number=5):
+    best = min(timeit.repeat(func, number=1, repeat=number))
+    print("{name:<40} {seconds:8.4f} s".format(name=name, seconds=best))
+    return best
+
+
+def _peak(name, func):
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("{name:<40} {peak:8d} bytes peak".format(name=name, peak=peak))
+
+
+def main():
+    for size, count in [(64, 5000), (1024, 500), (1 << 22, 1)]:
+        records = [os.urandom(size) for _ in range(count)]
+        for record in records:
+            sink = bytearray()
+            mnemonicode.mnformat_to(record, sink)
+            assert sink == mnemonicode.mnformat(record).encode('ascii')
+
+        def format_encode():
+            with open(os.devnull, 'wb') as sink:
+                for record in records:
+                    sink.write(mnemonicode.mnformat(record).encode('ascii'))
+
+        def format_to():
+            with open(os.devnull, 'wb') as sink:
+                for record in records:
+                    mnemonicode.mnformat_to(record, sink)
+
+        print("{count} records of {size} bytes".format(
+            count=count, size=size,
+        ))
+        old = _bench("  mnformat and encode", format_encode)
+        new = _bench("  mnformat_to", format_to)
+        print("  speedup: {ratio:.2f}x".format(ratio=old / new))
+        _peak("  mnformat and encode", format_encode)
+        _peak("  mnformat_to", format_to)
+
+
+if __name__ == '__main__':
+    main()
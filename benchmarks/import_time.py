@@ -0,0 +1,55 @@
+"""Measure the time taken to import `mnemonicode` in a fresh interpreter,
+using the output of ``python -X importtime``.
+
+Run from the root of the repository with::
+
+    $ python benchmarks/import_time.py
+
+The ``site`` module is disabled so that modules it happens to pull in don't
+hide the cost of importing them from `mnemonicode`.
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _import_times(module):
+    env = dict(os.environ, PYTHONPATH=_ROOT)
+    output = subprocess.run(
+        [sys.executable, '-S', '-X', 'importtime', '-c', 'import ' + module],
+        env=env, stderr=subprocess.PIPE, check=True,
+    ).stderr.decode('utf-8')
+
+    times = {}
+    for line in output.splitlines()[1:]:
+        prefix, cumulative, name = line.split('|')
+        self_time = prefix.split(':')[1]
+        times[name.strip()] = (int(self_time), int(cumulative))
+    return times
+
+
+def main():
+    runs = 20
+    for module in ('mnemonicode', 'mnemonicode._cli'):
+        samples = [_import_times(module) for _ in range(runs)]
+        cumulative = [sample[module][1] for sample in samples]
+        print("import {module}: median {median:.0f} us, {runs} runs".format(
+            module=module, median=statistics.median(cumulative), runs=runs,
+        ))
+
+        last = samples[-1]
+        heaviest = sorted(
+            last.items(), key=lambda item: item[1][0], reverse=True,
+        )[:8]
+        for name, (self_time, _) in heaviest:
+            print("  {self_time:8d} us  {name}".format(
+                self_time=self_time, name=name,
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""Compare `mnformat_int`/`mnparse_int` against a round trip through bytes.
+
+Run from the root of the repository with::
+
+    $ python benchmarks/int_codec.py
+"""
+import random
+import timeit
+
+import mnemonicode
+
+
+def _bench(name, func, number=5):
+    best = min(timeit.repeat(func, number=1, repeat=number))
+    print("{name:<40} {seconds:8.3f} s".format(name=name, seconds=best))
+    return best
+
+
+def main():
+    count = 200000
+    rng = random.Random(0)
+    for width in (4, 8):
+        numbers = [rng.getrandbits(8 * width) for _ in range(count)]
+        strings = [mnemonicode.mnformat_int(n, width=width) for n in numbers]
+        assert strings == [
+            mnemonicode.mnformat(n.to_bytes(width, 'little')) for n in numbers
+        ]
+        assert [mnemonicode.mnparse_int(s) for s in strings] == numbers
+
+        print("{count} integers of {width} bytes".format(
+            count=count, width=width,
+        ))
+        old = _bench("  mnformat(n.to_bytes(...))", lambda: [
+            mnemonicode.mnformat(n.to_bytes(width, 'little'))
+            for n in numbers
+        ])
+        new = _bench("  mnformat_int", lambda: [
+            mnemonicode.mnformat_int(n, width=width) for n in numbers
+        ])
+        print("  speedup: {ratio:.2f}x".format(ratio=old / new))
+
+        old = _bench("  int.from_bytes(mnparse(...))", lambda: [
+            int.from_bytes(mnemonicode.mnparse(s), 'little') for s in strings
+        ])
+        new = _bench("  mnparse_int", lambda: [
+            mnemonicode.mnparse_int(s) for s in strings
+        ])
+        print("  speedup: {ratio:.2f}x".format(ratio=old / new))
+
+
+if __name__ == '__main__':
+    main()
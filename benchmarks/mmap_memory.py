@@ -0,0 +1,56 @@
+"""Measure peak memory used while encoding a memory mapped file, compared with
+reading the whole file into memory first.
+
+Run from the root of the repository with::
+
+    $ python benchmarks/mmap_memory.py [SIZE_IN_MIB]
+"""
+import mmap
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import mnemonicode
+
+
+def _measure(name, func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print((
+        "{name:<30} {elapsed:8.2f} s, peak {peak:8.1f} MiB, "
+        "output {output:8.1f} MiB"
+    ).format(
+        name=name, elapsed=elapsed, peak=peak / 2 ** 20,
+        output=len(result) / 2 ** 20,
+    ))
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+
+    with tempfile.TemporaryFile() as f:
+        for _ in range(size):
+            f.write(os.urandom(2 ** 20))
+        f.flush()
+
+        def read():
+            f.seek(0)
+            return mnemonicode.mnformat(f.read())
+
+        def mapped():
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                return mnemonicode.mnformat(m)
+
+        print("{size} MiB input".format(size=size))
+        _measure("  mnformat(f.read())", read)
+        _measure("  mnformat(mmap)", mapped)
+
+
+if __name__ == '__main__':
+    main()
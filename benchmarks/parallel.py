@@ -0,0 +1,60 @@
+"""Measure the throughput of `parallel_mnformat` and `parallel_mnparse` with
+1, 2, 4 and one per processor worker processes.
+
+Run from the root of the repository with::
+
+    $ python benchmarks/parallel.py [size in MiB]
+
+The default size is 64 MiB.  Scaling is only meaningful on a machine with
+several processors, and with inputs much larger than the chunk size.
+Throughput is given in MiB of binary data per second in both directions.
+"""
+import os
+import sys
+import timeit
+
+import mnemonicode
+from mnemonicode.parallel import parallel_mnformat, parallel_mnparse
+
+
+def _bench(name, func, size, number=3):
+    best = min(timeit.repeat(func, number=1, repeat=number))
+    print("{name:<40} {seconds:8.4f} s {rate:8.1f} MiB/s".format(
+        name=name, seconds=best, rate=size / best,
+    ))
+    return best
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    data = os.urandom(size << 20)
+    string = mnemonicode.mnformat(data)
+
+    jobs = sorted({1, 2, 4, os.cpu_count() or 1})
+
+    print("{size} MiB, {cpus} processors".format(
+        size=size, cpus=os.cpu_count(),
+    ))
+    print("encode")
+    serial = _bench("  mnformat", lambda: mnemonicode.mnformat(data), size)
+    for count in jobs:
+        assert parallel_mnformat(data, jobs=count) == string
+        elapsed = _bench(
+            "  parallel_mnformat, {count} jobs".format(count=count),
+            lambda: parallel_mnformat(data, jobs=count), size,
+        )
+        print("  speedup: {ratio:.2f}x".format(ratio=serial / elapsed))
+
+    print("decode")
+    serial = _bench("  mnparse", lambda: mnemonicode.mnparse(string), size)
+    for count in jobs:
+        assert parallel_mnparse(string, jobs=count) == data
+        elapsed = _bench(
+            "  parallel_mnparse, {count} jobs".format(count=count),
+            lambda: parallel_mnparse(string, jobs=count), size,
+        )
+        print("  speedup: {ratio:.2f}x".format(ratio=serial / elapsed))
+
+
+if __name__ == '__main__':
+    main()
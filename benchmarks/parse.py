@@ -0,0 +1,59 @@
+"""Compare the single pass `mnparse` against the split based implementation
+it replaced.
+
+Run from the root of the repository with::
+
+    $ python benchmarks/parse.py
+"""
+import os
+import timeit
+
+import mnemonicode
+
+
+def _split_parse(string, word_separator="-", group_separator="--"):
+    if len(string) == 0:
+        return b''
+
+    return mnemonicode.mndecode(
+        tuple(group.split(word_separator))
+        for group in string.split(group_separator)
+    )
+
+
+def _bench(name, func, number=5):
+    best = min(timeit.repeat(func, number=1, repeat=number))
+    print("{name:<40} {seconds:8.4f} s".format(name=name, seconds=best))
+    return best
+
+
+def main():
+    for size, count in [(16, 20000), (64, 5000), (1024, 500), (1 << 20, 1)]:
+        strings = [
+            mnemonicode.mnformat(os.urandom(size)) for _ in range(count)
+        ]
+        for string in strings:
+            assert mnemonicode.mnparse(string) == _split_parse(string)
+
+        print("{count} strings of {size} bytes".format(
+            count=count, size=size,
+        ))
+        old = _bench("  split", lambda: list(map(_split_parse, strings)))
+        new = _bench(
+            "  single pass", lambda: list(map(mnemonicode.mnparse, strings)),
+        )
+        print("  speedup: {ratio:.2f}x".format(ratio=old / new))
+
+    string = mnemonicode.mnformat(os.urandom(1 << 20)).upper()
+    wrapped = '\n'.join(
+        string[offset:offset + 76] for offset in range(0, len(string), 76)
+    )
+    print("1048576 bytes, upper case and wrapped at 76 characters")
+    _bench(
+        "  normalize=True",
+        lambda: mnemonicode.mnparse(wrapped, normalize=True),
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Compare decoding into a reused buffer against allocating a new result.
+
+Run from the root of the repository with::
+
+    $ python benchmarks/parse_into.py
+"""
+import os
+import timeit
+import tracemalloc
+
+import mnemonicode
+
+
+def _bench(name, func, number=5):
+    best = min(timeit.repeat(func, number=1, repeat=number))
+    print("{name:<40} {seconds:8.4f} s".format(name=name, seconds=best))
+    return best
+
+
+def _peak(name, func):
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("{name:<40} {peak:8d} bytes peak".format(name=name, peak=peak))
+
+
+def main():
+    for size, count in [(64, 5000), (1024, 500), (1 << 20, 1)]:
+        strings = [
+            mnemonicode.mnformat(os.urandom(size)) for _ in range(count)
+        ]
+        buffer = bytearray(size)
+        for string in strings:
+            assert mnemonicode.mnparse_into(string, buffer) == size
+            assert buffer == mnemonicode.mnparse(string)
+
+        def parse():
+            for string in strings:
+                mnemonicode.mnparse(string)
+
+        def parse_into():
+            for string in strings:
+                mnemonicode.mnparse_into(string, buffer)
+
+        print("{count} strings of {size} bytes".format(
+            count=count, size=size,
+        ))
+        old = _bench("  mnparse", parse)
+        new = _bench("  mnparse_into", parse_into)
+        print("  speedup: {ratio:.2f}x".format(ratio=old / new))
+        _peak("  mnparse", parse)
+        _peak("  mnparse_into", parse_into)
+
+
+if __name__ == '__main__':
+    main()
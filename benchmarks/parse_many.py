@@ -0,0 +1,63 @@
+"""Compare `mnparse_many` against calling `mnparse` in a try/except loop on a
+batch where 5% of the records are invalid.
+
+Run from the root of the repository with::
+
+    $ python benchmarks/parse_many.py
+"""
+import os
+import random
+import timeit
+
+import mnemonicode
+
+
+def _bench(name, func, number=5):
+    best = min(timeit.repeat(func, number=1, repeat=number))
+    print("{name:<40} {seconds:8.3f} s".format(name=name, seconds=best))
+    return best
+
+
+def _loop(strings):
+    results = []
+    for string in strings:
+        try:
+            results.append(mnemonicode.mnparse(string))
+        except ValueError:
+            results.append(None)
+    return results
+
+
+def main():
+    count = 200000
+    rng = random.Random(0)
+    strings = [
+        mnemonicode.mnformat(os.urandom(8)) for _ in range(count)
+    ]
+    for index in rng.sample(range(count), count // 20):
+        strings[index] = strings[index].replace('-', '-kazoo-', 1)
+
+    assert _loop(strings) == mnemonicode.mnparse_many(
+        strings, errors='collect',
+    )[0]
+
+    print("{count} records, 5% invalid".format(count=count))
+    old = _bench("  try/except loop over mnparse", lambda: _loop(strings))
+    new = _bench(
+        "  mnparse_many(errors='collect')",
+        lambda: mnemonicode.mnparse_many(strings, errors='collect'),
+    )
+    print("  speedup: {ratio:.2f}x".format(ratio=old / new))
+
+    valid = [string for string in strings if 'kazoo' not in string]
+    clean = _bench(
+        "  mnparse_many, no invalid records",
+        lambda: mnemonicode.mnparse_many(valid),
+    )
+    print("  per record cost relative to clean batch: {ratio:.2f}x".format(
+        ratio=(new / len(strings)) / (clean / len(valid)),
+    ))
+
+
+if __name__ == '__main__':
+    main()
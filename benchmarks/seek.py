@@ -0,0 +1,59 @@
+"""Compare reading byte ranges from a large encoded file using
+`SeekableDecodingReader` against decoding the whole file.
+
+Run from the root of the repository with::
+
+    $ python benchmarks/seek.py [megabytes]
+"""
+import os
+import random
+import sys
+import tempfile
+import timeit
+
+import mnemonicode
+
+
+def _bench(name, func, number=3):
+    best = min(timeit.repeat(func, number=1, repeat=number))
+    print("{name:<40} {seconds:8.4f} s".format(name=name, seconds=best))
+    return best
+
+
+def main():
+    size = int(sys.argv[1]) << 20 if len(sys.argv) > 1 else 16 << 20
+    data = os.urandom(size)
+    ranges = [
+        (random.randrange(size), random.randrange(1, 4096))
+        for _ in range(100)
+    ]
+
+    with tempfile.TemporaryFile() as f:
+        mnemonicode.mnformat_to(data, f)
+        f.flush()
+        print("{ranges} ranges from {size} bytes".format(
+            ranges=len(ranges), size=size,
+        ))
+
+        def decode_all():
+            f.seek(0)
+            decoded = mnemonicode.mnparse(f.read().decode('ascii'))
+            for start, length in ranges:
+                assert decoded[start:start + length] == \
+                    data[start:start + length]
+
+        reader = mnemonicode.SeekableDecodingReader(f)
+        _bench("  build index", lambda: reader._build_index())
+
+        def read_ranges():
+            for start, length in ranges:
+                reader.seek(start)
+                assert reader.read(length) == data[start:start + length]
+
+        old = _bench("  decode everything", decode_all)
+        new = _bench("  SeekableDecodingReader", read_ranges)
+        print("  speedup: {ratio:.2f}x".format(ratio=old / new))
+
+
+if __name__ == '__main__':
+    main()
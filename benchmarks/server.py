@@ -0,0 +1,94 @@
+"""Compare starting `mnencode` for each record against sending requests to a
+running server.
+
+Run from the root of the repository with::
+
+    $ python benchmarks/server.py
+"""
+import asyncio
+import os
+import subprocess
+import threading
+import timeit
+
+import mnemonicode
+from mnemonicode.server import Client, Server
+
+
+def _bench(name, func, count, number=3):
+    best = min(timeit.repeat(func, number=1, repeat=number))
+    per_call = best / count * 1e6
+    print("{name:<40} {per_call:10.1f} us/record".format(
+        name=name, per_call=per_call,
+    ))
+    return per_call
+
+
+def main():
+    records = [os.urandom(16) for _ in range(1000)]
+
+    loop = asyncio.new_event_loop()
+    server = Server()
+    loop.run_until_complete(server.start_tcp())
+    port = server.sockets[0].getsockname()[1]
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+
+    try:
+        def spawn():
+            for record in records[:20]:
+                subprocess.run(
+                    ['mnencode'], input=record, stdout=subprocess.PIPE,
+                    check=True,
+                )
+
+        client = Client(port=port)
+        for record in records:
+            assert client.encode(record) == mnemonicode.mnformat(record)
+
+        def request():
+            for record in records:
+                client.encode(record)
+
+        def concurrent():
+            # Several connections in flight at once, so that the server can
+            # batch their requests together.
+            def run(chunk):
+                with Client(port=port) as client:
+                    for record in chunk:
+                        client.encode(record)
+
+            threads = [
+                threading.Thread(target=run, args=(records[i::8],))
+                for i in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        print("16 byte records")
+        old = _bench("  mnencode process per record", spawn, 20)
+        new = _bench("  one client", request, len(records))
+        print("  speedup: {ratio:.2f}x".format(ratio=old / new))
+        new = _bench("  eight concurrent clients", concurrent, len(records))
+        print("  speedup: {ratio:.2f}x".format(ratio=old / new))
+        client.close()
+
+        statistics = server.statistics()
+        print("{requests} requests in {batches} batches".format(
+            requests=statistics.requests, batches=statistics.batches,
+        ))
+    finally:
+        async def close():
+            server.close()
+            await server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+if __name__ == '__main__':
+    main()
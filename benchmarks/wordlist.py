@@ -0,0 +1,71 @@
+"""Measure the memory taken by each of the wordlist tables, and how much of
+it a fresh process has allocated after importing, encoding and decoding.
+
+Run from the root of the repository with::
+
+    $ python benchmarks/wordlist.py
+
+The list of words, plus the reverse dict that older versions also built at
+import, is the baseline that the other tables are compared against.
+"""
+import subprocess
+import sys
+import tracemalloc
+
+from mnemonicode import _make_parse_tables
+from mnemonicode._wordlist import _WORDLIST
+
+# Statements run, one after the other, in a fresh interpreter.
+_STAGES = (
+    ("import mnemonicode", "import mnemonicode"),
+    ("mnformat", "mnemonicode.mnformat(bytes(64))"),
+    ("mnformat_to", "mnemonicode.mnformat_to(bytes(64), bytearray())"),
+    ("mnparse", "mnemonicode.mnparse(mnemonicode.mnformat(bytes(64)))"),
+)
+
+
+def _copy_words():
+    # Fresh string objects, so that they are counted by `tracemalloc`.
+    return [(word + '.')[:-1] for word in _WORDLIST]
+
+
+def _measure(name, build, *args):
+    # Only memory allocated by `build` itself, and still alive when it
+    # returns, is counted.
+    tracemalloc.start()
+    tables = build(*args)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("  {name:<36} {size:8d} bytes".format(name=name, size=size))
+    return tables
+
+
+def _stages():
+    code = ["import tracemalloc", "tracemalloc.start()"]
+    for name, statement in _STAGES:
+        code += [
+            statement,
+            "print(tracemalloc.get_traced_memory()[0])",
+        ]
+    output = subprocess.check_output(
+        [sys.executable, '-c', '\n'.join(code)],
+    )
+    return zip((name for name, _ in _STAGES), map(int, output.split()))
+
+
+def main():
+    print("tables")
+    words = _measure("list of words", _copy_words)
+    indices = _measure("reverse dict", lambda: {
+        word: index for index, word in enumerate(words)
+    })
+    _measure("encoded words", lambda: [word.encode('ascii') for word in words])
+    _measure("parse tables", _make_parse_tables, indices)
+
+    print("allocated by a fresh process, after")
+    for name, size in _stages():
+        print("  {name:<36} {size:8d} bytes".format(name=name, size=size))
+
+
+if __name__ == '__main__':
+    main()
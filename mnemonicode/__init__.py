@@ -1,40 +1,112 @@
-import argparse
-import sys
+import array
+import codecs
+import collections
+import functools
+import io
+import operator
+import struct
 
-from mnemonicode._utils import chunk_sequence, from_base, to_base
-from mnemonicode._wordlist import index_to_word, word_to_index
+from mnemonicode._wordlist import (
+    _MAX_WORD_LENGTH, _WORD_CHARACTERS, _WORD_COUNT, _WORD_LENGTHS,
+    _WORDLIST, _complete, _correct, _make_correction_index, _make_prefix_trie,
+    _word_bytes, _word_indices, index_to_word,
+)
 
 
 def _block_to_indices(block):
-    if len(block) > 4:
+    length = len(block)
+    if length > 4:
         raise ValueError("block too big")
 
+    if length == 0:
+        raise ValueError("empty block")
+
     # `menmonicode` uses little-endian numbers.
-    num = from_base(256, reversed(block))
+    num = int.from_bytes(block, 'little')
+
+    if length == 1:
+        return (num,)
 
-    indices = list(reversed(to_base(1626, num)))
+    if length == 2:
+        second, first = divmod(num, 1626)
+        return (first, second)
 
-    # Pad the list of indices to the correct size.
-    length = {
-        1: 1,
-        2: 2,
-        3: 3,
-        4: 3,
-    }[len(block)]
-    indices += [0] * (length - len(indices))
+    num, first = divmod(num, 1626)
+    third, second = divmod(num, 1626)
 
     # The third byte in a block slightly leaks into the third word.  A
     # different set of words is used for this case to distinguish it from the
     # four byte case.
-    if len(block) == 3:
-        indices[-1] += 1626
+    if length == 3:
+        third += 1626
 
-    return indices
+    return (first, second, third)
 
 
 def _block_to_words(block):
-    for i in _block_to_indices(block):
-        yield index_to_word(i)
+    return tuple(map(_WORDLIST.__getitem__, _block_to_indices(block)))
+
+
+def _byte_view(data):
+    # Returns a flat view of the bytes in any object that supports the buffer
+    # protocol, without copying them.
+    try:
+        view = memoryview(data)
+    except TypeError:
+        raise TypeError((
+            "expected bytes-like object, got {cls}"
+        ).format(cls=type(data).__name__)) from None
+
+    if not view.c_contiguous:
+        raise TypeError("expected contiguous buffer")
+
+    if view.format != 'B' or view.ndim != 1:
+        view = view.cast('B')
+
+    return view
+
+
+def _writable_byte_view(buffer):
+    view = _byte_view(buffer)
+    if view.readonly:
+        raise TypeError((
+            "expected writable buffer, got {cls}"
+        ).format(cls=type(buffer).__name__))
+    return view
+
+
+def _iter_indices(data):
+    # Yields the word indices for each block in a bytes-like object.  Whole
+    # blocks are unpacked directly from the underlying buffer rather than
+    # being sliced out and copied first.
+    end = len(data) - len(data) % 4
+    for num, in struct.iter_unpack('<I', data[:end]):
+        num, first = divmod(num, 1626)
+        third, second = divmod(num, 1626)
+        yield (first, second, third)
+
+    if end < len(data):
+        yield _block_to_indices(data[end:])
+
+
+def _number_to_words(num):
+    # Encodes a whole block, given as the little-endian number it represents.
+    # This is the function that is memoised when caching is enabled.
+    words = _WORDLIST
+    num, first = divmod(num, 1626)
+    third, second = divmod(num, 1626)
+    return (words[first], words[second], words[third])
+
+
+def _iter_cached_words(data, encode):
+    # Equivalent to `_iter_indices`, but yielding words for each block and
+    # looking whole blocks up using the cached encoder.
+    end = len(data) - len(data) % 4
+    for num, in struct.iter_unpack('<I', data[:end]):
+        yield encode(num)
+
+    if end < len(data):
+        yield _block_to_words(data[end:])
 
 
 def mnencode(data):
@@ -44,17 +116,17 @@ def mnencode(data):
     [('bicycle', 'visible', 'robert'), ('cloud', 'unicorn', 'jet')]
 
     :param bytes data:
-        The binary data to encode.
+        The binary data to encode.  Any object supporting the buffer protocol
+        is accepted.
     :returns:
         A list of tuples of between one and three words from the wordlist.
     """
-    if not isinstance(data, (bytes, bytearray)):
-        raise TypeError((
-            "expected bytes or bytearray, got {cls}"
-        ).format(cls=type(data).__name__))
+    yield from _DEFAULT_CODEC._encode(_byte_view(data), _encode_cache)
 
-    for block in chunk_sequence(data, 4):
-        yield tuple(_block_to_words(block))
+
+# Number of bytes of input formatted at a time by `mnformat` and
+# `mnformat_to`.  Must be a multiple of four.
+_FORMAT_CHUNK_SIZE = 65536
 
 
 def mnformat(data, word_separator="-", group_separator="--"):
@@ -65,7 +137,8 @@ def mnformat(data, word_separator="-", group_separator="--"):
     'paris-pearl-ultra--gentle-press-total'
 
     :param bytes data:
-        The binary data to encode.
+        The binary data to encode.  Any object supporting the buffer protocol
+        is accepted.
     :param str word_separator:
         String that should be used to separate words within a group.
     :param str word_separator:
@@ -73,56 +146,196 @@ def mnformat(data, word_separator="-", group_separator="--"):
     :return str:
         The data as an sequence of grouped words.
     """
-    return group_separator.join(
-        word_separator.join(group) for group in mnencode(data)
+    return _DEFAULT_CODEC._format(
+        _byte_view(data), word_separator, group_separator, _encode_cache,
     )
 
 
-def _words_to_block(words):
-    if not isinstance(words, tuple):
-        raise TypeError("expected tuple of words")
+def mnformat_to(data, sink, word_separator="-", group_separator="--"):
+    """Encode a byte array as grouped words, writing the ASCII encoded result
+    straight to a binary file or :class:`bytearray`.
 
-    if len(words) == 0:
-        raise ValueError("no words in block")
+    >>> sink = bytearray()
+    >>> mnformat_to(b"cucumber", sink)
+    37
+    >>> sink
+    bytearray(b'paris-pearl-ultra--gentle-press-total')
 
-    if len(words) > 3:
-        raise ValueError("too many words in block")
+    The output is identical to ``mnformat(data).encode('ascii')``, but is
+    written in large chunks built directly from pre-encoded words, without
+    creating the string first.
+
+    :param bytes data:
+        The binary data to encode.  Any object supporting the buffer protocol
+        is accepted.
+    :param sink:
+        Either a :class:`bytearray`, which the output is appended to, or a
+        binary file-like object with a ``write`` method that writes everything
+        it is passed, such as a buffered file or ``socket.makefile('wb')``.
+    :param str word_separator:
+        String that should be used to separate words within a group.
+    :param str group_separator:
+        String that should be used to separate groups of words.
+    :return int:
+        The number of bytes written.  Separators are UTF-8 encoded.
+    """
+    return _DEFAULT_CODEC._format_to(
+        _byte_view(data), _sink_writer(sink),
+        word_separator.encode('utf-8'), group_separator.encode('utf-8'),
+    )
 
-    try:
-        indices = list(word_to_index(word) for word in words)
-    except KeyError as e:
-        raise ValueError("word not recognized") from e
+
+def _sink_writer(sink):
+    if isinstance(sink, bytearray):
+        return sink.extend
+    if hasattr(sink, 'write'):
+        return sink.write
+    raise TypeError((
+        "expected bytearray or binary file, got {cls}"
+    ).format(cls=type(sink).__name__))
+
+
+def mnencode_many(records):
+    """Encode each bytes object in an iterable as a list of tuples of words.
+
+    >>> list(mnencode_many([b"fig", b"lime"]))
+    [[('alice', 'isotope', 'jet')], [('battery', 'scorpio', 'samba')]]
+
+    :param records:
+        An iterable of independent :class:`bytes` objects, or other objects
+        supporting the buffer protocol, to encode.
+    :returns:
+        An iterator yielding, for each record, a list of tuples of words.
+    """
+    lookup = _WORDLIST.__getitem__
+    for data in records:
+        if not isinstance(data, (bytes, bytearray)):
+            data = _byte_view(data)
+
+        yield [tuple(map(lookup, indices)) for indices in _iter_indices(data)]
+
+
+def mnformat_many(records, word_separator="-", group_separator="--"):
+    """Encode each bytes object in an iterable as a formatted string.
+
+    Equivalent to calling :func:`mnformat` on each record, but cheaper per
+    record as all setup happens once, outside of the loop.
+
+    >>> list(mnformat_many([b"fig", b"lime"]))
+    ['alice-isotope-jet', 'battery-scorpio-samba']
+
+    :param records:
+        An iterable of independent :class:`bytes` objects, or other objects
+        supporting the buffer protocol, to encode.
+    :param str word_separator:
+        String that should be used to separate words within a group.
+    :param str group_separator:
+        String that should be used to separate groups of words.
+    :returns:
+        An iterator yielding one encoded string for each record.
+    """
+    block_to_indices = _block_to_indices
+    iter_indices = _iter_indices
+    lookup = _WORDLIST.__getitem__
+    join_words = word_separator.join
+    join_groups = group_separator.join
+
+    encode = _encode_cache
+    if encode is not None:
+        yield from _format_many_cached(
+            records, encode, join_words, join_groups,
+        )
+        return
+
+    for data in records:
+        if not isinstance(data, (bytes, bytearray)):
+            data = _byte_view(data)
+
+        length = len(data)
+        if length <= 4:
+            # Short records, which includes most integer IDs, only ever
+            # produce a single group.
+            if length:
+                yield join_words(map(lookup, block_to_indices(data)))
+            else:
+                yield ''
+        else:
+            yield join_groups([
+                join_words(map(lookup, indices))
+                for indices in iter_indices(data)
+            ])
+
+
+def _format_many_cached(records, encode, join_words, join_groups):
+    for data in records:
+        if not isinstance(data, (bytes, bytearray)):
+            data = _byte_view(data)
+
+        if len(data) == 4:
+            yield join_words(encode(int.from_bytes(data, 'little')))
+        else:
+            yield join_groups([
+                join_words(words)
+                for words in _iter_cached_words(data, encode)
+            ])
+
+
+def _indices_to_block(indices, index_to_word=index_to_word):
+    # Decodes a sequence of word indices to a block.  Errors are returned as a
+    # string describing the problem rather than raised so that bulk decoders
+    # can handle bad input without the cost of unwinding an exception.
+    # `index_to_word` is only used to describe errors.
+    if len(indices) == 0:
+        return "no words in block"
+
+    if len(indices) > 3:
+        return "too many words in block"
+
+    if None in indices:
+        return "word not recognized"
 
     # Calculate length of block.
     # Both three byte and four byte blocks map to three words but can be
     # distinguished as a different word list is used to encode the last word
     # in the three byte case.
-    length = {
-        1: 1,
-        2: 2,
-        3: 3 if indices[-1] >= 1626 else 4,
-    }[len(words)]
-
+    length = len(indices)
     if length == 3:
-        indices[2] -= 1626
+        if indices[2] >= 1626:
+            indices = (indices[0], indices[1], indices[2] - 1626)
+        else:
+            length = 4
 
     # Check that words in the second word list don't appear anywhere else in
     # the block.
     for index in indices:
-        if index > 1626:
-            raise ValueError((
+        if index >= 1626:
+            return (
                 "unexpected three byte word: {word!r}"
-            ).format(word=index_to_word(index)))
+            ).format(word=index_to_word(index))
+
+    if length == 1:
+        num = indices[0]
+    elif length == 2:
+        num = indices[0] + 1626 * indices[1]
+    else:
+        num = indices[0] + 1626 * (indices[1] + 1626 * indices[2])
 
-    num = from_base(1626, reversed(indices))
+    # Not every combination of words corresponds to a valid block.  Three
+    # words, for example, can encode numbers slightly larger than will fit in
+    # four bytes.
+    if num >> (8 * length):
+        return "block overflow"
 
-    block = bytes(reversed(to_base(256, num)))
+    return num.to_bytes(length, 'little')
 
-    # Pad to correct length.
-    return block.ljust(length, b'\x00')
+
+def _words_to_block(words, abbreviated=False, correct=False):
+    return _DEFAULT_CODEC._words_to_block(
+        words, abbreviated, correct, _decode_cache,
+    )
 
 
-def mndecode(data):
+def mndecode(data, abbreviated=False, correct=False):
     """Decode an iterator of tuples of words to get a byte array
 
     >>> mndecode([('turtle', 'special', 'recycle'), ('ferrari', 'album')])
@@ -130,17 +343,237 @@ def mndecode(data):
 
     :param data:
         An iterator of tuples of between one and three words from the wordlist
+    :param bool abbreviated:
+        If set, words can be abbreviated to any prefix that only matches a
+        single word in the wordlist.
+    :param bool correct:
+        If set, unrecognized words are replaced by the only word in the
+        wordlist that is a single typo away, if there is one.
     :return bytes:
         A :class:`bytes` object containing the decoded data
     """
-    return b''.join(_words_to_block(words) for words in data)
+    return b''.join(_DEFAULT_CODEC._decode_blocks(
+        data, abbreviated, correct, _decode_cache,
+    ))
+
+
+def mndecode_into(data, buffer, abbreviated=False, correct=False):
+    """Decode an iterator of tuples of words directly into a writable buffer.
+
+    >>> groups = [('turtle', 'special', 'recycle'), ('ferrari', 'album')]
+    >>> buffer = bytearray(8)
+    >>> mndecode_into(groups, buffer)
+    6
+    >>> buffer
+    bytearray(b'potato\\x00\\x00')
+
+    :param data:
+        An iterator of tuples of between one and three words from the wordlist
+    :param buffer:
+        A writable object supporting the buffer protocol, such as a
+        :class:`bytearray`, :class:`memoryview` or :class:`mmap.mmap`, that
+        the decoded data is written to, starting at the beginning.
+    :param bool abbreviated:
+        If set, words can be abbreviated to any prefix that only matches a
+        single word in the wordlist.
+    :param bool correct:
+        If set, unrecognized words are replaced by the only word in the
+        wordlist that is a single typo away, if there is one.
+    :return int:
+        The number of bytes written.  If the data doesn't fit, or can't be
+        decoded, :class:`ValueError` is raised and the contents of the buffer
+        are unspecified.
+    """
+    return _write_blocks(_DEFAULT_CODEC._decode_blocks(
+        data, abbreviated, correct, _decode_cache,
+    ), _writable_byte_view(buffer))
+
+
+def _write_blocks(blocks, view):
+    # Copies blocks into a writable byte view, returning the number of bytes
+    # written.
+    size = len(view)
+    offset = 0
+    for block in blocks:
+        end = offset + len(block)
+        if end > size:
+            raise ValueError("buffer too small")
+        view[offset:end] = block
+        offset = end
+    return offset
+
+
+# Number of groups decoded at a time by `_parse_groups`.
+_PARSE_CHUNK_GROUPS = 4096
+
+# Strings shorter than this only contain a handful of groups, and are quicker
+# to decode by splitting than by setting up `_parse_groups`.
+_PARSE_MIN_LENGTH = 128
+
+
+def _make_parse_tables(indices):
+    indices = [
+        (word, index) for word, index in indices.items() if index < 1626
+    ]
+    return tuple(
+        {word: index * scale for word, index in indices}
+        for scale in (1, 1626, 1626 * 1626)
+    )
+
+
+# Mappings from words to their value in the first, second and third position
+# of a four byte block, used by `_parse_groups`.  Like the reverse index they
+# are built from, they are only built on first use, by `_parse_tables`.
+_PARSE_TABLES = None
+
+
+def _parse_tables():
+    global _PARSE_TABLES
+    if _PARSE_TABLES is None:
+        _PARSE_TABLES = _make_parse_tables(_word_indices())
+    return _PARSE_TABLES
+
+
+@functools.lru_cache(maxsize=16)
+def _group_pattern(word_separator, group_separator, characters):
+    # Returns a pattern matching a run of whole groups of words made up of
+    # `characters`, each followed by a group separator, or `None` if the
+    # separators are such that scanning for groups might not split the input
+    # in the same way as `str.split` does.  This is the case if a separator
+    # could be mistaken for part of a word, or if a word separator could
+    # contain a group separator.
+    if not word_separator or not group_separator:
+        return None
+    if set(word_separator + group_separator) & set(characters):
+        return None
+    if group_separator in word_separator:
+        return None
+
+    # `re` is imported here, rather than at the top of the module, as it
+    # noticeably slows down importing the library.
+    import re
+
+    word = '[{characters}]+'.format(characters=''.join(
+        map(re.escape, characters),
+    ))
+    group = '{word}{ws}{word}{ws}{word}{gs}'.format(
+        word=word,
+        ws=re.escape(word_separator), gs=re.escape(group_separator),
+    )
+    return re.compile('(?:{group}){{1,{count}}}'.format(
+        group=group, count=_PARSE_CHUNK_GROUPS,
+    ))
 
 
-def mnparse(string, word_separator="-", group_separator="--"):
+def _parse_groups(
+    string, pattern, tables, indices, wordlist, word_separator,
+    group_separator, buffer=None,
+):
+    # Decodes mnemonicode text in a single pass, a chunk of whole groups at a
+    # time.  Words in each chunk are looked up directly in tables of their
+    # contribution to the value of the block, and the resulting numbers packed
+    # straight into bytes, without splitting the text into groups first.
+    # `tables` are the tables returned by `_make_parse_tables` for
+    # `wordlist`, and `indices` is its reverse mapping.  If `buffer` is
+    # given, the numbers are packed straight into it instead, and the number
+    # of bytes written is returned.
+    # Returns `None` if the text contains anything this can't handle, in which
+    # case the caller should fall back to the slower, but more thorough, split
+    # based implementation in order to get the correct result or error.
+    first, second, third = tables
+    add = operator.add
+
+    chunks = []
+    offset = 0
+    end = 0
+    match = pattern.match(string)
+    while match is not None:
+        end = match.end()
+        words = match.group().replace(
+            group_separator, word_separator,
+        ).split(word_separator)
+        words.pop()
+
+        count = len(words) // 3
+        values = map(
+            add,
+            map(
+                add,
+                map(first.__getitem__, words[0::3]),
+                map(second.__getitem__, words[1::3]),
+            ),
+            map(third.__getitem__, words[2::3]),
+        )
+        try:
+            if buffer is None:
+                chunks.append(struct.pack(
+                    '<{count}I'.format(count=count), *values
+                ))
+            else:
+                struct.pack_into(
+                    '<{count}I'.format(count=count), buffer, offset, *values
+                )
+        except (KeyError, struct.error):
+            # Unknown words, words from the three byte wordlist, groups that
+            # overflow four bytes, and buffers that are too small.
+            return None
+        offset += 4 * count
+
+        match = pattern.match(string, end)
+
+    # The final group, and anything the pattern didn't match, are decoded as
+    # normal.  A trailing group separator would leave an empty final group,
+    # which is an error that only the split based implementation reports.
+    tail = string[end:]
+    if not tail:
+        return None
+
+    lookup = indices.get
+    blocks = _decode_indices((
+        [lookup(word) for word in group.split(word_separator)]
+        for group in tail.split(group_separator)
+    ), wordlist.__getitem__)
+    if buffer is None:
+        chunks.extend(blocks)
+        return b''.join(chunks)
+
+    return offset + _write_blocks(blocks, buffer[offset:])
+
+
+def _decode_indices(groups, index_to_word=index_to_word):
+    # Decodes an iterable of lists of word indices, raising the first error.
+    for indices in groups:
+        block = _indices_to_block(indices, index_to_word)
+        if isinstance(block, str):
+            raise ValueError(block)
+        yield block
+
+
+def _normalize(string, word_separator, group_separator):
+    string = string.lower()
+    word_separator = word_separator.lower()
+    group_separator = group_separator.lower()
+
+    if any(c.isspace() for c in word_separator + group_separator):
+        string = string.strip()
+    else:
+        string = ''.join(string.split())
+
+    return string, word_separator, group_separator
+
+
+def mnparse(
+    string, word_separator="-", group_separator="--", abbreviated=False,
+    correct=False, normalize=False,
+):
     """Decode a mnemonicode string into a byte array.
 
     >>> mnparse('scoop-limit-recycle--ferrari-album')
     b'tomato'
+    >>> mnparse('scoo-limi-recy--ferr-albu', abbreviated=True)
+    b'tomato'
+    >>> mnparse(' Scoop-Limit-Recycle--\\nFerrari-Album\\n', normalize=True)
+    b'tomato'
 
     :param str string:
         The string containing the mnemonicode encoded data.
@@ -148,107 +581,1855 @@ def mnparse(string, word_separator="-", group_separator="--"):
         String used to separate individual words in a group.
     :param str group_separator:
         String used to separate groups of words representing four byte blocks.
+    :param bool abbreviated:
+        If set, words can be abbreviated to any prefix that only matches a
+        single word in the wordlist.  See :func:`complete`.
+    :param bool correct:
+        If set, unrecognized words are replaced by the only word in the
+        wordlist that is a single typo away, if there is one.  See
+        :func:`mncorrect`.
+    :param bool normalize:
+        If set, the string is converted to lower case and whitespace, including
+        line breaks, is removed before decoding.  If either separator contains
+        whitespace then only leading and trailing whitespace is removed.
     :return bytes:
         A :class:`bytes` object containing the decoded data
     """
+    return _DEFAULT_CODEC._parse(
+        string, word_separator, group_separator, abbreviated, correct,
+        normalize, decode=_decode_cache,
+    )
+
+
+def mnparse_into(
+    string, buffer, word_separator="-", group_separator="--",
+    abbreviated=False, correct=False, normalize=False,
+):
+    """Decode a mnemonicode string directly into a writable buffer.
+
+    >>> string = 'scoop-limit-recycle--ferrari-album'
+    >>> buffer = bytearray(decoded_length(string))
+    >>> mnparse_into(string, buffer)
+    6
+    >>> buffer
+    bytearray(b'tomato')
+
+    Whole groups are packed straight into the buffer, without creating an
+    intermediate :class:`bytes` object for each of them, and the same buffer
+    can be reused for any number of calls.
+
+    :param str string:
+        The string containing the mnemonicode encoded data.
+    :param buffer:
+        A writable object supporting the buffer protocol, such as a
+        :class:`bytearray`, :class:`memoryview` or :class:`mmap.mmap`, that
+        the decoded data is written to, starting at the beginning.  See
+        :func:`decoded_length`.
+    :param str word_separator:
+        String used to separate individual words in a group.
+    :param str group_separator:
+        String used to separate groups of words representing four byte blocks.
+    :param bool abbreviated:
+        If set, words can be abbreviated to any prefix that only matches a
+        single word in the wordlist.
+    :param bool correct:
+        If set, unrecognized words are replaced by the only word in the
+        wordlist that is a single typo away, if there is one.
+    :param bool normalize:
+        If set, the string is normalized as by :func:`mnparse`.
+    :return int:
+        The number of bytes written.  If the data doesn't fit, or can't be
+        decoded, :class:`ValueError` is raised and the contents of the buffer
+        are unspecified.
+    """
+    return _DEFAULT_CODEC._parse(
+        string, word_separator, group_separator, abbreviated, correct,
+        normalize, _writable_byte_view(buffer), _decode_cache,
+    )
+
+
+def encoded_length(data, word_separator="-", group_separator="--"):
+    """Calculate the length of the string that :func:`mnformat` would return
+    for a byte array, without formatting it.
+
+    >>> encoded_length(b"cucumber")
+    37
+
+    :param bytes data:
+        The binary data to encode.  Any object supporting the buffer protocol
+        is accepted.
+    :param str word_separator:
+        String that should be used to separate words within a group.
+    :param str group_separator:
+        String that should be used to separate groups of words.
+    :return int:
+        The number of characters in the encoded string.
+    """
+    view = _byte_view(data)
+    length = _WORD_LENGTHS.__getitem__
+
+    groups = 0
+    words = 0
+    total = 0
+    for indices in _iter_indices(view):
+        groups += 1
+        words += len(indices)
+        total += sum(map(length, indices))
+
+    if not groups:
+        return 0
+
+    return (
+        total + (words - groups) * len(word_separator) +
+        (groups - 1) * len(group_separator)
+    )
+
+
+def max_encoded_length(length, word_separator="-", group_separator="--"):
+    """Calculate the length of the longest string that :func:`mnformat` can
+    return for a byte array of a given length.
+
+    >>> max_encoded_length(8)
+    48
+
+    :param int length:
+        The number of bytes to be encoded.
+    :param str word_separator:
+        String that should be used to separate words within a group.
+    :param str group_separator:
+        String that should be used to separate groups of words.
+    :return int:
+        An upper bound on the number of characters in the encoded string.
+    """
+    if length < 0:
+        raise ValueError("length must not be negative")
+
+    if not length:
+        return 0
+
+    groups, remainder = divmod(length, 4)
+    words = 3 * groups + remainder
+    groups += bool(remainder)
+
+    return (
+        words * _MAX_WORD_LENGTH + (words - groups) * len(word_separator) +
+        (groups - 1) * len(group_separator)
+    )
+
+
+def decoded_length(string, word_separator="-", group_separator="--"):
+    """Calculate the length of the data encoded by a mnemonicode string.
+
+    >>> decoded_length('scoop-limit-recycle--ferrari-album')
+    6
+
+    Only the number of groups and the words in the last of them are looked
+    at, so this is much quicker than decoding the string.
+
+    :param str string:
+        The string containing the mnemonicode encoded data.
+    :param str word_separator:
+        String used to separate individual words in a group.
+    :param str group_separator:
+        String used to separate groups of words representing four byte blocks.
+    :return int:
+        The number of bytes the string decodes to.  This is exact for any
+        string produced by :func:`mnformat`, and is never less than the
+        number of bytes :func:`mnparse` would return for any other string
+        that it can decode.
+    """
     if not isinstance(string, str):
         raise TypeError((
             "expected string, got {cls}"
         ).format(cls=type(string).__name__))
 
-    # Empty string is a valid input but ``"".split(...)`` does not return an
-    # empty iterator so we need to special case it.
     if len(string) == 0:
-        return b''
+        return 0
+
+    start = string.rfind(group_separator) + 1
+    if start:
+        start += len(group_separator) - 1
+    words = string[start:].split(word_separator)
+
+    # Only a block of three bytes ends with a word from the second wordlist.
+    length = min(len(words), 3)
+    if length == 3 and _word_indices().get(words[2], 0) < 1626:
+        length = 4
+
+    return 4 * string.count(group_separator) + length
+
+
+class Codec(object):
+    """Encodes and decodes mnemonicode using a particular wordlist and pair of
+    separators.
+
+    >>> codec = Codec(word_separator=" ", group_separator=", ")
+    >>> codec.format(b"tomato")
+    'scoop limit recycle, ferrari album'
+    >>> codec.parse('scoop limit recycle, ferrari album')
+    b'tomato'
+    >>> codec.parse('scoo limti recycle, ferr album', True, True)
+    b'tomato'
 
-    return mndecode(
-        tuple(group.split(word_separator))
-        for group in string.split(group_separator)
+    Every table needed to encode and decode is built when the codec is
+    created, so a codec using a custom wordlist is as fast as the module level
+    functions, which are themselves implemented by a codec using the standard
+    wordlist.  The tables used to expand abbreviations and correct typos are
+    only built the first time they are needed.  Codecs are immutable, and can
+    be shared between threads.  The block cache enabled by
+    :func:`enable_cache` only applies to the module level functions.
+
+    :param wordlist:
+        A sequence of exactly 1633 distinct, non-empty words.  The first 1626
+        words are used in every position, and the last seven only as the last
+        word of a three byte block.  Defaults to the standard wordlist.
+    :param str word_separator:
+        String used to separate words within a group.
+    :param str group_separator:
+        String used to separate groups of words representing four byte blocks.
+    """
+    __slots__ = (
+        '_words', '_word_bytes', '_indices', '_parse_tables', '_characters',
+        '_prefix_trie', '_correction_index', '_word_separator',
+        '_group_separator', '_word_separator_bytes', '_group_separator_bytes',
     )
 
+    def __init__(
+        self, wordlist=None, word_separator="-", group_separator="--",
+    ):
+        for separator in (word_separator, group_separator):
+            if not isinstance(separator, str):
+                raise TypeError((
+                    "expected string, got {cls}"
+                ).format(cls=type(separator).__name__))
+            if not separator:
+                raise ValueError("separators must not be empty")
+
+        if wordlist is None:
+            words = _WORDLIST
+            # Shared with the module level functions, and only built on
+            # first use.  See `_get_indices`.
+            word_bytes = None
+            indices = None
+            parse_tables = None
+            characters = _WORD_CHARACTERS
+        else:
+            words = list(wordlist)
+            if len(words) != _WORD_COUNT:
+                raise ValueError((
+                    "expected {count} words, got {length}"
+                ).format(count=_WORD_COUNT, length=len(words)))
+            for word in words:
+                if not isinstance(word, str):
+                    raise TypeError((
+                        "expected string, got {cls}"
+                    ).format(cls=type(word).__name__))
+                if not word:
+                    raise ValueError("words must not be empty")
+
+            indices = {word: index for index, word in enumerate(words)}
+            if len(indices) != len(words):
+                raise ValueError("words must be unique")
+
+            word_bytes = [word.encode('utf-8') for word in words]
+            parse_tables = _make_parse_tables(indices)
+            characters = ''.join(sorted(set(''.join(words))))
 
-def _mnencode_main():  # pragma: no cover
-    # `mndecode` is tested by executing in a separate process.
-    # This means that tests for it don't get noticed by the coverage tracker.
-    parser = argparse.ArgumentParser()
-    parser.add_argument(
-        '-w', '--word-separator', type=str, default='-',
-        help=(
-            "String used to separate individual words within a group.  "
-            "Defaults to \"-\""
+        # Separators made only of characters that never appear in a word
+        # can't appear in one, which saves checking every word when creating
+        # the default codec.
+        if not set(word_separator + group_separator).isdisjoint(characters):
+            for word in words:
+                if word_separator in word or group_separator in word:
+                    raise ValueError((
+                        "word contains separator: {word!r}"
+                    ).format(word=word))
+
+        values = {
+            '_words': words,
+            '_word_bytes': word_bytes,
+            '_indices': indices,
+            '_parse_tables': parse_tables,
+            '_characters': characters,
+            '_prefix_trie': None,
+            '_correction_index': None,
+            '_word_separator': word_separator,
+            '_group_separator': group_separator,
+            '_word_separator_bytes': word_separator.encode('utf-8'),
+            '_group_separator_bytes': group_separator.encode('utf-8'),
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Codec objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Codec objects are immutable")
+
+    def __repr__(self):
+        return (
+            "Codec(word_separator={word_separator!r}, "
+            "group_separator={group_separator!r})"
+        ).format(
+            word_separator=self._word_separator,
+            group_separator=self._group_separator,
         )
-    )
-    parser.add_argument(
-        '-g', '--group-separator', type=str, default='--',
-        help=(
-            "String used to separate the groups of words representing four "
-            "byte blocks.  Defaults to \"--\""
+
+    @property
+    def wordlist(self):
+        """The words used by this codec, as a tuple."""
+        return tuple(self._words)
+
+    @property
+    def word_separator(self):
+        """String used to separate words within a group."""
+        return self._word_separator
+
+    @property
+    def group_separator(self):
+        """String used to separate groups of words."""
+        return self._group_separator
+
+    def encode(self, data):
+        """Encode a bytes object as an iterator of tuples of words.
+
+        :param bytes data:
+            The binary data to encode.  Any object supporting the buffer
+            protocol is accepted.
+        :returns:
+            An iterator of tuples of between one and three words.
+        """
+        yield from self._encode(_byte_view(data))
+
+    def _encode(self, view, encode=None):
+        # Implementation of `encode` and `mnencode`.  If `encode` is given,
+        # whole blocks are looked up using the cached encoder instead of the
+        # wordlist.
+        if encode is not None:
+            return _iter_cached_words(view, encode)
+
+        lookup = self._words.__getitem__
+        return (tuple(map(lookup, indices)) for indices in _iter_indices(view))
+
+    def format(self, data):
+        """Encode a byte array as a sequence of grouped words, formatted as a
+        single string.
+
+        :param bytes data:
+            The binary data to encode.  Any object supporting the buffer
+            protocol is accepted.
+        :return str:
+            The data as an sequence of grouped words.
+        """
+        return self._format(
+            _byte_view(data), self._word_separator, self._group_separator,
         )
-    )
-    parser.add_argument(
-        '-o', '--output', type=argparse.FileType('w'), default=sys.stdout,
-        help=(
-            "Where to write the encoded output.  This should be the path to a "
-            "file, or \"-\" to indicate stdout.  Defaults to stdout."
+
+    def _format(self, view, word_separator, group_separator, encode=None):
+        # Implementation of `format` and `mnformat`.  If `encode` is given,
+        # whole blocks are looked up using the cached encoder instead of the
+        # wordlist.
+        lookup = self._words.__getitem__
+        join_words = word_separator.join
+        join_groups = group_separator.join
+
+        # Large inputs are formatted in block aligned chunks so that the list
+        # of strings for individual groups never grows beyond the size of a
+        # single chunk.
+        chunks = []
+        for offset in range(0, len(view), _FORMAT_CHUNK_SIZE):
+            chunk = view[offset:offset + _FORMAT_CHUNK_SIZE]
+            if encode is None:
+                groups = [
+                    join_words(map(lookup, indices))
+                    for indices in _iter_indices(chunk)
+                ]
+            else:
+                groups = [
+                    join_words(words)
+                    for words in _iter_cached_words(chunk, encode)
+                ]
+            chunks.append(join_groups(groups))
+
+        return join_groups(chunks)
+
+    def format_to(self, data, sink):
+        """Encode a byte array as grouped words, writing the UTF-8 encoded
+        result straight to a binary file or :class:`bytearray`.
+
+        :param bytes data:
+            The binary data to encode.  Any object supporting the buffer
+            protocol is accepted.
+        :param sink:
+            Either a :class:`bytearray` or a binary file-like object.  See
+            :func:`mnformat_to`.
+        :return int:
+            The number of bytes written.
+        """
+        return self._format_to(
+            _byte_view(data), _sink_writer(sink),
+            self._word_separator_bytes, self._group_separator_bytes,
         )
-    )
-    parser.add_argument(
-        'input', nargs='?',
-        type=argparse.FileType('rb'), default=sys.stdin.buffer,
-        help=(
-            "Optionally specify a the location of a file to read from.  "
-            "Passing \"-\" indicates that the default, stdin, should be used."
+
+    def _format_to(self, view, write, word_separator, group_separator):
+        # Implementation of `format_to` and `mnformat_to`.  Separators are
+        # given as bytes.
+        word_bytes = self._word_bytes
+        if word_bytes is None:
+            word_bytes = _word_bytes()
+        lookup = word_bytes.__getitem__
+        join_words = word_separator.join
+        join_groups = group_separator.join
+
+        # Each chunk after the first starts with the group separator that
+        # joins it to the one before.  Words are looked up directly rather
+        # than through the cache, which holds them as strings.
+        written = 0
+        groups = []
+        for offset in range(0, len(view), _FORMAT_CHUNK_SIZE):
+            groups += [
+                join_words(map(lookup, indices))
+                for indices in _iter_indices(
+                    view[offset:offset + _FORMAT_CHUNK_SIZE],
+                )
+            ]
+            chunk = join_groups(groups)
+            write(chunk)
+            written += len(chunk)
+            groups = [b'']
+
+        return written
+
+    def decode(self, data, abbreviated=False, correct=False):
+        """Decode an iterator of tuples of words to get a byte array.
+
+        :param data:
+            An iterator of tuples of between one and three words from the
+            wordlist.
+        :param bool abbreviated:
+            If set, words can be abbreviated to any prefix that only matches a
+            single word in the wordlist.
+        :param bool correct:
+            If set, unrecognized words are replaced by the only word in the
+            wordlist that is a single typo away, if there is one.
+        :return bytes:
+            A :class:`bytes` object containing the decoded data.
+        """
+        return b''.join(self._decode_blocks(data, abbreviated, correct))
+
+    def _decode_blocks(self, data, abbreviated, correct, decode=None):
+        # Implementation of `decode`, `mndecode` and `mndecode_into`.  Yields
+        # the block for each group of words.
+        words_to_block = self._words_to_block
+        for words in data:
+            yield words_to_block(words, abbreviated, correct, decode)
+
+    def _words_to_block(self, words, abbreviated, correct, decode=None):
+        # Decodes a single group of words, raising on errors.  If `decode` is
+        # given, the group is looked up using the cached decoder unless it may
+        # need expanding or correcting.  Plain groups are decoded directly, as
+        # the extra call through `_decode_group` is noticeable on short
+        # strings.
+        if not isinstance(words, tuple):
+            raise TypeError("expected tuple of words")
+
+        if abbreviated or correct:
+            block = self._decode_group(words, abbreviated, correct)
+        elif decode is not None:
+            block = decode(words)
+        else:
+            indices = self._indices
+            if indices is None:
+                indices = self._get_indices()
+            lookup = indices.get
+            block = _indices_to_block(
+                [lookup(word) for word in words], self._words.__getitem__,
+            )
+
+        if isinstance(block, str):
+            raise ValueError(block)
+
+        return block
+
+    def _decode_group(self, words, abbreviated=False, correct=False):
+        # Decodes a group of words, returning errors as a string in the same
+        # way as `_indices_to_block`.  This is the function that is memoised
+        # when caching is enabled.
+        indices = self._indices
+        if indices is None:
+            indices = self._get_indices()
+        lookup = indices.get
+        indices = [lookup(word) for word in words]
+
+        if (abbreviated or correct) and None in indices:
+            for position, word in enumerate(words):
+                if indices[position] is not None or not isinstance(word, str):
+                    continue
+                if not word:
+                    continue
+
+                # Words that weren't recognized are replaced by the only word
+                # that they are a prefix of, if there is one.
+                if abbreviated:
+                    candidates = self._completions(word)
+                    if len(candidates) > 1:
+                        return "ambiguous word: {word!r}".format(word=word)
+                    if candidates:
+                        indices[position] = lookup(candidates[0])
+                        continue
+
+                # Failing that, by the only word a single typo away.
+                if correct:
+                    candidates = self._corrections(word)
+                    if len(candidates) > 1:
+                        return (
+                            "ambiguous correction: {word!r}"
+                        ).format(word=word)
+                    if candidates:
+                        indices[position] = lookup(candidates[0])
+
+        return _indices_to_block(indices, self._words.__getitem__)
+
+    def parse(self, string, abbreviated=False, correct=False):
+        """Decode a mnemonicode string into a byte array.
+
+        :param str string:
+            The string containing the mnemonicode encoded data.
+        :param bool abbreviated:
+            If set, words can be abbreviated to any prefix that only matches a
+            single word in the wordlist.  See :meth:`complete`.
+        :param bool correct:
+            If set, unrecognized words are replaced by the only word in the
+            wordlist that is a single typo away, if there is one.  See
+            :meth:`correct`.
+        :return bytes:
+            A :class:`bytes` object containing the decoded data.
+        """
+        return self._parse(
+            string, self._word_separator, self._group_separator,
+            abbreviated, correct,
         )
-    )
-    args = parser.parse_args()
 
-    args.output.write(mnformat(
-        args.input.read(),
-        word_separator=args.word_separator,
-        group_separator=args.group_separator,
-    ))
+    def _parse(
+        self, string, word_separator, group_separator, abbreviated=False,
+        correct=False, normalize=False, buffer=None, decode=None,
+    ):
+        # Implementation of `parse`, `mnparse` and `mnparse_into`.  If
+        # `buffer` is given, the data is written to it and the number of bytes
+        # written returned.
+        if not isinstance(string, str):
+            raise TypeError((
+                "expected string, got {cls}"
+            ).format(cls=type(string).__name__))
+
+        if normalize:
+            string, word_separator, group_separator = _normalize(
+                string, word_separator, group_separator,
+            )
+
+        # Empty string is a valid input but ``"".split(...)`` does not return
+        # an empty iterator so we need to special case it.
+        if len(string) == 0:
+            return b'' if buffer is None else 0
+
+        if (
+            len(string) >= _PARSE_MIN_LENGTH and
+            not abbreviated and not correct and decode is None
+        ):
+            pattern = _group_pattern(
+                word_separator, group_separator, self._characters,
+            )
+            if pattern is not None:
+                data = _parse_groups(
+                    string, pattern, self._get_parse_tables(),
+                    self._get_indices(), self._words, word_separator,
+                    group_separator, buffer,
+                )
+                if data is not None:
+                    return data
+
+        blocks = self._decode_blocks((
+            tuple(group.split(word_separator))
+            for group in string.split(group_separator)
+        ), abbreviated, correct, decode)
+        if buffer is None:
+            return b''.join(blocks)
+
+        return _write_blocks(blocks, buffer)
+
+    def _get_indices(self):
+        # Returns the mapping from words to indices.  The default codec shares
+        # the one in `_wordlist`, which is only built the first time anything
+        # is decoded, so its slot starts out empty.
+        indices = self._indices
+        if indices is None:
+            indices = _word_indices()
+            object.__setattr__(self, '_indices', indices)
+        return indices
 
+    def _get_parse_tables(self):
+        # Returns the tables used by `_parse_groups`, in the same way as
+        # `_get_indices`.
+        tables = self._parse_tables
+        if tables is None:
+            tables = _parse_tables()
+            object.__setattr__(self, '_parse_tables', tables)
+        return tables
 
-def _mndecode_main():  # pragma: no cover
-    # `mndecode` is tested by executing in a separate process.
-    # This means that tests for it don't get noticed by the coverage tracker.
-    parser = argparse.ArgumentParser()
-    parser.add_argument(
-        '-w', '--word-separator', type=str, default='-',
-        help=(
-            "String used to separate individual words within a group.  "
-            "Defaults to \"-\""
+    def complete(self, prefix):
+        """List the words in the wordlist that start with a prefix.
+
+        :param str prefix:
+            The start of a word.
+        :returns:
+            A sorted list of matching words.  See :func:`complete`.
+        """
+        if not isinstance(prefix, str):
+            raise TypeError((
+                "expected string, got {cls}"
+            ).format(cls=type(prefix).__name__))
+
+        return list(self._completions(prefix))
+
+    def _completions(self, prefix):
+        # Returns a sorted tuple of all words starting with `prefix`.  The
+        # trie is built on first use, as most codecs never need it.  Two
+        # threads may both build it, which is harmless.
+        trie = self._prefix_trie
+        if trie is None:
+            trie = _make_prefix_trie(self._words)
+            object.__setattr__(self, '_prefix_trie', trie)
+        return _complete(trie, prefix)
+
+    def correct(self, string):
+        """Correct mistyped words in a mnemonicode string.
+
+        :param str string:
+            The string containing the mnemonicode encoded data.
+        :returns:
+            A tuple of the corrected string, and a list of :class:`Correction`
+            objects.  See :func:`mncorrect`.
+        :raises ValueError:
+            If a word can not be corrected.
+        """
+        return self._correct_string(
+            string, self._word_separator, self._group_separator,
         )
+
+    def _correct_string(self, string, word_separator, group_separator):
+        # Implementation of `correct` and `mncorrect`.
+        if not isinstance(string, str):
+            raise TypeError((
+                "expected string, got {cls}"
+            ).format(cls=type(string).__name__))
+
+        if len(string) == 0:
+            return string, []
+
+        indices = self._get_indices()
+        corrections = []
+        groups = []
+        position = 0
+        for group in string.split(group_separator):
+            words = group.split(word_separator)
+            for offset, word in enumerate(words):
+                if word not in indices:
+                    candidates = self._corrections(word) if word else ()
+                    if len(candidates) != 1:
+                        if candidates:
+                            reason = (
+                                "ambiguous correction: {word!r}"
+                            ).format(word=word)
+                        else:
+                            reason = "word not recognized"
+                        raise ValueError((
+                            "{reason} (position {position})"
+                        ).format(reason=reason, position=position))
+
+                    words[offset] = candidates[0]
+                    corrections.append(
+                        Correction(position, word, candidates[0]),
+                    )
+
+                position += len(word) + len(word_separator)
+            position += len(group_separator) - len(word_separator)
+            groups.append(word_separator.join(words))
+
+        return group_separator.join(groups), corrections
+
+    def _corrections(self, word):
+        # Returns a sorted tuple of all words a single edit away from `word`.
+        # The index is built on first use, in the same way as the trie.
+        index = self._correction_index
+        if index is None:
+            index = _make_correction_index(self._words)
+            object.__setattr__(self, '_correction_index', index)
+        return _correct(index, self._words, word)
+
+
+# The codec that the module level functions are implemented by.  Creating it
+# is cheap, as its tables are only built on first use.
+_DEFAULT_CODEC = Codec()
+
+
+def complete(prefix):
+    """List the words in the wordlist that start with a prefix.
+
+    Takes time proportional to the length of the prefix rather than the size
+    of the wordlist.
+
+    >>> complete('ala')
+    ['alabama', 'aladdin', 'alamo', 'alarm', 'alaska']
+    >>> complete('alas')
+    ['alaska']
+
+    :param str prefix:
+        The start of a word.
+    :returns:
+        A sorted list of matching words.  If it contains exactly one word then
+        ``prefix`` is an unambiguous abbreviation of that word, and will be
+        accepted in its place when decoding with ``abbreviated`` set.
+    """
+    return _DEFAULT_CODEC.complete(prefix)
+
+
+class Correction(collections.namedtuple(
+    'Correction', ['position', 'word', 'replacement'],
+)):
+    """Describes a mistyped word replaced by :func:`mncorrect`.
+
+    :param int position:
+        Offset of the first character of the word in the original string.
+    :param str word:
+        The word as it appeared in the original string.
+    :param str replacement:
+        The word from the wordlist that it was replaced with.
+    """
+    __slots__ = ()
+
+
+def mncorrect(string, word_separator="-", group_separator="--"):
+    """Correct mistyped words in a mnemonicode string.
+
+    Each word that is not in the wordlist is replaced by the only word that is
+    a single insertion, deletion, substitution or transposition of adjacent
+    characters away from it.
+
+    >>> mncorrect('scoop-limti-recycle--ferari-album')
+    ('scoop-limit-recycle--ferrari-album', [Correction(position=6, \
+word='limti', replacement='limit'), Correction(position=21, word='ferari', \
+replacement='ferrari')])
+
+    :param str string:
+        The string containing the mnemonicode encoded data.
+    :param str word_separator:
+        String used to separate individual words in a group.
+    :param str group_separator:
+        String used to separate groups of words representing four byte blocks.
+    :returns:
+        A tuple of the corrected string, and a list of :class:`Correction`
+        objects describing each replaced word.
+    :raises ValueError:
+        If a word can not be corrected, either because no word is a single
+        typo away or because more than one is.
+    """
+    return _DEFAULT_CODEC._correct_string(
+        string, word_separator, group_separator,
+    )
+
+
+def mnformat_int(num, width=4, word_separator="-", group_separator="--"):
+    """Encode a non-negative integer as a sequence of grouped words.
+
+    The result is identical to calling :func:`mnformat` on the little-endian
+    representation of the number, but avoids the conversion to bytes.
+
+    >>> mnformat_int(1684234849)
+    'bogart-atlas-safari'
+    >>> mnformat_int(1684234849, width=8)
+    'bogart-atlas-safari--academy-academy-academy'
+
+    :param int num:
+        The number to encode.
+    :param int width:
+        The size of the integer in bytes.  Either 4 or 8.
+    :param str word_separator:
+        String that should be used to separate words within a group.
+    :param str group_separator:
+        String that should be used to separate groups of words.
+    :return str:
+        The number as a sequence of grouped words.
+    """
+    if not isinstance(num, int):
+        raise TypeError((
+            "expected int, got {cls}"
+        ).format(cls=type(num).__name__))
+
+    if width not in (4, 8):
+        raise ValueError("width must be either 4 or 8")
+
+    if num < 0 or num >> (8 * width):
+        raise ValueError((
+            "{num} does not fit in {width} bytes"
+        ).format(num=num, width=width))
+
+    words = _WORDLIST
+    high, low = divmod(num, 0x100000000)
+
+    low, first = divmod(low, 1626)
+    third, second = divmod(low, 1626)
+    string = word_separator.join(
+        (words[first], words[second], words[third])
     )
-    parser.add_argument(
-        '-g', '--group-separator', type=str, default='--',
-        help=(
-            "String used to separate the groups of words representing four "
-            "byte blocks.  Defaults to \"--\""
+
+    if width == 8:
+        high, first = divmod(high, 1626)
+        third, second = divmod(high, 1626)
+        string = group_separator.join((string, word_separator.join(
+            (words[first], words[second], words[third])
+        )))
+
+    return string
+
+
+def mnparse_int(string, word_separator="-", group_separator="--"):
+    """Decode a mnemonicode string into a non-negative integer.
+
+    The result is identical to interpreting the output of :func:`mnparse` as
+    a little-endian number, but avoids the conversion from bytes.
+
+    >>> mnparse_int('bogart-atlas-safari')
+    1684234849
+
+    :param str string:
+        The string containing the mnemonicode encoded number.
+    :param str word_separator:
+        String used to separate individual words in a group.
+    :param str group_separator:
+        String used to separate groups of words representing four byte blocks.
+    :return int:
+        The decoded number.
+    """
+    if not isinstance(string, str):
+        raise TypeError((
+            "expected string, got {cls}"
+        ).format(cls=type(string).__name__))
+
+    lookup = _word_indices().get
+
+    num = 0
+    shift = 0
+    for group in string.split(group_separator):
+        words = group.split(word_separator)
+        if len(words) != 3:
+            break
+
+        first = lookup(words[0])
+        second = lookup(words[1])
+        third = lookup(words[2])
+        if first is None or second is None or third is None:
+            break
+
+        if first >= 1626 or second >= 1626 or third >= 1626:
+            break
+
+        block = first + 1626 * (second + 1626 * third)
+        if block >> 32:
+            break
+
+        num |= block << shift
+        shift += 32
+    else:
+        return num
+
+    # Partial blocks are rare, and anything invalid will need to be reported
+    # with the same message as `mnparse` would give, so hand anything other
+    # than a sequence of whole blocks over to the general purpose decoder.
+    return int.from_bytes(mnparse(
+        string, word_separator=word_separator, group_separator=group_separator,
+    ), 'little')
+
+
+class ParseFailure(collections.namedtuple(
+    'ParseFailure', ['index', 'position', 'reason'],
+)):
+    """Describes a string that :func:`mnparse_many` could not decode.
+
+    :param int index:
+        The index of the string in the input iterable.
+    :param int position:
+        Offset of the first character of the group that failed to decode.
+    :param str reason:
+        Human readable description of the problem.
+    """
+    __slots__ = ()
+
+
+def mnparse_many(
+    strings, word_separator="-", group_separator="--", errors="raise",
+):
+    """Decode each mnemonicode string in an iterable.
+
+    >>> decoded, failures = mnparse_many(
+    ...     ['zero-albert', 'zero-kazoo', ''], errors="collect",
+    ... )
+    >>> decoded
+    [b'ab', None, b'']
+    >>> failures
+    [ParseFailure(index=1, position=0, reason='word not recognized')]
+
+    :param strings:
+        An iterable of independent mnemonicode strings to decode.
+    :param str word_separator:
+        String used to separate individual words in a group.
+    :param str group_separator:
+        String used to separate groups of words representing four byte blocks.
+    :param str errors:
+        What to do with strings that can not be decoded.  ``"raise"``, the
+        default, raises a :class:`ValueError` for the first bad string.
+        ``"skip"`` leaves bad strings out of the results.  ``"collect"``
+        inserts ``None`` into the results in their place and records a
+        :class:`ParseFailure` describing each one.
+    :returns:
+        A tuple containing a list of decoded :class:`bytes` objects and a list
+        of failures.  The list of failures will be empty unless ``errors`` is
+        ``"collect"``.
+    """
+    if errors not in ('raise', 'skip', 'collect'):
+        raise ValueError((
+            "unknown error handling scheme: {errors!r}"
+        ).format(errors=errors))
+
+    decode = _decode_cache
+    if decode is None:
+        decode_group = _DEFAULT_CODEC._decode_group
+    else:
+        def decode_group(words):
+            return decode(tuple(words))
+
+    results = []
+    failures = []
+
+    for index, string in enumerate(strings):
+        if not isinstance(string, str):
+            if errors == 'raise':
+                raise TypeError((
+                    "expected string, got {cls}"
+                ).format(cls=type(string).__name__))
+            position = 0
+            reason = "expected string, got {cls}".format(
+                cls=type(string).__name__,
+            )
+
+        elif len(string) == 0:
+            results.append(b'')
+            continue
+
+        else:
+            groups = string.split(group_separator)
+            blocks = []
+            for group in groups:
+                block = decode_group(group.split(word_separator))
+                if isinstance(block, str):
+                    break
+                blocks.append(block)
+            else:
+                results.append(b''.join(blocks))
+                continue
+
+            reason = block
+            position = (
+                sum(map(len, groups[:len(blocks)])) +
+                len(blocks) * len(group_separator)
+            )
+
+        if errors == 'raise':
+            raise ValueError((
+                "{reason} (string {index}, position {position})"
+            ).format(reason=reason, index=index, position=position))
+
+        if errors == 'collect':
+            results.append(None)
+            failures.append(ParseFailure(index, position, reason))
+
+    return results, failures
+
+
+# Memoised versions of `_number_to_words` and of `Codec._decode_group` for the
+# default codec.  `None` when caching is disabled.
+_encode_cache = None
+_decode_cache = None
+
+
+class CacheInfo(collections.namedtuple(
+    'CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'],
+)):
+    """Statistics for one of the caches enabled by :func:`enable_cache`.
+
+    :param int hits:
+        Number of lookups that were answered from the cache.
+    :param int misses:
+        Number of lookups that had to be computed.
+    :param int evictions:
+        Number of entries discarded to make room for new ones.
+    :param int maxsize:
+        Maximum number of entries the cache will hold.
+    :param int currsize:
+        Number of entries currently in the cache.
+    """
+    __slots__ = ()
+
+
+class CacheStatistics(collections.namedtuple(
+    'CacheStatistics', ['encode', 'decode'],
+)):
+    """Statistics for the block encoding and group decoding caches.
+
+    :param CacheInfo encode:
+        Statistics for the cache mapping four byte blocks to words.
+    :param CacheInfo decode:
+        Statistics for the cache mapping groups of words to bytes.
+    """
+    __slots__ = ()
+
+
+def enable_cache(maxsize=4096):
+    """Enable memoisation of block encoding and group decoding.
+
+    Caching only pays off for heavily skewed workloads, where a small number
+    of blocks or groups make up most of the traffic.  Both caches use a least
+    recently used eviction policy and are safe to share between threads.
+    Calling this function again replaces any existing caches, and resets
+    their statistics.
+
+    >>> enable_cache(maxsize=2)
+    >>> mnformat(b"abcdabcdabcd")
+    'bogart-atlas-safari--bogart-atlas-safari--bogart-atlas-safari'
+    >>> cache_info().encode
+    CacheInfo(hits=2, misses=1, evictions=0, maxsize=2, currsize=1)
+    >>> disable_cache()
+
+    :param int maxsize:
+        The maximum number of entries to keep in each cache.
+    """
+    global _encode_cache, _decode_cache
+
+    if maxsize <= 0:
+        raise ValueError("maxsize must be positive")
+
+    _encode_cache = functools.lru_cache(maxsize)(_number_to_words)
+    _decode_cache = functools.lru_cache(maxsize)(
+        _DEFAULT_CODEC._decode_group,
+    )
+
+
+def disable_cache():
+    """Disable caching enabled by :func:`enable_cache` and free the cached
+    entries.
+    """
+    global _encode_cache, _decode_cache
+    _encode_cache = None
+    _decode_cache = None
+
+
+def _cache_info(cache):
+    info = cache.cache_info()
+    # Every miss inserts exactly one entry, and entries are only ever removed
+    # by eviction, so the number of evictions can be recovered from the other
+    # statistics.  This may slightly over count if two threads race to insert
+    # the same entry.
+    return CacheInfo(
+        hits=info.hits,
+        misses=info.misses,
+        evictions=info.misses - info.currsize,
+        maxsize=info.maxsize,
+        currsize=info.currsize,
+    )
+
+
+def cache_info():
+    """Return hit, miss and eviction statistics for the caches enabled by
+    :func:`enable_cache`.
+
+    :return CacheStatistics:
+        Statistics for the encoding and decoding caches, or ``None`` if
+        caching is not enabled.
+    """
+    encode = _encode_cache
+    decode = _decode_cache
+    if encode is None or decode is None:
+        return None
+
+    return CacheStatistics(
+        encode=_cache_info(encode), decode=_cache_info(decode),
+    )
+
+
+class _StreamFormatter(object):
+    # Formats data that arrives in arbitrarily sized pieces.  Partial blocks
+    # are held back until the next call so that the concatenated output is
+    # identical to calling `mnformat` on the concatenated input.
+    def __init__(self, word_separator="-", group_separator="--"):
+        self._word_separator = word_separator
+        self._group_separator = group_separator
+        self._pending = b''
+        self._started = False
+
+    def feed(self, data, final=False):
+        if self._pending:
+            data = self._pending + data
+
+        end = len(data) if final else len(data) - len(data) % 4
+        if end < len(data):
+            self._pending = bytes(data[end:])
+            data = data[:end]
+        else:
+            self._pending = b''
+
+        if not data:
+            return ''
+
+        text = mnformat(
+            data,
+            word_separator=self._word_separator,
+            group_separator=self._group_separator,
         )
+        if self._started:
+            text = self._group_separator + text
+        self._started = True
+        return text
+
+
+class _StreamParser(object):
+    # Parses text that arrives in arbitrarily sized pieces.  Everything after
+    # the last complete group separator is held back until the next call, so
+    # groups, words and separators may all be split across pieces.
+    def __init__(
+        self, word_separator="-", group_separator="--", abbreviated=False,
+        correct=False,
+    ):
+        self._word_separator = word_separator
+        self._group_separator = group_separator
+        self._abbreviated = abbreviated
+        self._correct = correct
+        self._pending = ''
+        self._started = False
+
+        # Anything longer than this that doesn't contain a group separator
+        # can not be valid.  Checking stops unbounded growth of the buffer.
+        # Corrected words may have one extra character inserted.
+        word_length = _MAX_WORD_LENGTH + 1 if correct else _MAX_WORD_LENGTH
+        self._max_pending = (
+            3 * word_length + 2 * len(word_separator) + len(group_separator)
+        )
+
+    def feed(self, text, final=False):
+        if self._pending:
+            text = self._pending + text
+
+        if final and not text and not self._started:
+            # Empty input is valid.
+            return b''
+
+        groups = text.split(self._group_separator)
+        if final:
+            self._pending = ''
+        else:
+            self._pending = groups.pop()
+            if len(self._pending) > self._max_pending:
+                raise ValueError("group too long")
+
+        if groups:
+            self._started = True
+
+        word_separator = self._word_separator
+        abbreviated = self._abbreviated
+        correct = self._correct
+        decode_group = _DEFAULT_CODEC._decode_group
+        blocks = []
+        for group in groups:
+            block = decode_group(
+                group.split(word_separator), abbreviated, correct,
+            )
+            if isinstance(block, str):
+                raise ValueError(block)
+            blocks.append(block)
+        return b''.join(blocks)
+
+
+def mniterparse(
+    source, word_separator="-", group_separator="--", chunk_size=65536,
+    abbreviated=False, correct=False,
+):
+    """Incrementally decode mnemonicode text from a file or iterator.
+
+    >>> list(mniterparse(['scoop-limit-rec', 'ycle-', '-ferrari-album']))
+    [b'toma', b'to']
+
+    :param source:
+        Either a file-like object opened in text mode, or an iterable of
+        strings which, when concatenated, contain the mnemonicode encoded
+        data.
+    :param str word_separator:
+        String used to separate individual words in a group.
+    :param str group_separator:
+        String used to separate groups of words representing four byte blocks.
+    :param int chunk_size:
+        Number of characters to read from ``source`` at a time if it is a
+        file.
+    :param bool abbreviated:
+        If set, words can be abbreviated to any prefix that only matches a
+        single word in the wordlist.
+    :param bool correct:
+        If set, unrecognized words are replaced by the only word in the
+        wordlist that is a single typo away, if there is one.
+    :returns:
+        An iterator of :class:`bytes` objects which, when concatenated, are
+        equal to the result of calling :func:`mnparse` on the whole input.
+    """
+    if hasattr(source, 'read'):
+        source = iter(functools.partial(source.read, chunk_size), '')
+
+    parser = _StreamParser(
+        word_separator=word_separator, group_separator=group_separator,
+        abbreviated=abbreviated, correct=correct,
     )
-    parser.add_argument(
-        '-o', '--output',
-        type=argparse.FileType('wb'), default=sys.stdout.buffer,
-        help=(
-            "Where to write the decoded output.  This should be the path to a "
-            "file, or \"-\" to indicate stdout.  Defaults to stdout."
+    for text in source:
+        if not isinstance(text, str):
+            raise TypeError((
+                "expected string, got {cls}"
+            ).format(cls=type(text).__name__))
+
+        data = parser.feed(text)
+        if data:
+            yield data
+
+    data = parser.feed('', final=True)
+    if data:
+        yield data
+
+
+class DecodingReader(io.RawIOBase):
+    """A readable binary file object that decodes mnemonicode text on demand.
+
+    >>> reader = DecodingReader(io.StringIO(
+    ...     'scoop-limit-recycle--ferrari-album'
+    ... ))
+    >>> reader.read(3)
+    b'tom'
+    >>> reader.read()
+    b'ato'
+
+    :param source:
+        Either a file-like object opened in text mode, or an iterable of
+        strings, as accepted by :func:`mniterparse`.
+    :param str word_separator:
+        String used to separate individual words in a group.
+    :param str group_separator:
+        String used to separate groups of words representing four byte blocks.
+    """
+    def __init__(self, source, word_separator="-", group_separator="--"):
+        super().__init__()
+        self._chunks = mniterparse(
+            source,
+            word_separator=word_separator, group_separator=group_separator,
+        )
+        self._buffer = b''
+        self._offset = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while self._offset >= len(self._buffer):
+            self._buffer = next(self._chunks, b'')
+            self._offset = 0
+            if not self._buffer:
+                return 0
+
+        size = min(len(b), len(self._buffer) - self._offset)
+        b[:size] = self._buffer[self._offset:self._offset + size]
+        self._offset += size
+        return size
+
+
+# Number of bytes read at a time while indexing a file.
+_INDEX_CHUNK_SIZE = 1 << 20
+
+# Maximum number of groups decoded by a single `readinto` call.
+_SEEK_READ_GROUPS = 16384
+
+
+class SeekableDecodingReader(io.RawIOBase):
+    """A seekable binary file object that decodes the byte ranges it is asked
+    for from a large file of mnemonicode text.
+
+    >>> reader = SeekableDecodingReader(io.BytesIO(
+    ...     b'scoop-limit-recycle--ferrari-album\\n'
+    ... ))
+    >>> reader.seek(2)
+    2
+    >>> reader.read(3)
+    b'mat'
+
+    Every group in a string produced by :func:`mnformat` decodes to four
+    bytes, except possibly the last one, so the groups covering any range of
+    decoded bytes can be found without decoding anything before them.  The
+    first time the reader is used it scans the file once, counting group
+    separators and recording the position of every ``index_interval``'th
+    group, and afterwards only reads and decodes the groups that a read
+    covers.
+
+    :param source:
+        A seekable file-like object opened in binary mode, containing UTF-8
+        encoded mnemonicode text.  Whitespace at the end of the file is
+        ignored.
+    :param str word_separator:
+        String used to separate individual words in a group.
+    :param str group_separator:
+        String used to separate groups of words representing four byte blocks.
+    :param int index_interval:
+        Number of groups between entries in the index.  Smaller values use
+        more memory, but read less text to find the start of each range.
+    """
+    def __init__(
+        self, source, word_separator="-", group_separator="--",
+        index_interval=64,
+    ):
+        super().__init__()
+        if not group_separator:
+            raise ValueError("group separator must not be empty")
+        if index_interval < 1:
+            raise ValueError("index interval must be at least one")
+
+        self._source = source
+        self._word_separator = word_separator
+        self._group_separator = group_separator
+        self._separator = group_separator.encode('utf-8')
+        self._index_interval = index_interval
+        self._max_group_length = len((
+            3 * _MAX_WORD_LENGTH * 'x' + 2 * word_separator + group_separator
+        ).encode('utf-8'))
+
+        self._index = None
+        self._end = 0
+        self._length = 0
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def _content_end(self):
+        # Returns the offset of the end of the file, ignoring any trailing
+        # whitespace.
+        end = self._source.seek(0, io.SEEK_END)
+        while end > 0:
+            start = max(end - 4096, 0)
+            self._source.seek(start)
+            content = self._source.read(end - start).rstrip()
+            if content:
+                return start + len(content)
+            end = start
+        return 0
+
+    def _build_index(self):
+        # Records the offset of the start of every `index_interval`'th group,
+        # and works out the length of the decoded data from the number of
+        # group separators and the final group.
+        import re
+
+        separator = self._separator
+        pattern = re.compile(re.escape(separator))
+        interval = self._index_interval
+        index = array.array('q', [0])
+
+        end = self._content_end()
+        self._source.seek(0)
+        groups = 1
+        last = 0
+
+        # Separators may be split between chunks, so the start of each chunk
+        # is searched together with just enough of the end of the one before
+        # to complete one.  Only the offset of the final group is kept, and
+        # the group itself is read back once the scan is finished.
+        keep = len(separator) - 1
+        tail = b''
+        position = 0
+        while position < end:
+            chunk = self._source.read(min(_INDEX_CHUNK_SIZE, end - position))
+            if not chunk:
+                break
+
+            base = position - len(tail)
+            buffer = tail + chunk
+            position += len(chunk)
+
+            ends = [
+                match.end() for match in pattern.finditer(
+                    buffer, max(last - base, 0),
+                )
+            ]
+            if ends:
+                index.extend(
+                    base + end
+                    for end in ends[(interval - groups) % interval::interval]
+                )
+                groups += len(ends)
+                last = base + ends[-1]
+
+            tail = buffer[max(len(buffer) - keep, 0):]
+
+        if not end:
+            length = 0
+        elif end - last > self._max_group_length:
+            # Also catches files with no separators at all, which would
+            # otherwise be read into memory in one go.
+            raise ValueError("group too long")
+        else:
+            self._source.seek(last)
+            length = 4 * (groups - 1) + len(mnparse(
+                self._source.read(end - last).decode('utf-8'),
+                self._word_separator, self._group_separator,
+            ))
+
+        self._index = index
+        self._end = end
+        self._length = length
+
+    def _ensure_index(self):
+        if self._index is None:
+            self._build_index()
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        self._ensure_index()
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._length + offset
+        else:
+            raise ValueError((
+                "invalid whence ({whence}, should be 0, 1 or 2)"
+            ).format(whence=whence))
+
+        if position < 0:
+            raise ValueError((
+                "negative seek position {position}"
+            ).format(position=position))
+
+        self._position = position
+        return position
+
+    def tell(self):
+        return self._position
+
+    def _read_groups(self, first, count):
+        # Returns the text of `count` groups, starting at group `first`.
+        entry, skip = divmod(first, self._index_interval)
+        start = self._index[entry]
+        self._source.seek(start)
+        text = self._source.read(min(
+            (skip + count) * self._max_group_length, self._end - start,
+        ))
+
+        separator = self._separator
+        start = 0
+        for _ in range(skip):
+            start = text.index(separator, start) + len(separator)
+
+        end = start
+        for _ in range(count - 1):
+            end = text.index(separator, end) + len(separator)
+        end = text.find(separator, end)
+        if end < 0:
+            end = len(text)
+
+        return text[start:end].decode('utf-8')
+
+    def readinto(self, b):
+        self._ensure_index()
+        position = self._position
+        size = min(len(b), self._length - position)
+        if size <= 0:
+            return 0
+
+        first, skip = divmod(position, 4)
+        count = min(-(-(skip + size) // 4), _SEEK_READ_GROUPS)
+        data = mnparse(
+            self._read_groups(first, count),
+            self._word_separator, self._group_separator,
         )
+
+        # Only the last group may decode to less than four bytes, so a short
+        # group anywhere else would throw every offset after it off.
+        if len(data) != min(4 * count, self._length - 4 * first):
+            raise ValueError("partial block before end of data")
+
+        size = min(size, len(data) - skip)
+        b[:size] = data[skip:skip + size]
+        self._position += size
+        return size
+
+
+class Occurrence(collections.namedtuple(
+    'Occurrence', ['offset', 'length', 'data'],
+)):
+    """Describes a run of mnemonicode found by :func:`mnfind`.
+
+    :param int offset:
+        Offset of the first character of the run in the text.
+    :param int length:
+        Number of characters in the run.
+    :param bytes data:
+        The decoded data.
+    """
+    __slots__ = ()
+
+
+# Larger than the value of any four byte block.  Used by `_Finder` in place of
+# words missing from the parse tables.
+_NOT_A_BLOCK = 1 << 32
+
+
+@functools.lru_cache(maxsize=16)
+def _find_patterns(word_separator, group_separator, characters):
+    # Returns a pair of patterns.  The first matches a separator followed by
+    # the start of a word, and is used to quickly skip over text
+    # that can't contain anything longer than a single word.  The second
+    # matches a candidate run of words and separators.  Both are built from
+    # the characters that actually appear in words, so text made of anything
+    # else is never handed to `_Finder._decode_run`.
+    import re
+
+    separator = '(?:{first}|{second})'.format(**dict(zip(
+        ('first', 'second'), sorted(
+            map(re.escape, (word_separator, group_separator)),
+            key=len, reverse=True,
+        ),
+    )))
+    character = '[{characters}]'.format(characters=re.escape(characters))
+    anchor = re.compile('{separator}{character}'.format(
+        separator=separator, character=character,
+    ))
+    candidate = re.compile(
+        '{character}+(?:{separator}{character}+)*'.format(
+            separator=separator, character=character,
+        ),
     )
-    parser.add_argument(
-        'input', nargs='?', type=argparse.FileType('r'), default=sys.stdin,
-        help=(
-            "Optionally specify a the location of a file to read from.  "
-            "Passing \"-\" indicates that the default, stdin, should be used."
+    return anchor, candidate
+
+
+class _Finder(object):
+    # Finds runs of mnemonicode in text that arrives in arbitrarily sized
+    # pieces.  Each piece is only scanned up to the last character that can't
+    # be part of a run, so that runs are never split between pieces.  If a
+    # piece contains no such character, it is instead cut at the last group
+    # separator and any run that crosses the cut is carried over, so memory
+    # use stays bounded however long a run is.
+    def __init__(self, word_separator="-", group_separator="--", min_length=4):
+        if not word_separator or not group_separator:
+            raise ValueError("separators must not be empty")
+        characters = _DEFAULT_CODEC._characters
+        if not set(word_separator + group_separator).isdisjoint(characters):
+            raise ValueError("separators must not contain lower case letters")
+        if min_length < 1:
+            raise ValueError("min_length must be at least one")
+
+        self._word_separator = word_separator
+        self._group_separator = group_separator
+        self._min_length = min_length
+        self._anchor, self._candidate = _find_patterns(
+            word_separator, group_separator, characters,
+        )
+        if min_length == 1:
+            # Single words are valid runs, so there is nothing to anchor on.
+            self._anchor = None
+        self._separators = sorted(
+            (word_separator, group_separator), key=len, reverse=True,
         )
+        self._lookup = _DEFAULT_CODEC._get_indices().get
+        self._tables = _DEFAULT_CODEC._get_parse_tables()
+        self._characters = frozenset(characters)
+        self._run_chars = frozenset(
+            characters + word_separator + group_separator
+        )
+        self._max_pending = 65536
+
+        self._buffer = ''
+        # Offset of the start of the buffer in the text as a whole.
+        self._offset = 0
+        # Position in the buffer to start scanning from.  The character before
+        # it, if any, is only kept in order to check for word boundaries.
+        self._start = 0
+        # A run that was still open at the end of the previous piece, as a list
+        # of its start offset, end offset, and decoded blocks.
+        self._run = None
+
+    def _flush(self, found):
+        run = self._run
+        self._run = None
+        if run is None:
+            return
+
+        start, end, blocks = run
+        data = b''.join(blocks)
+        if len(data) >= self._min_length:
+            found.append(Occurrence(start, end - start, data))
+
+    def _decode_run(self, buffer, match, found, cut=False):
+        # Splits a candidate into groups and decodes them, starting, or
+        # continuing, a run with each group that decodes successfully and
+        # ending it on any group that doesn't or that decodes to a partial
+        # block.  If `cut` is set, the candidate was cut short at a group
+        # separator.  This is called for every candidate in the text, so
+        # four byte groups, which make up most of any run, are summed straight
+        # from the parse tables, and only anything else is decoded through
+        # `_indices_to_block`.
+        word_separator = self._word_separator
+        group_separator = self._group_separator
+        separator_length = len(group_separator)
+        lookup = self._lookup
+        first, second, third = (table.get for table in self._tables)
+
+        groups = match.group().split(group_separator)
+
+        # Words that run straight into something else are not words, so
+        # neither are the groups that they are part of.
+        start = match.start()
+        clean_start = int(
+            start > 0 and self._run is None and buffer[start - 1].isalnum()
+        )
+        end = match.end()
+        clean_end = len(groups)
+        if not cut and end < len(buffer) and buffer[end].isalnum():
+            clean_end -= 1
+
+        offset = self._offset + start
+        for index, group in enumerate(groups):
+            if clean_start <= index < clean_end:
+                words = group.split(word_separator)
+                num = _NOT_A_BLOCK
+                if len(words) == 3:
+                    num = (
+                        first(words[0], _NOT_A_BLOCK) +
+                        second(words[1], _NOT_A_BLOCK) +
+                        third(words[2], _NOT_A_BLOCK)
+                    )
+                if num < _NOT_A_BLOCK:
+                    block = num.to_bytes(4, 'little')
+                else:
+                    block = _indices_to_block(list(map(lookup, words)))
+            else:
+                block = None
+            if block is None or isinstance(block, str):
+                self._flush(found)
+            else:
+                run = self._run
+                if run is None:
+                    run = self._run = [offset, offset, []]
+                run[1] = offset + len(group)
+                run[2].append(block)
+                if len(block) < 4:
+                    self._flush(found)
+            offset += len(group) + separator_length
+
+    def _candidate_start(self, buffer, position, limit):
+        # Walks back from a separator to find the start of the candidate run
+        # that contains it.
+        characters = self._characters
+        while True:
+            while position > limit and buffer[position - 1] in characters:
+                position -= 1
+            for separator in self._separators:
+                start = position - len(separator)
+                if (
+                    start > limit and
+                    buffer.startswith(separator, start) and
+                    buffer[start - 1] in characters
+                ):
+                    position = start
+                    break
+            else:
+                return position
+
+    def _candidates(self, buffer, start, end):
+        # Yields a match for each maximal sequence of words and separators in
+        # `buffer[start:end]`.
+        candidate = self._candidate
+        anchor = self._anchor
+        if anchor is None:
+            yield from candidate.finditer(buffer, start, end)
+            return
+
+        # Any run of more than one word must contain a separator followed by
+        # a word.  Searching for those first is much quicker than trying to
+        # match a candidate at every letter.
+        while True:
+            hit = anchor.search(buffer, start, end)
+            if hit is None:
+                return
+
+            match = candidate.match(
+                buffer, self._candidate_start(buffer, hit.start(), start),
+                end,
+            )
+            if match is None or match.end() <= hit.start():
+                start = hit.start() + 1
+                continue
+
+            yield match
+            start = match.end()
+
+    def _scan(self, buffer, end, found, cut=False):
+        # Finds and decodes runs in `buffer[self._start:end]`.  If `cut` is
+        # set, a run that reaches `end` is left open.
+        start = self._start
+        if self._run is not None:
+            match = self._candidate.match(buffer, start, end)
+            if match is not None:
+                self._decode_run(
+                    buffer, match, found, cut=cut and match.end() == end,
+                )
+                start = match.end()
+            if not (cut and start == end):
+                self._flush(found)
+
+        for match in self._candidates(buffer, start, end):
+            self._decode_run(
+                buffer, match, found, cut=cut and match.end() == end,
+            )
+            if not (cut and match.end() == end):
+                self._flush(found)
+
+    def feed(self, text, final=False):
+        buffer = self._buffer + text
+        found = []
+
+        if final:
+            self._scan(buffer, len(buffer), found)
+            self._flush(found)
+            self._buffer = ''
+            self._offset += len(buffer)
+            self._start = 0
+            return found
+
+        # Nothing held over from previous pieces can end a run, so only the
+        # new text needs to be searched for the last character that can.
+        end = len(buffer)
+        limit = max(len(buffer) - len(text), self._start)
+        run_chars = self._run_chars
+        while end > limit and buffer[end - 1] in run_chars:
+            end -= 1
+        if end == limit:
+            end = self._start
+
+        if end > self._start:
+            # Everything up to and including the last character that can't be
+            # part of a run can be scanned.  That character is kept as the
+            # first character of the next buffer.
+            self._scan(buffer, end - 1, found)
+            end -= 1
+            self._start = 1
+        elif len(buffer) - self._start > self._max_pending:
+            cut = buffer.rfind(self._group_separator, self._start)
+            if cut <= self._start:
+                # No group separators either, so nothing in here is valid.
+                self._scan(buffer, len(buffer), found)
+                end = len(buffer)
+                self._start = 0
+            else:
+                self._scan(buffer, cut, found, cut=True)
+                end = cut + len(self._group_separator)
+                self._start = 0
+        else:
+            self._buffer = buffer
+            return found
+
+        self._buffer = buffer[end:]
+        self._offset += end
+        return found
+
+
+def mnfind(
+    source, word_separator="-", group_separator="--", min_length=4,
+    chunk_size=65536,
+):
+    """Find and decode every run of mnemonicode in a body of text.
+
+    >>> list(mnfind('id: scoop-limit-recycle--ferrari-album, next: camera.'))
+    [Occurrence(offset=4, length=34, data=b'tomato')]
+
+    A run is a sequence of groups, all but the last of which must encode four
+    bytes, that is not part of a longer word.  Runs are split wherever a group
+    fails to decode.  Matching is case sensitive.
+
+    :param source:
+        Either a string, a file-like object opened in text mode, or an
+        iterable of strings which, when concatenated, contain the text to
+        search.
+    :param str word_separator:
+        String used to separate individual words in a group.  Must not
+        contain lower case letters.
+    :param str group_separator:
+        String used to separate groups of words representing four byte blocks.
+        Must not contain lower case letters.
+    :param int min_length:
+        Runs that decode to fewer than this many bytes are ignored.  Defaults
+        to four, which excludes isolated words from the wordlist.
+    :param int chunk_size:
+        Number of characters to read from ``source`` at a time if it is a
+        file.
+    :returns:
+        An iterator of :class:`Occurrence` objects, in the order in which they
+        appear in the text.
+    """
+    finder = _Finder(
+        word_separator=word_separator, group_separator=group_separator,
+        min_length=min_length,
     )
-    args = parser.parse_args()
 
-    args.output.write(mnparse(
-        args.input.read().strip(),
-        word_separator=args.word_separator,
-        group_separator=args.group_separator,
-    ))
+    if isinstance(source, str):
+        source = [source]
+    elif hasattr(source, 'read'):
+        source = iter(functools.partial(source.read, chunk_size), '')
+
+    for text in source:
+        if not isinstance(text, str):
+            raise TypeError((
+                "expected string, got {cls}"
+            ).format(cls=type(text).__name__))
+
+        yield from finder.feed(text)
+
+    yield from finder.feed('', final=True)
+
+
+def _search_codec(name):
+    # The codec classes are only imported when the codec is first looked up.
+    if name != 'mnemonicode':
+        return None
+
+    from mnemonicode._codec import getregentry
+    return getregentry()
+
+
+codecs.register(_search_codec)
 
 
-__all__ = ['mnencode', 'mnformat', 'mndecode', 'mnparse']
+__all__ = [
+    'Codec', 'mnencode', 'mnformat', 'mnformat_to', 'mndecode', 'mnparse',
+    'mndecode_into', 'mnparse_into', 'encoded_length', 'max_encoded_length',
+    'decoded_length', 'complete',
+    'mncorrect', 'Correction',
+    'mnencode_many', 'mnformat_many', 'mnparse_many', 'ParseFailure',
+    'mniterparse', 'DecodingReader', 'SeekableDecodingReader', 'mnfind',
+    'Occurrence',
+    'mnformat_int', 'mnparse_int',
+    'enable_cache', 'disable_cache', 'cache_info', 'CacheInfo',
+    'CacheStatistics',
+]
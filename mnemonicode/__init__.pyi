@@ -1,6 +1,12 @@
+import array
+import io
+import mmap
 import typing
 
 
+BytesLike = typing.Union[bytes, bytearray, memoryview, array.array, mmap.mmap]
+
+
 WordGroup = typing.Union[
     typing.Tuple[str],
     typing.Tuple[str, str],
@@ -8,21 +14,237 @@ WordGroup = typing.Union[
 ]
 
 
-def mnencode(data: bytes) -> typing.Iterator[WordGroup]:
+def mnencode(data: BytesLike) -> typing.Iterator[WordGroup]:
     ...
 
 
 def mnformat(
-    data: bytes, word_separator: str="-", group_separator: str="--",
+    data: BytesLike, word_separator: str="-", group_separator: str="--",
+) -> str:
+    ...
+
+
+def mnformat_to(
+    data: BytesLike, sink: typing.Union[bytearray, typing.BinaryIO],
+    word_separator: str="-", group_separator: str="--",
+) -> int:
+    ...
+
+
+def mnencode_many(
+    records: typing.Iterable[BytesLike],
+) -> typing.Iterator[typing.List[WordGroup]]:
+    ...
+
+
+def mnformat_many(
+    records: typing.Iterable[BytesLike],
+    word_separator: str="-", group_separator: str="--",
+) -> typing.Iterator[str]:
+    ...
+
+
+def mnformat_int(
+    num: int, width: int=4,
+    word_separator: str="-", group_separator: str="--",
 ) -> str:
     ...
 
 
-def mndecode(data: typing.Iterator[WordGroup]) -> bytes:
+def mnparse_int(
+    string: str, word_separator: str="-", group_separator: str="--",
+) -> int:
+    ...
+
+
+def mndecode(
+    data: typing.Iterator[WordGroup], abbreviated: bool=False,
+    correct: bool=False,
+) -> bytes:
     ...
 
 
 def mnparse(
     string: str, word_separator: str="-", group_separator: str="--",
+    abbreviated: bool=False, correct: bool=False, normalize: bool=False,
 ) -> bytes:
     ...
+
+
+def mndecode_into(
+    data: typing.Iterator[WordGroup], buffer: BytesLike,
+    abbreviated: bool=False, correct: bool=False,
+) -> int:
+    ...
+
+
+def mnparse_into(
+    string: str, buffer: BytesLike,
+    word_separator: str="-", group_separator: str="--",
+    abbreviated: bool=False, correct: bool=False, normalize: bool=False,
+) -> int:
+    ...
+
+
+def encoded_length(
+    data: BytesLike, word_separator: str="-", group_separator: str="--",
+) -> int:
+    ...
+
+
+def max_encoded_length(
+    length: int, word_separator: str="-", group_separator: str="--",
+) -> int:
+    ...
+
+
+def decoded_length(
+    string: str, word_separator: str="-", group_separator: str="--",
+) -> int:
+    ...
+
+
+class Codec(object):
+    def __init__(
+        self, wordlist: typing.Optional[typing.Sequence[str]]=None,
+        word_separator: str="-", group_separator: str="--",
+    ) -> None:
+        ...
+
+    @property
+    def wordlist(self) -> typing.Tuple[str, ...]:
+        ...
+
+    @property
+    def word_separator(self) -> str:
+        ...
+
+    @property
+    def group_separator(self) -> str:
+        ...
+
+    def encode(self, data: BytesLike) -> typing.Iterator[WordGroup]:
+        ...
+
+    def format(self, data: BytesLike) -> str:
+        ...
+
+    def format_to(
+        self, data: BytesLike, sink: typing.Union[bytearray, typing.BinaryIO],
+    ) -> int:
+        ...
+
+    def decode(
+        self, data: typing.Iterable[WordGroup], abbreviated: bool=False,
+        correct: bool=False,
+    ) -> bytes:
+        ...
+
+    def parse(
+        self, string: str, abbreviated: bool=False, correct: bool=False,
+    ) -> bytes:
+        ...
+
+    def complete(self, prefix: str) -> typing.List[str]:
+        ...
+
+    def correct(
+        self, string: str,
+    ) -> typing.Tuple[str, typing.List['Correction']]:
+        ...
+
+
+def complete(prefix: str) -> typing.List[str]:
+    ...
+
+
+class Correction(typing.NamedTuple):
+    position: int
+    word: str
+    replacement: str
+
+
+def mncorrect(
+    string: str, word_separator: str="-", group_separator: str="--",
+) -> typing.Tuple[str, typing.List[Correction]]:
+    ...
+
+
+class ParseFailure(typing.NamedTuple):
+    index: int  # type: ignore
+    position: int
+    reason: str
+
+
+def mnparse_many(
+    strings: typing.Iterable[str],
+    word_separator: str="-", group_separator: str="--",
+    errors: str="raise",
+) -> typing.Tuple[
+    typing.List[typing.Optional[bytes]], typing.List[ParseFailure],
+]:
+    ...
+
+
+def mniterparse(
+    source: typing.Union[typing.TextIO, typing.Iterable[str]],
+    word_separator: str="-", group_separator: str="--",
+    chunk_size: int=65536, abbreviated: bool=False, correct: bool=False,
+) -> typing.Iterator[bytes]:
+    ...
+
+
+class DecodingReader(io.RawIOBase):
+    def __init__(
+        self, source: typing.Union[typing.TextIO, typing.Iterable[str]],
+        word_separator: str="-", group_separator: str="--",
+    ) -> None:
+        ...
+
+
+class SeekableDecodingReader(io.RawIOBase):
+    def __init__(
+        self, source: typing.BinaryIO,
+        word_separator: str="-", group_separator: str="--",
+        index_interval: int=64,
+    ) -> None:
+        ...
+
+
+class Occurrence(typing.NamedTuple):
+    offset: int
+    length: int
+    data: bytes
+
+
+def mnfind(
+    source: typing.Union[str, typing.TextIO, typing.Iterable[str]],
+    word_separator: str="-", group_separator: str="--", min_length: int=4,
+    chunk_size: int=65536,
+) -> typing.Iterator[Occurrence]:
+    ...
+
+
+class CacheInfo(typing.NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class CacheStatistics(typing.NamedTuple):
+    encode: CacheInfo
+    decode: CacheInfo
+
+
+def enable_cache(maxsize: int=4096) -> None:
+    ...
+
+
+def disable_cache() -> None:
+    ...
+
+
+def cache_info() -> typing.Optional[CacheStatistics]:
+    ...
@@ -0,0 +1,733 @@
+import argparse
+import binascii
+import codecs
+import functools
+import io
+import mmap
+import os
+import sys
+
+from mnemonicode import (
+    _StreamFormatter, mnfind, mnformat, mnformat_many, mniterparse, mnparse,
+    mnparse_many,
+)
+from mnemonicode._utils import chunk_sequence
+
+
+def _buffer_size(value):
+    # Rounds buffer sizes down to a whole number of blocks.
+    size = int(value) // 4 * 4
+    if size <= 0:
+        raise argparse.ArgumentTypeError(
+            "buffer size must be at least four bytes"
+        )
+    return size
+
+
+def _iter_mapping(mapping, offset, size):
+    # Pages that have already been consumed are dropped from the mapping
+    # where the platform allows it, so that resident memory stays bounded by
+    # the chunk size rather than growing to the size of the file.  They are
+    # still in the page cache, and would be faulted back in if touched again.
+    madvise = getattr(mapping, 'madvise', None)
+    released = 0
+    for chunk in chunk_sequence(memoryview(mapping)[offset:], size):
+        yield chunk
+        offset += len(chunk)
+        end = offset - offset % mmap.PAGESIZE
+        if madvise is not None and end > released:
+            madvise(mmap.MADV_DONTNEED, released, end - released)
+            released = end
+
+
+def _iter_input(file, size):
+    # Returns an iterator over the contents of a binary file in chunks of
+    # `size` bytes.  Regular files are memory mapped, so that each chunk is a
+    # view of the page cache rather than a copy.  Anything that can't be
+    # mapped, such as a pipe or an empty file, is read normally.
+    try:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        offset = file.tell()
+    except (OSError, ValueError):
+        return iter(functools.partial(file.read, size), b'')
+    return _iter_mapping(mapping, offset, size)
+
+
+def _iter_text_input(file, size):
+    # Text equivalent of `_iter_input`.  Bytes are decoded, and newlines
+    # translated, in the same way as reading from `file` directly.
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(file.encoding)(file.errors),
+        translate=True,
+    )
+    for chunk in _iter_input(file.buffer, size):
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    text = decoder.decode(b'', final=True)
+    if text:
+        yield text
+
+
+def _strip_chunks(chunks):
+    # Strips leading and trailing whitespace from a stream of text.
+    # Whitespace at the end of a chunk is held back until it is known whether
+    # anything follows it.
+    started = False
+    trailing = ''
+    for chunk in chunks:
+        if not started:
+            chunk = chunk.lstrip()
+            if not chunk:
+                continue
+            started = True
+
+        stripped = chunk.rstrip()
+        if stripped:
+            yield trailing + stripped
+            trailing = chunk[len(stripped):]
+        else:
+            trailing += chunk
+
+
+def _split_group_chunks(chunks, group_separator):
+    # Re-splits a stream of text so that each chunk contains only whole
+    # groups, and can be decoded independently.  Chunks are never empty, and
+    # the separator at the end of the text is never split off, so the
+    # concatenated output fails in the same places as the serial parser.
+    pending = ''
+    for chunk in chunks:
+        pending += chunk
+        index = pending.rfind(
+            group_separator, 0, len(pending) - len(group_separator),
+        )
+        if index > 0:
+            yield pending[:index]
+            pending = pending[index + len(group_separator):]
+    if pending:
+        yield pending
+
+
+def _map_jobs(func, iterable, jobs):
+    # `concurrent.futures` is slow to import, so it is only loaded if more
+    # than one job is requested.
+    if jobs == 1:
+        return map(func, iterable)
+
+    from mnemonicode.parallel import _ordered_map
+    return _ordered_map(func, iterable, jobs)
+
+
+def _jobs(value):
+    # Zero means one process per processor.
+    value = int(value)
+    if value < 0:
+        raise argparse.ArgumentTypeError("must not be negative")
+    return value or None
+
+
+def _add_jobs_argument(parser):
+    parser.add_argument(
+        '-j', '--jobs', type=_jobs, default=1,
+        help=(
+            "Number of processes to use.  Each chunk of --buffer-size is "
+            "converted independently, so larger buffers reduce overhead.  "
+            "Pass 0 to use one per processor.  Defaults to 1."
+        )
+    )
+
+
+def _add_record_arguments(parser):
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        '-l', '--lines', dest='delimiter', action='store_const', const='\n',
+        help=(
+            "Treat each line of input as a separate record, and write one "
+            "line of output for each."
+        )
+    )
+    group.add_argument(
+        '-0', '--null', dest='delimiter', action='store_const', const='\0',
+        help=(
+            "Treat each NUL terminated chunk of input as a separate record, "
+            "and write one NUL terminated record of output for each."
+        )
+    )
+
+
+def _iter_record_batches(chunks, delimiter):
+    # Splits a stream, read in chunks, into batches of records.  The last
+    # record doesn't need to be terminated.
+    pending = delimiter[:0]
+    for chunk in chunks:
+        records = (pending + chunk).split(delimiter)
+        pending = records.pop()
+        if records:
+            yield records
+    if pending:
+        yield [pending]
+
+
+def _format_records(records, word_separator, group_separator, delimiter):
+    # Encodes a batch of records as a single string, terminating every record
+    # including the last.
+    strings = list(mnformat_many(
+        records, word_separator=word_separator,
+        group_separator=group_separator,
+    ))
+    strings.append('')
+    return delimiter.join(strings)
+
+
+def _parse_records(records, word_separator, group_separator, abbreviated):
+    # Decodes a batch of records, returning either the decoded data, or a
+    # string describing why it couldn't be decoded, for each one.
+    records = [record.strip() for record in records]
+    if not abbreviated:
+        results, failures = mnparse_many(
+            records, word_separator=word_separator,
+            group_separator=group_separator, errors='collect',
+        )
+        for failure in failures:
+            results[failure.index] = (
+                "{reason} (position {position})"
+            ).format(reason=failure.reason, position=failure.position)
+        return results
+
+    results = []
+    for record in records:
+        try:
+            results.append(mnparse(
+                record, word_separator=word_separator,
+                group_separator=group_separator, abbreviated=True,
+            ))
+        except ValueError as e:
+            results.append(str(e))
+    return results
+
+
+def _positive_int(value):
+    value = int(value)
+    if value <= 0:
+        raise argparse.ArgumentTypeError("must be a positive integer")
+    return value
+
+
+def mnencode_main():  # pragma: no cover
+    # `mndecode` is tested by executing in a separate process.
+    # This means that tests for it don't get noticed by the coverage tracker.
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '-w', '--word-separator', type=str, default='-',
+        help=(
+            "String used to separate individual words within a group.  "
+            "Defaults to \"-\""
+        )
+    )
+    parser.add_argument(
+        '-g', '--group-separator', type=str, default='--',
+        help=(
+            "String used to separate the groups of words representing four "
+            "byte blocks.  Defaults to \"--\""
+        )
+    )
+    parser.add_argument(
+        '-o', '--output', type=argparse.FileType('w'), default=sys.stdout,
+        help=(
+            "Where to write the encoded output.  This should be the path to a "
+            "file, or \"-\" to indicate stdout.  Defaults to stdout."
+        )
+    )
+    parser.add_argument(
+        '-b', '--buffer-size', type=_buffer_size, default=65536,
+        help=(
+            "Number of bytes of input to read and encode at a time.  Rounded "
+            "down to a multiple of four.  Defaults to 65536."
+        )
+    )
+    _add_jobs_argument(parser)
+    _add_record_arguments(parser)
+    parser.add_argument(
+        'input', nargs='?',
+        type=argparse.FileType('rb'), default=sys.stdin.buffer,
+        help=(
+            "Optionally specify a the location of a file to read from.  "
+            "Passing \"-\" indicates that the default, stdin, should be used."
+        )
+    )
+    args = parser.parse_args()
+
+    if args.delimiter is not None:
+        # Each batch of records is written with a single call.
+        batches = _iter_record_batches(
+            _iter_input(args.input, args.buffer_size),
+            args.delimiter.encode('ascii'),
+        )
+        encode = functools.partial(
+            _format_records, word_separator=args.word_separator,
+            group_separator=args.group_separator, delimiter=args.delimiter,
+        )
+        for string in _map_jobs(encode, batches, args.jobs):
+            args.output.write(string)
+            args.output.flush()
+        return
+
+    if args.jobs != 1:
+        # Every chunk except the last is a whole number of blocks, so the
+        # encoded chunks just need to be joined with a group separator.
+        # Views of the input can't be sent to other processes.
+        chunks = map(bytes, _iter_input(args.input, args.buffer_size))
+        encode = functools.partial(
+            mnformat, word_separator=args.word_separator,
+            group_separator=args.group_separator,
+        )
+        for index, string in enumerate(
+            _map_jobs(encode, chunks, args.jobs)
+        ):
+            if index:
+                args.output.write(args.group_separator)
+            args.output.write(string)
+            args.output.flush()
+        return
+
+    formatter = _StreamFormatter(
+        word_separator=args.word_separator,
+        group_separator=args.group_separator,
+    )
+    for data in _iter_input(args.input, args.buffer_size):
+        args.output.write(formatter.feed(data))
+        args.output.flush()
+    args.output.write(formatter.feed(b'', final=True))
+
+
+def mndecode_main():  # pragma: no cover
+    # `mndecode` is tested by executing in a separate process.
+    # This means that tests for it don't get noticed by the coverage tracker.
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '-w', '--word-separator', type=str, default='-',
+        help=(
+            "String used to separate individual words within a group.  "
+            "Defaults to \"-\""
+        )
+    )
+    parser.add_argument(
+        '-g', '--group-separator', type=str, default='--',
+        help=(
+            "String used to separate the groups of words representing four "
+            "byte blocks.  Defaults to \"--\""
+        )
+    )
+    parser.add_argument(
+        '-o', '--output',
+        type=argparse.FileType('wb'), default=sys.stdout.buffer,
+        help=(
+            "Where to write the decoded output.  This should be the path to a "
+            "file, or \"-\" to indicate stdout.  Defaults to stdout."
+        )
+    )
+    parser.add_argument(
+        '-b', '--buffer-size', type=_positive_int, default=65536,
+        help=(
+            "Number of characters of input to read and decode at a time.  "
+            "Defaults to 65536."
+        )
+    )
+    parser.add_argument(
+        '-a', '--abbreviated', action='store_true',
+        help=(
+            "Accept words abbreviated to any prefix that only matches a "
+            "single word in the wordlist."
+        )
+    )
+    _add_jobs_argument(parser)
+    _add_record_arguments(parser)
+    parser.add_argument(
+        '-e', '--errors', choices=['fail', 'skip', 'marker'],
+        help=(
+            "What to do with records that can't be decoded.  \"fail\" stops "
+            "with an error, \"skip\" leaves them out of the output, and "
+            "\"marker\" writes the marker in their place.  Only valid with "
+            "--lines or --null.  Defaults to \"fail\"."
+        )
+    )
+    parser.add_argument(
+        '-m', '--marker', type=str, default='',
+        help=(
+            "Record to write in place of records that can't be decoded when "
+            "using \"--errors marker\".  Defaults to an empty record."
+        )
+    )
+    parser.add_argument(
+        'input', nargs='?', type=argparse.FileType('r'), default=sys.stdin,
+        help=(
+            "Optionally specify a the location of a file to read from.  "
+            "Passing \"-\" indicates that the default, stdin, should be used."
+        )
+    )
+    args = parser.parse_args()
+
+    if args.delimiter is None:
+        if args.errors is not None:
+            parser.error("--errors requires --lines or --null")
+    else:
+        _decode_records(parser, args)
+        return
+
+    chunks = _strip_chunks(_iter_text_input(args.input, args.buffer_size))
+    if args.jobs != 1 and args.group_separator not in args.word_separator:
+        decode = functools.partial(
+            mnparse, word_separator=args.word_separator,
+            group_separator=args.group_separator,
+            abbreviated=args.abbreviated,
+        )
+        chunks = _map_jobs(
+            decode, _split_group_chunks(chunks, args.group_separator),
+            args.jobs,
+        )
+    else:
+        chunks = mniterparse(
+            chunks,
+            word_separator=args.word_separator,
+            group_separator=args.group_separator,
+            abbreviated=args.abbreviated,
+        )
+    for data in chunks:
+        args.output.write(data)
+        args.output.flush()
+
+
+def _decode_records(parser, args):  # pragma: no cover
+    delimiter = args.delimiter.encode('ascii')
+    marker = args.marker.encode('utf-8')
+    errors = args.errors or 'fail'
+
+    batches = _iter_record_batches(
+        _iter_text_input(args.input, args.buffer_size), args.delimiter,
+    )
+    decode = functools.partial(
+        _parse_records, word_separator=args.word_separator,
+        group_separator=args.group_separator, abbreviated=args.abbreviated,
+    )
+    number = 0
+    for results in _map_jobs(decode, batches, args.jobs):
+        # Each batch of records is written with a single call, terminating
+        # every record including the last.
+        output = []
+        for data in results:
+            number += 1
+            if isinstance(data, str):
+                if errors == 'fail':
+                    if output:
+                        output.append(b'')
+                        args.output.write(delimiter.join(output))
+                    args.output.flush()
+                    parser.exit(1, (
+                        "{prog}: record {number}: {reason}\n"
+                    ).format(prog=parser.prog, number=number, reason=data))
+                if errors == 'skip':
+                    continue
+                data = marker
+            output.append(data)
+
+        if output:
+            output.append(b'')
+            args.output.write(delimiter.join(output))
+            args.output.flush()
+
+
+def mnfind_main():  # pragma: no cover
+    # `mnfind` is tested by executing in a separate process.
+    # This means that tests for it don't get noticed by the coverage tracker.
+    parser = argparse.ArgumentParser(
+        description=(
+            "Find runs of mnemonicode in text.  Prints the byte offset and "
+            "length of each run, followed by the decoded data in hex, "
+            "separated by tabs."
+        ),
+    )
+    parser.add_argument(
+        '-w', '--word-separator', type=str, default='-',
+        help=(
+            "String used to separate individual words within a group.  "
+            "Defaults to \"-\""
+        )
+    )
+    parser.add_argument(
+        '-g', '--group-separator', type=str, default='--',
+        help=(
+            "String used to separate the groups of words representing four "
+            "byte blocks.  Defaults to \"--\""
+        )
+    )
+    parser.add_argument(
+        '-m', '--min-length', type=_positive_int, default=4,
+        help=(
+            "Ignore runs that decode to fewer than this many bytes.  "
+            "Defaults to 4."
+        )
+    )
+    parser.add_argument(
+        '-o', '--output', type=argparse.FileType('w'), default=sys.stdout,
+        help=(
+            "Where to write the results.  This should be the path to a file, "
+            "or \"-\" to indicate stdout.  Defaults to stdout."
+        )
+    )
+    parser.add_argument(
+        '-b', '--buffer-size', type=_positive_int, default=1 << 20,
+        help=(
+            "Number of bytes of input to read and search at a time.  "
+            "Defaults to 1048576."
+        )
+    )
+    parser.add_argument(
+        'input', nargs='?', type=argparse.FileType('rb'),
+        default=sys.stdin.buffer,
+        help=(
+            "Optionally specify a the location of a file to read from.  "
+            "Passing \"-\" indicates that the default, stdin, should be used."
+        )
+    )
+    args = parser.parse_args()
+
+    # Input is decoded as latin-1 so that any byte sequence is accepted, and
+    # so that character offsets are also byte offsets.  Mnemonicode is pure
+    # ASCII, so runs are still found in UTF-8 or any other ASCII compatible
+    # encoding.
+    chunks = (
+        str(chunk, 'latin-1')
+        for chunk in _iter_input(args.input, args.buffer_size)
+    )
+    try:
+        for occurrence in mnfind(
+            chunks,
+            word_separator=args.word_separator,
+            group_separator=args.group_separator,
+            min_length=args.min_length,
+        ):
+            args.output.write("{offset}\t{length}\t{data}\n".format(
+                offset=occurrence.offset, length=occurrence.length,
+                data=binascii.hexlify(occurrence.data).decode('ascii'),
+            ))
+    except ValueError as e:
+        parser.error(str(e))
+
+
+def _add_address_arguments(parser):
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument(
+        '-s', '--socket', type=str,
+        help="Path of the Unix domain socket to use.",
+    )
+    group.add_argument(
+        '-p', '--port', type=int,
+        help="TCP port to use.",
+    )
+    parser.add_argument(
+        '--host', type=str, default='127.0.0.1',
+        help=(
+            "Address to use with --port.  Defaults to 127.0.0.1."
+        )
+    )
+
+
+def _format_statistics(statistics):
+    return (
+        "requests={requests} errors={errors} batches={batches} "
+        "throughput={throughput:.1f}/s mean_latency={mean:.3f}ms "
+        "max_latency={max:.3f}ms"
+    ).format(
+        requests=statistics.requests, errors=statistics.errors,
+        batches=statistics.batches, throughput=statistics.throughput,
+        mean=statistics.mean_latency * 1000,
+        max=statistics.max_latency * 1000,
+    )
+
+
+def _serve(parser, args):  # pragma: no cover
+    # Imported here as the server module requires a newer version of python
+    # than the rest of the library.
+    import asyncio
+    import signal
+
+    from mnemonicode.server import Server
+
+    try:
+        server = Server(
+            word_separator=args.word_separator,
+            group_separator=args.group_separator,
+            max_batch_size=args.max_batch_size,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        if args.socket is not None:
+            loop.run_until_complete(server.start_unix(args.socket))
+        else:
+            loop.run_until_complete(server.start_tcp(args.host, args.port))
+    except OSError as e:
+        parser.exit(1, "{prog}: {reason}\n".format(
+            prog=parser.prog, reason=e,
+        ))
+
+    address = server.sockets[0].getsockname()
+    if not isinstance(address, str):
+        address = "{host}:{port}".format(host=address[0], port=address[1])
+    sys.stderr.write("listening on {address}\n".format(address=address))
+    sys.stderr.flush()
+
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, loop.stop)
+        except (NotImplementedError, RuntimeError):
+            # Windows doesn't support signal handlers in the event loop, but
+            # still raises `KeyboardInterrupt` on ctrl-c.
+            pass
+
+    def report():
+        sys.stderr.write(_format_statistics(server.statistics()) + "\n")
+        sys.stderr.flush()
+        loop.call_later(args.stats_interval, report)
+
+    if args.stats_interval is not None:
+        loop.call_later(args.stats_interval, report)
+
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        loop.run_until_complete(server.wait_closed())
+        loop.close()
+        if args.socket is not None:
+            try:
+                os.unlink(args.socket)
+            except OSError:
+                pass
+
+    sys.stderr.write(_format_statistics(server.statistics()) + "\n")
+
+
+def _client(parser, args):  # pragma: no cover
+    from mnemonicode.server import Client
+
+    try:
+        client = Client(
+            path=args.socket, host=args.host, port=args.port,
+            timeout=args.timeout,
+        )
+    except OSError as e:
+        parser.exit(1, "{prog}: {reason}\n".format(
+            prog=parser.prog, reason=e,
+        ))
+
+    with client:
+        try:
+            if args.command == 'encode':
+                string = client.encode(args.input.read())
+                args.output.write(string.encode('utf-8'))
+            elif args.command == 'decode':
+                data = client.decode(
+                    args.input.read().decode('utf-8').strip(),
+                )
+                args.output.write(data)
+            else:
+                args.output.write(
+                    _format_statistics(client.statistics()).encode('ascii') +
+                    b"\n"
+                )
+        except ValueError as e:
+            parser.exit(1, "{prog}: {reason}\n".format(
+                prog=parser.prog, reason=e,
+            ))
+
+
+def mnemonicode_main():  # pragma: no cover
+    # `mnemonicode` is tested by executing in a separate process.
+    # This means that tests for it don't get noticed by the coverage tracker.
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest='mode')
+
+    serve_parser = subparsers.add_parser(
+        'serve', help="Run a server that encodes and decodes requests.",
+        description=(
+            "Run a server that encodes and decodes requests sent over a "
+            "socket, one per line.  See the documentation of "
+            "mnemonicode.server for the protocol."
+        ),
+    )
+    _add_address_arguments(serve_parser)
+    serve_parser.add_argument(
+        '-w', '--word-separator', type=str, default='-',
+        help=(
+            "String used to separate individual words within a group.  "
+            "Defaults to \"-\""
+        )
+    )
+    serve_parser.add_argument(
+        '-g', '--group-separator', type=str, default='--',
+        help=(
+            "String used to separate the groups of words representing four "
+            "byte blocks.  Defaults to \"--\""
+        )
+    )
+    serve_parser.add_argument(
+        '--max-batch-size', type=_positive_int, default=1024,
+        help=(
+            "Maximum number of requests to convert together.  Defaults to "
+            "1024."
+        )
+    )
+    serve_parser.add_argument(
+        '--stats-interval', type=float,
+        help=(
+            "Print statistics to stderr every this many seconds.  Statistics "
+            "are always printed when the server stops."
+        )
+    )
+
+    client_parser = subparsers.add_parser(
+        'client', help="Send a single request to a running server.",
+        description=(
+            "Send a single request to a running server.  \"encode\" and "
+            "\"decode\" convert the whole of the input, and \"stats\" prints "
+            "statistics for the server."
+        ),
+    )
+    _add_address_arguments(client_parser)
+    client_parser.add_argument(
+        '-t', '--timeout', type=float,
+        help="Number of seconds to wait for the server.",
+    )
+    client_parser.add_argument(
+        '-o', '--output',
+        type=argparse.FileType('wb'), default=sys.stdout.buffer,
+        help=(
+            "Where to write the result.  This should be the path to a file, "
+            "or \"-\" to indicate stdout.  Defaults to stdout."
+        )
+    )
+    client_parser.add_argument(
+        'command', choices=['encode', 'decode', 'stats'],
+    )
+    client_parser.add_argument(
+        'input', nargs='?', type=argparse.FileType('rb'),
+        default=sys.stdin.buffer,
+        help=(
+            "Optionally specify a the location of a file to read from.  "
+            "Passing \"-\" indicates that the default, stdin, should be used."
+        )
+    )
+    args = parser.parse_args()
+
+    if args.mode == 'serve':
+        _serve(serve_parser, args)
+    elif args.mode == 'client':
+        _client(client_parser, args)
+    else:
+        parser.error("expected a command, either serve or client")
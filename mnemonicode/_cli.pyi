@@ -0,0 +1,14 @@
+def mnencode_main() -> None:
+    ...
+
+
+def mndecode_main() -> None:
+    ...
+
+
+def mnfind_main() -> None:
+    ...
+
+
+def mnemonicode_main() -> None:
+    ...
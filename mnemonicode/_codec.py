@@ -0,0 +1,159 @@
+"""The ``mnemonicode`` codec.
+
+Encoding converts binary data to mnemonicode text, and decoding converts it
+back, so this is not a text encoding in the sense of :meth:`str.encode`.  It
+is registered when :mod:`mnemonicode` is imported and can be used with
+:func:`codecs.encode`, :func:`codecs.decode`, :func:`codecs.iterencode`,
+:func:`codecs.iterdecode`, :func:`codecs.getwriter` and
+:func:`codecs.getreader`.
+
+Stream writers and readers can wrap either text or binary streams.  Binary
+streams are written and read as ASCII.
+"""
+import codecs
+import io
+
+from mnemonicode import _StreamFormatter, _StreamParser, mnformat, mnparse
+
+
+def _is_binary(stream):
+    return isinstance(stream, (io.RawIOBase, io.BufferedIOBase))
+
+
+def _check_errors(errors):
+    if errors != 'strict':
+        raise ValueError((
+            "unsupported error handling scheme: {errors!r}"
+        ).format(errors=errors))
+
+
+def mnemonicode_encode(input, errors='strict'):
+    _check_errors(errors)
+    return mnformat(input), len(input)
+
+
+def mnemonicode_decode(input, errors='strict'):
+    _check_errors(errors)
+    return mnparse(input), len(input)
+
+
+class Codec(codecs.Codec):
+    def encode(self, input, errors='strict'):
+        return mnemonicode_encode(input, errors)
+
+    def decode(self, input, errors='strict'):
+        return mnemonicode_decode(input, errors)
+
+
+class IncrementalEncoder(codecs.IncrementalEncoder):
+    def __init__(self, errors='strict'):
+        _check_errors(errors)
+        super().__init__(errors)
+        self._formatter = _StreamFormatter()
+
+    def encode(self, input, final=False):
+        # `codecs.iterencode` finishes by passing an empty string, not empty
+        # bytes.
+        return self._formatter.feed(input or b'', final=final)
+
+    def reset(self):
+        self._formatter = _StreamFormatter()
+
+
+class IncrementalDecoder(codecs.IncrementalDecoder):
+    def __init__(self, errors='strict'):
+        _check_errors(errors)
+        super().__init__(errors)
+        self._parser = _StreamParser()
+
+    def decode(self, input, final=False):
+        # `codecs.iterdecode` finishes by passing empty bytes, not an empty
+        # string.
+        return self._parser.feed(input or '', final=final)
+
+    def reset(self):
+        self._parser = _StreamParser()
+
+
+class StreamWriter(Codec, codecs.StreamWriter):
+    # Partial blocks are held back until more data is written, or until the
+    # writer is reset or closed.
+    def __init__(self, stream, errors='strict'):
+        _check_errors(errors)
+        super().__init__(stream, errors)
+        self._formatter = _StreamFormatter()
+
+    def _write_text(self, text):
+        if text:
+            if _is_binary(self.stream):
+                text = text.encode('ascii')
+            self.stream.write(text)
+
+    def write(self, object):
+        self._write_text(self._formatter.feed(object))
+
+    def writelines(self, list):
+        # The inherited implementation joins with an empty string, but the
+        # input here is binary.
+        self.write(b''.join(list))
+
+    def reset(self):
+        # Data written after a reset is appended to the same string, so the
+        # formatter keeps track of whether a group separator is needed.
+        self._write_text(self._formatter.feed(b'', final=True))
+
+    def close(self):
+        self.reset()
+        self.stream.close()
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+
+class StreamReader(Codec, codecs.StreamReader):
+    charbuffertype = bytes
+
+    def __init__(self, stream, errors='strict'):
+        _check_errors(errors)
+        super().__init__(stream, errors)
+        self._parser = _StreamParser()
+        self._finished = False
+
+    def read(self, size=-1, chars=-1, firstline=False):
+        if chars < 0:
+            chars = size
+
+        while not self._finished and (
+            chars < 0 or len(self.charbuffer) < chars
+        ):
+            text = self.stream.read() if size < 0 else self.stream.read(size)
+            if isinstance(text, (bytes, bytearray)):
+                text = text.decode('ascii')
+            self._finished = not text
+            self.charbuffer += self._parser.feed(text, final=not text)
+
+        if chars < 0:
+            result = self.charbuffer
+            self.charbuffer = self._empty_charbuffer
+        else:
+            result = self.charbuffer[:chars]
+            self.charbuffer = self.charbuffer[chars:]
+        return result
+
+    def reset(self):
+        super().reset()
+        self._parser = _StreamParser()
+        self._finished = False
+
+
+def getregentry():
+    return codecs.CodecInfo(
+        name='mnemonicode',
+        encode=mnemonicode_encode,
+        decode=mnemonicode_decode,
+        incrementalencoder=IncrementalEncoder,
+        incrementaldecoder=IncrementalDecoder,
+        streamwriter=StreamWriter,
+        streamreader=StreamReader,
+        _is_text_encoding=False,
+    )
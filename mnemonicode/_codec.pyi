@@ -0,0 +1,50 @@
+import codecs
+import typing
+
+from mnemonicode import BytesLike
+
+
+def mnemonicode_encode(
+    input: BytesLike, errors: str='strict',
+) -> typing.Tuple[str, int]:
+    ...
+
+
+def mnemonicode_decode(
+    input: str, errors: str='strict',
+) -> typing.Tuple[bytes, int]:
+    ...
+
+
+class Codec(codecs.Codec):
+    ...
+
+
+class IncrementalEncoder(codecs.IncrementalEncoder):
+    def encode(  # type: ignore
+        self, input: BytesLike, final: bool=False,
+    ) -> str:
+        ...
+
+
+class IncrementalDecoder(codecs.IncrementalDecoder):
+    def decode(  # type: ignore
+        self, input: str, final: bool=False,
+    ) -> bytes:
+        ...
+
+
+class StreamWriter(Codec, codecs.StreamWriter):
+    def writelines(self, list: typing.Iterable[bytes]) -> None:  # type: ignore
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class StreamReader(Codec, codecs.StreamReader):
+    ...
+
+
+def getregentry() -> codecs.CodecInfo:
+    ...
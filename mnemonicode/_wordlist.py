@@ -20,7 +20,6 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 # -----END ORIGINAL LICENSE-----
-
 _WORDLIST = [
     "academy",  "acrobat",  "active",   "actor",    "adam",     "admiral",
     "adrian",   "africa",   "agenda",   "agent",    "airline",  "airport",
@@ -297,9 +296,40 @@ _WORDLIST = [
     "yes"
 ]
 
-_WORD_INDECES = {
-    word: index for index, word in enumerate(_WORDLIST)
-}
+_WORD_COUNT = len(_WORDLIST)
+
+# Length of each word, indexed in the same way as the wordlist.
+_WORD_LENGTHS = bytes(map(len, _WORDLIST))
+
+_MAX_WORD_LENGTH = max(_WORD_LENGTHS)
+
+# Every character that appears in a word.
+_WORD_CHARACTERS = ''.join(sorted(set(''.join(_WORDLIST))))
+
+# Mapping from words back to their indices.  This is only needed for decoding
+# so is built on first use, rather than on import, by `_word_indices`.
+_WORD_INDECES = None
+
+
+def _word_indices():
+    global _WORD_INDECES
+    if _WORD_INDECES is None:
+        _WORD_INDECES = {
+            word: index for index, word in enumerate(_WORDLIST)
+        }
+    return _WORD_INDECES
+
+
+# The words encoded as ASCII, for writing straight to binary outputs.  Only
+# built on first use, by `_word_bytes`.
+_WORD_BYTES = None
+
+
+def _word_bytes():
+    global _WORD_BYTES
+    if _WORD_BYTES is None:
+        _WORD_BYTES = [word.encode('ascii') for word in _WORDLIST]
+    return _WORD_BYTES
 
 
 def index_to_word(index):
@@ -307,4 +337,96 @@ def index_to_word(index):
 
 
 def word_to_index(word):
-    return _WORD_INDECES[word]
+    try:
+        return _word_indices()[word]
+    except TypeError:
+        raise KeyError(word) from None
+
+
+# Prefix tries over a wordlist are used to expand abbreviated words and to
+# list completions.  Each node is a pair of a dict mapping the next character
+# to a child node, and a sorted tuple of every word starting with the prefix
+# that the node represents.  Children that only lead to a single word are
+# replaced by the word itself, so the trie is never deeper than the longest
+# prefix shared by two words.  Each codec builds its own on first use.
+def _trie_node(words, depth):
+    groups = {}
+    for word in words:
+        if len(word) > depth:
+            groups.setdefault(word[depth], []).append(word)
+
+    children = {}
+    for char, group in groups.items():
+        if len(group) == 1:
+            children[char] = group[0]
+        else:
+            children[char] = _trie_node(group, depth + 1)
+    return (children, tuple(words))
+
+
+def _make_prefix_trie(words):
+    return _trie_node(sorted(words), 0)
+
+
+def _complete(trie, prefix):
+    # Returns a tuple of all words in `trie` starting with `prefix`.  Takes
+    # time proportional to the length of the prefix, not the number of words.
+    node = trie
+    for char in prefix:
+        node = node[0].get(char)
+        if node is None:
+            return ()
+        if isinstance(node, str):
+            return (node,) if node.startswith(prefix) else ()
+    return node[1]
+
+
+# Deletion neighbourhood indices are used to correct mistyped words.  They map
+# each word, and every string that can be made by deleting a single character
+# from it, to a tuple of the indices of the words it came from.  Two strings
+# are within a single insertion, deletion, substitution or transposition of
+# each other only if their neighbourhoods intersect, so candidates for a
+# correction can be found with a handful of lookups rather than by comparing
+# against every word.  Each codec builds its own on first use.
+def _neighbourhood(word):
+    return {word} | {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+def _make_correction_index(words):
+    index = {}
+    for word_index, word in enumerate(words):
+        for key in _neighbourhood(word):
+            index[key] = index.get(key, ()) + (word_index,)
+    return index
+
+
+def _single_edit(a, b):
+    # Returns true if `a` and `b` differ by exactly one insertion, deletion,
+    # substitution or transposition of adjacent characters.
+    if len(a) > len(b):
+        a, b = b, a
+    if len(b) - len(a) > 1 or a == b:
+        return False
+
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+
+    if len(a) < len(b):
+        return a[i:] == b[i + 1:]
+    return a[i + 1:] == b[i + 1:] or (
+        a[i + 2:] == b[i + 2:] and a[i] == b[i + 1] and a[i + 1] == b[i]
+    )
+
+
+def _correct(index, words, word):
+    # Returns a sorted tuple of all words a single edit away from `word`,
+    # using the correction index built for `words`.
+    candidates = set()
+    for key in _neighbourhood(word):
+        candidates.update(index.get(key, ()))
+
+    return tuple(sorted(
+        words[candidate] for candidate in candidates
+        if _single_edit(word, words[candidate])
+    ))
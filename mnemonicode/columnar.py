@@ -0,0 +1,145 @@
+"""Bulk conversions between columns of records and mnemonicode strings.
+
+Columns are stored in the layout used by Apache Arrow for variable width
+binary and string arrays: a single data buffer containing every value back to
+back, plus an offsets array of length ``N + 1`` where value ``i`` occupies
+``data[offsets[i]:offsets[i + 1]]``.  Offsets are stored in an
+:class:`array.array` of 32 bit integers, or 64 bit integers if ``large`` is
+set, matching Arrow's ``string`` and ``large_string`` types respectively.
+
+The buffers can be passed to Arrow without copying, for example::
+
+    offsets, data = encode_column(records)
+    strings = pyarrow.StringArray.from_buffers(
+        len(offsets) - 1, pyarrow.py_buffer(offsets), pyarrow.py_buffer(data),
+    )
+"""
+import array
+
+from mnemonicode import _byte_view, _indices_to_block, _iter_indices
+from mnemonicode._wordlist import _word_bytes
+
+# Equivalent of `_wordlist._WORD_INDECES` for looking up encoded words.  Built
+# on first use by `_bytes_indices`.
+_BYTES_INDICES = None
+
+
+def _bytes_indices():
+    global _BYTES_INDICES
+    if _BYTES_INDICES is None:
+        _BYTES_INDICES = {
+            word: index for index, word in enumerate(_word_bytes())
+        }
+    return _BYTES_INDICES
+
+
+def _offsets_array(large):
+    return array.array('q' if large else 'i', [0])
+
+
+def encode_column(
+    records, word_separator="-", group_separator="--", large=False,
+):
+    """Encode a column of binary records into a single buffer of mnemonicode
+    strings.
+
+    >>> offsets, data = encode_column([b"fig", b"", b"lime"])
+    >>> offsets
+    array('i', [0, 17, 17, 38])
+    >>> data
+    bytearray(b'alice-isotope-jetbattery-scorpio-samba')
+
+    :param records:
+        An iterable of :class:`bytes` objects, or other objects supporting the
+        buffer protocol, to encode.
+    :param str word_separator:
+        String that should be used to separate words within a group.
+    :param str group_separator:
+        String that should be used to separate groups of words.
+    :param bool large:
+        If set, offsets will be stored as 64 bit rather than 32 bit integers.
+    :returns:
+        A tuple of an :class:`array.array` of offsets and a :class:`bytearray`
+        containing the UTF-8 encoded strings.
+    """
+    join_words = word_separator.encode('utf-8').join
+    join_groups = group_separator.encode('utf-8').join
+    lookup = _word_bytes().__getitem__
+    iter_indices = _iter_indices
+
+    offsets = _offsets_array(large)
+    data = bytearray()
+
+    for record in records:
+        if not isinstance(record, (bytes, bytearray)):
+            record = _byte_view(record)
+
+        data += join_groups([
+            join_words(map(lookup, indices))
+            for indices in iter_indices(record)
+        ])
+        offsets.append(len(data))
+
+    return offsets, data
+
+
+def decode_column(
+    offsets, data, word_separator="-", group_separator="--", large=False,
+):
+    """Decode a column of mnemonicode strings into a column of binary records.
+
+    No intermediate :class:`str` objects are created.
+
+    >>> offsets, data = decode_column(
+    ...     [0, 17, 17, 38], b'alice-isotope-jetbattery-scorpio-samba',
+    ... )
+    >>> offsets
+    array('i', [0, 3, 3, 7])
+    >>> data
+    bytearray(b'figlime')
+
+    :param offsets:
+        A sequence of ``N + 1`` integers giving the start and end of each
+        string in ``data``.
+    :param data:
+        A bytes-like object containing the UTF-8 encoded strings.
+    :param str word_separator:
+        String used to separate individual words in a group.
+    :param str group_separator:
+        String used to separate groups of words representing four byte blocks.
+    :param bool large:
+        If set, offsets will be stored as 64 bit rather than 32 bit integers.
+    :returns:
+        A tuple of an :class:`array.array` of offsets and a :class:`bytearray`
+        containing the decoded records.
+    """
+    word_separator = word_separator.encode('utf-8')
+    group_separator = group_separator.encode('utf-8')
+    lookup = _bytes_indices().get
+    indices_to_block = _indices_to_block
+
+    data = memoryview(data).cast('B')
+
+    out_offsets = _offsets_array(large)
+    out = bytearray()
+
+    for row in range(len(offsets) - 1):
+        start = offsets[row]
+        end = offsets[row + 1]
+        if start == end:
+            out_offsets.append(len(out))
+            continue
+
+        for group in data[start:end].tobytes().split(group_separator):
+            block = indices_to_block([
+                lookup(word) for word in group.split(word_separator)
+            ])
+            if isinstance(block, str):
+                raise ValueError((
+                    "{reason} (row {row})"
+                ).format(reason=block, row=row))
+            out += block
+
+        out_offsets.append(len(out))
+
+    return out_offsets, out
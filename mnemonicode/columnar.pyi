@@ -0,0 +1,18 @@
+import array
+import typing
+
+from mnemonicode import BytesLike
+
+
+def encode_column(
+    records: typing.Iterable[BytesLike],
+    word_separator: str="-", group_separator: str="--", large: bool=False,
+) -> typing.Tuple[array.array, bytearray]:
+    ...
+
+
+def decode_column(
+    offsets: typing.Sequence[int], data: bytes,
+    word_separator: str="-", group_separator: str="--", large: bool=False,
+) -> typing.Tuple[array.array, bytearray]:
+    ...
@@ -0,0 +1,157 @@
+"""Vectorised conversions between NumPy arrays and mnemonicode word indices.
+
+This module requires NumPy, which is not a dependency of the rest of the
+library.  It can be installed as an extra::
+
+    $ pip install mnemonicode[numpy]
+
+Encoded data is represented as an ``(N, 3)`` array of ``uint16`` word
+indices, with one row per four byte block.  Blocks of less than three bytes
+encode to fewer than three words, so the unused trailing slots in the last
+row are filled with :data:`NO_WORD`.
+"""
+import numpy
+
+from mnemonicode import _block_to_indices, _indices_to_block
+from mnemonicode._wordlist import _WORD_COUNT, _WORDLIST
+
+
+#: Placeholder index used to pad rows representing blocks of fewer than three
+#: bytes.
+NO_WORD = 0xffff
+
+_WORDS = numpy.array(_WORDLIST + [''])
+
+
+def _encode_blocks(blocks, out):
+    # `blocks` holds complete four byte blocks, already converted to the
+    # little-endian numbers they represent.
+    rest, out[:, 0] = numpy.divmod(blocks, 1626)
+    out[:, 2], out[:, 1] = numpy.divmod(rest, 1626)
+
+
+def encode_indices(data):
+    """Encode binary data as an array of word indices.
+
+    >>> encode_indices(numpy.array([0x64636261], dtype=numpy.uint32))
+    array([[1285,   52,  637]], dtype=uint16)
+    >>> encode_indices(b"abcde")
+    array([[ 1285,    52,   637],
+           [  101, 65535, 65535]], dtype=uint16)
+
+    :param data:
+        Either an array of ``uint32`` values, each of which is treated as a
+        single four byte block, or a ``uint8`` array or other object
+        supporting the buffer protocol containing the raw bytes to encode.
+    :returns:
+        An ``(N, 3)`` array of ``uint16`` word indices.
+    """
+    # Byte order doesn't matter here as each value is treated as a number.
+    if isinstance(data, numpy.ndarray) and data.dtype.str[1:] == 'u4':
+        blocks = data.reshape(-1)
+        out = numpy.empty((len(blocks), 3), dtype=numpy.uint16)
+        _encode_blocks(blocks, out)
+        return out
+
+    if isinstance(data, numpy.ndarray):
+        if data.dtype != numpy.uint8:
+            raise TypeError((
+                "expected uint32 or uint8 array, got {dtype}"
+            ).format(dtype=data.dtype))
+        buf = numpy.ascontiguousarray(data).reshape(-1)
+    else:
+        buf = numpy.frombuffer(data, dtype=numpy.uint8)
+
+    full, remainder = divmod(len(buf), 4)
+
+    out = numpy.empty((full + bool(remainder), 3), dtype=numpy.uint16)
+    _encode_blocks(buf[:4 * full].view('<u4'), out[:full])
+
+    if remainder:
+        # The trailing partial block is encoded using the same rules as in
+        # the pure python implementation.
+        indices = _block_to_indices(buf[4 * full:].tobytes())
+        out[full] = NO_WORD
+        out[full, :len(indices)] = indices
+
+    return out
+
+
+def decode_indices(indices):
+    """Decode an array of word indices back to binary data.
+
+    >>> decode_indices(numpy.array([[1285, 52, 637]], dtype=numpy.uint16))
+    array([ 97,  98,  99, 100], dtype=uint8)
+
+    If every row represents a complete block, the result can be
+    reinterpreted as an array of ``uint32`` values using
+    ``result.view('<u4')``.
+
+    :param indices:
+        An ``(N, 3)`` array of word indices, as returned by
+        :func:`encode_indices`.
+    :returns:
+        A ``uint8`` array containing the decoded bytes.
+    """
+    indices = numpy.asarray(indices)
+    if indices.ndim != 2 or indices.shape[1] != 3:
+        raise ValueError("expected an array of shape (N, 3)")
+
+    if len(indices) == 0:
+        return numpy.empty(0, dtype=numpy.uint8)
+
+    # The last row is the only one that may encode a partial block.
+    last = [int(index) for index in indices[-1]]
+    if NO_WORD in last or last[2] >= 1626:
+        full = indices[:-1]
+    else:
+        full = indices
+        last = None
+
+    invalid = ((full < 0) | (full >= 1626)).any(axis=1)
+    blocks = full.astype(numpy.uint64)
+    blocks = blocks[:, 0] + 1626 * (blocks[:, 1] + 1626 * blocks[:, 2])
+    invalid |= blocks > 0xffffffff
+    if invalid.any():
+        raise ValueError((
+            "invalid group at row {row}"
+        ).format(row=int(numpy.argmax(invalid))))
+
+    out = blocks.astype('<u4').view(numpy.uint8)
+
+    if last is not None:
+        while last and last[-1] == NO_WORD:
+            last.pop()
+        if NO_WORD in last or not all(
+            0 <= index < _WORD_COUNT for index in last
+        ):
+            raise ValueError((
+                "invalid group at row {row}"
+            ).format(row=len(indices) - 1))
+
+        block = _indices_to_block(last)
+        if isinstance(block, str):
+            raise ValueError(block)
+
+        out = numpy.concatenate([
+            out, numpy.frombuffer(block, dtype=numpy.uint8),
+        ])
+
+    return out
+
+
+def indices_to_words(indices):
+    """Look up the words corresponding to an array of word indices.
+
+    >>> indices_to_words(encode_indices(b"abcde"))
+    array([['bogart', 'atlas', 'safari'],
+           ['cannon', '', '']], dtype='<U7')
+
+    :param indices:
+        An array of word indices of any shape.  :data:`NO_WORD` is mapped to
+        the empty string.
+    :returns:
+        An array of strings with the same shape as ``indices``.
+    """
+    indices = numpy.asarray(indices)
+    return _WORDS[numpy.where(indices == NO_WORD, _WORD_COUNT, indices)]
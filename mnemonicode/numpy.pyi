@@ -0,0 +1,18 @@
+import typing
+
+import numpy
+
+
+NO_WORD: int
+
+
+def encode_indices(data: typing.Any) -> numpy.ndarray:
+    ...
+
+
+def decode_indices(indices: typing.Any) -> numpy.ndarray:
+    ...
+
+
+def indices_to_words(indices: typing.Any) -> numpy.ndarray:
+    ...
@@ -0,0 +1,180 @@
+"""Conversions between large inputs and mnemonicode strings using multiple
+processes.
+
+Encoding is split on four byte block boundaries and decoding on group
+separators, so each chunk can be converted independently and the results
+joined back together in order.  The output is identical to that of
+:func:`~mnemonicode.mnformat` and :func:`~mnemonicode.mnparse`.
+
+Starting a pool of processes and passing chunks between them is not free, so
+these functions can only pay for themselves on inputs of several megabytes or
+more, and on machines with more than one processor.  Smaller inputs are
+converted in the calling process.  ``benchmarks/parallel.py`` reports the
+throughput with different numbers of jobs.
+"""
+import collections
+import concurrent.futures
+import functools
+import os
+
+from mnemonicode import _byte_view, mnformat, mnparse
+
+#: Default amount of input, in bytes or characters, handed to a worker at a
+#: time.
+DEFAULT_CHUNK_SIZE = 1 << 22
+
+
+def _ordered_map(func, iterable, jobs):
+    # Like `map`, but calls `func` in a pool of `jobs` processes.  Only a
+    # bounded number of calls are in flight at once, so `iterable` can be a
+    # stream that doesn't fit in memory.
+    if jobs == 1:
+        for item in iterable:
+            yield func(item)
+        return
+
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+
+    with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+        pending = collections.deque()
+        limit = 2 * jobs
+        for item in iterable:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= limit:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _check_chunk_size(chunk_size):
+    if chunk_size < 1:
+        raise ValueError((
+            "expected positive chunk size, got {chunk_size}"
+        ).format(chunk_size=chunk_size))
+
+
+def _split_blocks(view, chunk_size):
+    # Chunks are rounded down to a whole number of blocks so that only the
+    # last one can end with a partial block.
+    chunk_size = max(4, chunk_size - chunk_size % 4)
+    for start in range(0, len(view), chunk_size):
+        yield view[start:start + chunk_size].tobytes()
+
+
+def _split_groups(string, group_separator, chunk_size):
+    # Splits at the first group separator after every `chunk_size`
+    # characters.  Splitting never produces an empty chunk, as that would
+    # hide an empty group from the parser.
+    start = 0
+    while True:
+        index = string.find(group_separator, start + chunk_size)
+        if index == -1 or index + len(group_separator) == len(string):
+            break
+        yield string[start:index]
+        start = index + len(group_separator)
+    yield string[start:]
+
+
+def parallel_mnformat(
+    data, word_separator="-", group_separator="--", jobs=None,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+):
+    """Encode a byte array as a single string, using multiple processes.
+
+    >>> parallel_mnformat(b"cucumber", chunk_size=4)
+    'paris-pearl-ultra--gentle-press-total'
+
+    :param bytes data:
+        The binary data to encode.  Any object supporting the buffer protocol
+        is accepted.
+    :param str word_separator:
+        String that should be used to separate words within a group.
+    :param str group_separator:
+        String that should be used to separate groups of words.
+    :param int jobs:
+        Number of worker processes.  Defaults to the number of processors on
+        the machine.
+    :param int chunk_size:
+        Number of bytes to encode in each call to a worker.  Rounded down to a
+        multiple of four.
+    :returns:
+        The same string as :func:`~mnemonicode.mnformat`.
+    """
+    _check_chunk_size(chunk_size)
+    view = _byte_view(data)
+    if jobs == 1 or len(view) <= chunk_size:
+        return mnformat(view, word_separator, group_separator)
+
+    encode = functools.partial(
+        mnformat,
+        word_separator=word_separator, group_separator=group_separator,
+    )
+    return group_separator.join(
+        _ordered_map(encode, _split_blocks(view, chunk_size), jobs),
+    )
+
+
+def parallel_mnparse(
+    string, word_separator="-", group_separator="--", abbreviated=False,
+    jobs=None, chunk_size=DEFAULT_CHUNK_SIZE,
+):
+    """Decode a mnemonicode string into a byte array, using multiple
+    processes.
+
+    >>> parallel_mnparse(
+    ...     'paris-pearl-ultra--gentle-press-total', chunk_size=4,
+    ... )
+    b'cucumber'
+
+    :param str string:
+        The string to decode.
+    :param str word_separator:
+        String used to separate individual words in a group.
+    :param str group_separator:
+        String used to separate groups of words representing four byte blocks.
+    :param bool abbreviated:
+        If set, words may be shortened to any unambiguous prefix.
+    :param int jobs:
+        Number of worker processes.  Defaults to the number of processors on
+        the machine.
+    :param int chunk_size:
+        Approximate number of characters to decode in each call to a worker.
+        Chunks are extended to the next group separator.
+    :returns:
+        The same bytes as :func:`~mnemonicode.mnparse`.
+    :raises ValueError:
+        If the string could not be decoded.
+    """
+    _check_chunk_size(chunk_size)
+    if not isinstance(string, str):
+        raise TypeError((
+            "expected string, got {cls}"
+        ).format(cls=type(string).__name__))
+
+    # Splitting on the group separator is only safe if it can't also appear
+    # inside a group.
+    if (
+        jobs == 1 or len(string) <= chunk_size or
+        group_separator in word_separator
+    ):
+        return mnparse(
+            string, word_separator, group_separator, abbreviated=abbreviated,
+        )
+
+    decode = functools.partial(
+        mnparse,
+        word_separator=word_separator, group_separator=group_separator,
+        abbreviated=abbreviated,
+    )
+    try:
+        return b''.join(_ordered_map(
+            decode, _split_groups(string, group_separator, chunk_size), jobs,
+        ))
+    except ValueError:
+        # Positions in error messages from workers are relative to their own
+        # chunk.  Errors are rare enough that it is simpler to parse the whole
+        # string again to get the same error as `mnparse`.
+        return mnparse(
+            string, word_separator, group_separator, abbreviated=abbreviated,
+        )
@@ -0,0 +1,20 @@
+import typing
+
+from mnemonicode import BytesLike
+
+DEFAULT_CHUNK_SIZE: int
+
+
+def parallel_mnformat(
+    data: BytesLike, word_separator: str="-", group_separator: str="--",
+    jobs: typing.Optional[int]=None, chunk_size: int=...,
+) -> str:
+    ...
+
+
+def parallel_mnparse(
+    string: str, word_separator: str="-", group_separator: str="--",
+    abbreviated: bool=False, jobs: typing.Optional[int]=None,
+    chunk_size: int=...,
+) -> bytes:
+    ...
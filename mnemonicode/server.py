@@ -0,0 +1,434 @@
+"""A long running server that encodes and decodes on behalf of other
+processes, avoiding the cost of starting a new interpreter for each call.
+
+The server listens on a Unix domain socket or a local TCP port and speaks a
+simple line based protocol.  Each request is a single line consisting of a
+command, optionally followed by a space and an argument:
+
+``encode <hex>``
+    Encode the hex encoded binary data.
+``decode <string>``
+    Decode the mnemonicode string.  The response is hex encoded.
+``stats``
+    Report statistics for the server as a JSON object.
+
+Each response is also a single line, either ``ok`` followed by a space and
+the result, or ``error`` followed by a space and a description of what went
+wrong.  The space is omitted if the result is empty.  Responses are sent in
+the same order as the requests on a connection, and clients are free to send
+several requests before reading any responses.
+
+Requests from all connections are queued, and everything that arrives while
+the previous batch is being converted is handled together by
+:func:`~mnemonicode.mnformat_many` and :func:`~mnemonicode.mnparse_many`.
+"""
+import asyncio
+import binascii
+import collections
+import json
+import socket
+import time
+
+from mnemonicode import _byte_view, mnformat_many, mnparse_many
+
+#: Maximum length, in bytes, of a single request.
+MAX_LINE_LENGTH = 1 << 24
+
+_Request = collections.namedtuple(
+    '_Request', ['command', 'argument', 'future', 'started'],
+)
+
+
+def _ok(result):
+    return b'ok ' + result + b'\n' if result else b'ok\n'
+
+
+def _error(reason):
+    return 'error {reason}\n'.format(reason=reason).encode('utf-8')
+
+
+class ServerStatistics(collections.namedtuple(
+    'ServerStatistics', [
+        'requests', 'errors', 'batches', 'uptime', 'mean_latency',
+        'max_latency',
+    ],
+)):
+    """Statistics for a running :class:`Server`.
+
+    :param int requests:
+        Number of requests handled, including ones that failed.
+    :param int errors:
+        Number of requests that failed.
+    :param int batches:
+        Number of batches that encode and decode requests were grouped into.
+    :param float uptime:
+        Number of seconds since the server was started.
+    :param float mean_latency:
+        Mean number of seconds between a request being read and its response
+        being ready.
+    :param float max_latency:
+        Longest number of seconds between a request being read and its
+        response being ready.
+    """
+    __slots__ = ()
+
+    @property
+    def throughput(self):
+        """Mean number of requests handled per second since the server was
+        started.
+        """
+        return self.requests / self.uptime if self.uptime else 0.0
+
+
+class Server(object):
+    """Encodes and decodes requests from any number of connections.
+
+    :param str word_separator:
+        String that should be used to separate words within a group.
+    :param str group_separator:
+        String that should be used to separate groups of words.
+    :param int max_batch_size:
+        Maximum number of requests to convert in a single batch.
+    """
+    def __init__(
+        self, word_separator="-", group_separator="--", max_batch_size=1024,
+    ):
+        if not word_separator or not group_separator:
+            raise ValueError("separators must not be empty")
+        if '\n' in word_separator or '\n' in group_separator:
+            raise ValueError("separators must not contain newlines")
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be positive")
+
+        self._word_separator = word_separator
+        self._group_separator = group_separator
+        self._max_batch_size = max_batch_size
+
+        self._server = None
+        self._queue = None
+        self._batcher = None
+        # Maps the writer for each open connection to a future that is
+        # resolved once its handler has finished.
+        self._connections = {}
+
+        self._started = None
+        self._requests = 0
+        self._errors = 0
+        self._batches = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+    async def start_unix(self, path):
+        """Start listening on a Unix domain socket.
+
+        :param str path:
+            Location of the socket.
+        """
+        self._start()
+        self._server = await asyncio.start_unix_server(
+            self._handle, path, limit=MAX_LINE_LENGTH,
+        )
+
+    async def start_tcp(self, host='127.0.0.1', port=0):
+        """Start listening on a TCP port.
+
+        :param str host:
+            Address to listen on.  Defaults to the loopback interface.
+        :param int port:
+            Port to listen on.  Defaults to an arbitrary unused port, which can
+            be found from :attr:`sockets`.
+        """
+        self._start()
+        self._server = await asyncio.start_server(
+            self._handle, host, port, limit=MAX_LINE_LENGTH,
+        )
+
+    def _start(self):
+        if self._server is not None:
+            raise RuntimeError("server already started")
+        self._started = time.monotonic()
+        self._queue = asyncio.Queue()
+        self._batcher = asyncio.ensure_future(self._run_batches())
+
+    @property
+    def sockets(self):
+        """The sockets the server is listening on."""
+        return self._server.sockets
+
+    def close(self):
+        """Stop accepting connections, and close existing ones.  Responses to
+        requests that have already been read are still sent if possible.
+        """
+        self._server.close()
+        for writer in self._connections:
+            writer.close()
+
+    async def wait_closed(self):
+        """Wait until the server and all of its connections are closed."""
+        await self._server.wait_closed()
+        if self._connections:
+            await asyncio.wait(list(self._connections.values()))
+
+        self._batcher.cancel()
+        try:
+            await self._batcher
+        except asyncio.CancelledError:
+            pass
+
+    def statistics(self):
+        """Return statistics for the server.
+
+        :returns:
+            A :class:`ServerStatistics` instance.
+        """
+        return ServerStatistics(
+            requests=self._requests,
+            errors=self._errors,
+            batches=self._batches,
+            uptime=time.monotonic() - self._started,
+            mean_latency=(
+                self._total_latency / self._requests if self._requests else 0.0
+            ),
+            max_latency=self._max_latency,
+        )
+
+    async def _handle(self, reader, writer):
+        # Responses are queued in the order that requests arrive, and written
+        # by a separate task so that a client can pipeline requests.
+        done = asyncio.get_event_loop().create_future()
+        self._connections[writer] = done
+
+        responses = asyncio.Queue()
+        sender = asyncio.ensure_future(self._send(responses, writer))
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # The request was too long.  There's no way to find where
+                    # the next one starts, so the connection is dropped.
+                    future = asyncio.get_event_loop().create_future()
+                    self._finish(
+                        future, time.monotonic(),
+                        _error("request too long"),
+                    )
+                    await responses.put(future)
+                    break
+                except ConnectionError:
+                    break
+                if not line:
+                    break
+                await responses.put(self._submit(line))
+        finally:
+            await responses.put(None)
+            await sender
+            writer.close()
+            del self._connections[writer]
+            done.set_result(None)
+
+    async def _send(self, responses, writer):
+        while True:
+            future = await responses.get()
+            if future is None:
+                break
+            writer.write(await future)
+            if responses.empty():
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    break
+
+    def _submit(self, line):
+        future = asyncio.get_event_loop().create_future()
+        started = time.monotonic()
+
+        command, _, argument = line.rstrip(b'\r\n').partition(b' ')
+        if command == b'encode':
+            try:
+                argument = binascii.unhexlify(argument)
+            except (binascii.Error, ValueError):
+                self._finish(future, started, _error("invalid hex"))
+                return future
+        elif command == b'decode':
+            try:
+                argument = argument.decode('utf-8')
+            except ValueError:
+                self._finish(future, started, _error("invalid utf-8"))
+                return future
+        elif command == b'stats':
+            self._finish(future, started, _ok(json.dumps(
+                dict(self.statistics()._asdict()), sort_keys=True,
+            ).encode('ascii')))
+            return future
+        else:
+            self._finish(future, started, _error((
+                "unknown command: {command!r}"
+            ).format(command=command.decode('utf-8', 'replace'))))
+            return future
+
+        self._queue.put_nowait(_Request(command, argument, future, started))
+        return future
+
+    def _finish(self, future, started, response):
+        latency = time.monotonic() - started
+        self._requests += 1
+        self._errors += response.startswith(b'error')
+        self._total_latency += latency
+        self._max_latency = max(self._max_latency, latency)
+        future.set_result(response)
+
+    async def _run_batches(self):
+        # Batches are converted synchronously, so any requests that arrive
+        # while one is being converted will be picked up by the next.
+        while True:
+            batch = [await self._queue.get()]
+            while (
+                len(batch) < self._max_batch_size and not self._queue.empty()
+            ):
+                batch.append(self._queue.get_nowait())
+            self._batches += 1
+            try:
+                self._process(batch)
+            except Exception as e:
+                # If the batcher stopped, every later request would wait
+                # forever, so the batch is failed instead.
+                for request in batch:
+                    if not request.future.done():
+                        self._finish(
+                            request.future, request.started,
+                            _error("internal error: {e}".format(e=e)),
+                        )
+
+    def _process(self, batch):
+        encodes = [r for r in batch if r.command == b'encode']
+        decodes = [r for r in batch if r.command == b'decode']
+
+        if encodes:
+            strings = mnformat_many(
+                [request.argument for request in encodes],
+                word_separator=self._word_separator,
+                group_separator=self._group_separator,
+            )
+            for request, string in zip(encodes, strings):
+                self._finish(
+                    request.future, request.started,
+                    _ok(string.encode('utf-8')),
+                )
+
+        if decodes:
+            results, failures = mnparse_many(
+                [request.argument for request in decodes],
+                word_separator=self._word_separator,
+                group_separator=self._group_separator,
+                errors='collect',
+            )
+            failures = {failure.index: failure for failure in failures}
+            for index, (request, data) in enumerate(zip(decodes, results)):
+                if data is None:
+                    response = _error("{reason} (position {position})".format(
+                        reason=failures[index].reason,
+                        position=failures[index].position,
+                    ))
+                else:
+                    response = _ok(binascii.hexlify(data))
+                self._finish(request.future, request.started, response)
+
+
+class Client(object):
+    """A blocking client for a running :class:`Server`.
+
+    Exactly one of ``path`` or ``port`` must be given.
+
+    :param str path:
+        Location of the Unix domain socket to connect to.
+    :param str host:
+        Address of the server to connect to over TCP.
+    :param int port:
+        Port of the server to connect to over TCP.
+    :param float timeout:
+        Number of seconds to wait for the server before giving up.
+    """
+    def __init__(self, path=None, host='127.0.0.1', port=None, timeout=None):
+        if (path is None) == (port is None):
+            raise TypeError("expected either path or port")
+
+        if path is not None:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.settimeout(timeout)
+            try:
+                self._socket.connect(path)
+            except BaseException:
+                self._socket.close()
+                raise
+        else:
+            self._socket = socket.create_connection((host, port), timeout)
+        self._file = self._socket.makefile('rwb')
+
+    def _request(self, command, argument=b''):
+        if argument:
+            command += b' ' + argument
+        self._file.write(command + b'\n')
+        self._file.flush()
+
+        response = self._file.readline()
+        if not response.endswith(b'\n'):
+            raise ConnectionError("connection closed by server")
+        status, _, result = response[:-1].partition(b' ')
+        if status != b'ok':
+            raise ValueError(result.decode('utf-8'))
+        return result
+
+    def encode(self, data):
+        """Encode binary data on the server.
+
+        :param bytes data:
+            The binary data to encode.  Any object supporting the buffer
+            protocol is accepted.
+        :returns:
+            The same string as :func:`~mnemonicode.mnformat`, using the
+            separators the server was started with.
+        """
+        return self._request(
+            b'encode', binascii.hexlify(_byte_view(data)),
+        ).decode('utf-8')
+
+    def decode(self, string):
+        """Decode a mnemonicode string on the server.
+
+        :param str string:
+            The string to decode.
+        :returns:
+            The same bytes as :func:`~mnemonicode.mnparse`.
+        :raises ValueError:
+            If the string could not be decoded.
+        """
+        if not isinstance(string, str):
+            raise TypeError((
+                "expected string, got {cls}"
+            ).format(cls=type(string).__name__))
+        if '\n' in string:
+            raise ValueError("string must not contain newlines")
+        return binascii.unhexlify(
+            self._request(b'decode', string.encode('utf-8')),
+        )
+
+    def statistics(self):
+        """Fetch statistics for the server.
+
+        :returns:
+            A :class:`ServerStatistics` instance.
+        """
+        return ServerStatistics(**json.loads(
+            self._request(b'stats').decode('ascii'),
+        ))
+
+    def close(self):
+        """Close the connection to the server."""
+        self._file.close()
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
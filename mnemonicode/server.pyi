@@ -0,0 +1,75 @@
+import socket
+import typing
+
+from mnemonicode import BytesLike
+
+MAX_LINE_LENGTH: int
+
+
+class ServerStatistics(typing.NamedTuple):
+    requests: int
+    errors: int
+    batches: int
+    uptime: float
+    mean_latency: float
+    max_latency: float
+
+    @property
+    def throughput(self) -> float:
+        ...
+
+
+class Server(object):
+    def __init__(
+        self, word_separator: str="-", group_separator: str="--",
+        max_batch_size: int=1024,
+    ) -> None:
+        ...
+
+    async def start_unix(self, path: str) -> None:
+        ...
+
+    async def start_tcp(self, host: str='127.0.0.1', port: int=0) -> None:
+        ...
+
+    @property
+    def sockets(self) -> typing.Sequence[socket.socket]:
+        ...
+
+    def close(self) -> None:
+        ...
+
+    async def wait_closed(self) -> None:
+        ...
+
+    def statistics(self) -> ServerStatistics:
+        ...
+
+
+class Client(object):
+    def __init__(
+        self, path: typing.Optional[str]=None, host: str='127.0.0.1',
+        port: typing.Optional[int]=None,
+        timeout: typing.Optional[float]=None,
+    ) -> None:
+        ...
+
+    def encode(self, data: BytesLike) -> str:
+        ...
+
+    def decode(self, string: str) -> bytes:
+        ...
+
+    def statistics(self) -> ServerStatistics:
+        ...
+
+    def close(self) -> None:
+        ...
+
+    def __enter__(self) -> 'Client':
+        ...
+
+    def __exit__(
+        self, type: typing.Any, value: typing.Any, traceback: typing.Any,
+    ) -> None:
+        ...
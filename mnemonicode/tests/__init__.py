@@ -1,11 +1,26 @@
+import array
+import codecs
 import doctest
+import io
+import mmap
 import os
 import subprocess
+import sys
 import tempfile
+import threading
 import unittest
 
 import mnemonicode
+import mnemonicode.columnar
+import mnemonicode.parallel
 from mnemonicode._utils import chunk_sequence, from_base, to_base
+from mnemonicode._wordlist import index_to_word, word_to_index
+
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
 
 
 class TestBaseConversion(unittest.TestCase):
@@ -50,6 +65,28 @@ class TestChunkSequence(unittest.TestCase):
         )
 
 
+class TestWordlist(unittest.TestCase):
+    def test_round_trip(self):
+        words = [index_to_word(index) for index in range(1633)]
+        self.assertEqual(len(set(words)), 1633)
+        for index, word in enumerate(words):
+            self.assertEqual(word_to_index(word), index)
+
+    def test_index_to_word(self):
+        self.assertEqual(index_to_word(0), "academy")
+        self.assertEqual(index_to_word(1632), "yes")
+        self.assertEqual(index_to_word(-1), "yes")
+        self.assertEqual(index_to_word(-1633), "academy")
+
+    def test_index_out_of_range(self):
+        for index in (1633, -1634, 100000):
+            self.assertRaises(IndexError, index_to_word, index)
+
+    def test_unknown_word(self):
+        for word in ("", "yess", "YES", "ac", "caf\xe9", b"yes", None):
+            self.assertRaises(KeyError, word_to_index, word)
+
+
 class TestEncode(unittest.TestCase):
     def test_block_to_words(self):
         def test(string, words):
@@ -77,6 +114,21 @@ class TestEncode(unittest.TestCase):
         test(b'\xff\xff\xff', ("claudia", "photo", "yes"))
         test(b'\xff\xff\xff\xff', ("natural", "analyze", "verbal"))
 
+    def test_block_to_indices_round_trip(self):
+        for block in [
+            b'\x00', b'\x01', b'\xff',
+            b'\x00\x00', b'\x5a\x06', b'\x5b\x06', b'\xff\xff',
+            b'\x00\x00\x00', b'\x12\x34\x56', b'\xff\xff\xff',
+            b'\x00\x00\x00\x00', b'\x12\x34\x56\x78', b'\xff\xff\xff\xff',
+        ]:
+            words = mnemonicode._block_to_words(block)
+            self.assertEqual(mnemonicode._words_to_block(words), block)
+
+    def test_block_too_big(self):
+        self.assertRaises(
+            ValueError, mnemonicode._block_to_indices, b'\x00' * 5
+        )
+
     def test_examples(self):
         def test(string, words):
             self.assertEqual(list(mnemonicode.mnencode(string)), words)
@@ -114,6 +166,160 @@ class TestFormat(unittest.TestCase):
         test(b"ab", "zero-albert")
         test(b"abcde", "bogart-atlas-safari--cannon")
 
+    def test_buffer_protocol(self):
+        data = bytes(range(256)) + b"abc"
+        expected = mnemonicode.mnformat(data)
+
+        self.assertEqual(mnemonicode.mnformat(memoryview(data)), expected)
+        self.assertEqual(
+            mnemonicode.mnformat(memoryview(data)[:7]),
+            mnemonicode.mnformat(data[:7]),
+        )
+        self.assertEqual(
+            mnemonicode.mnformat(array.array('B', data)), expected,
+        )
+        self.assertEqual(
+            mnemonicode.mnformat(array.array('I', data[:256])),
+            mnemonicode.mnformat(data[:256]),
+        )
+
+        with tempfile.TemporaryFile() as f:
+            f.write(data)
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                self.assertEqual(mnemonicode.mnformat(m), expected)
+
+    def test_not_bytes_like(self):
+        self.assertRaises(TypeError, mnemonicode.mnformat, "abcd")
+        self.assertRaises(TypeError, mnemonicode.mnformat, [1, 2, 3, 4])
+
+    def test_non_contiguous(self):
+        self.assertRaises(
+            TypeError, mnemonicode.mnformat, memoryview(b"abcdefgh")[::2],
+        )
+
+
+class TestFormatTo(unittest.TestCase):
+    def test_bytearray(self):
+        for size in [0, 1, 2, 3, 4, 5, 100, 65536, 65537]:
+            data = os.urandom(size)
+            sink = bytearray(b"prefix:")
+            written = mnemonicode.mnformat_to(data, sink)
+            self.assertEqual(
+                sink, b"prefix:" + mnemonicode.mnformat(data).encode('ascii'),
+            )
+            self.assertEqual(written, len(sink) - len(b"prefix:"))
+
+    def test_file(self):
+        data = os.urandom(200000)
+        sink = io.BytesIO()
+        mnemonicode.mnformat_to(
+            data, sink, word_separator=" ", group_separator=", ",
+        )
+        self.assertEqual(sink.getvalue(), mnemonicode.mnformat(
+            data, word_separator=" ", group_separator=", ",
+        ).encode('ascii'))
+
+    def test_chunked_writes(self):
+        writes = []
+
+        class Sink(object):
+            def write(self, data):
+                writes.append(data)
+
+        data = os.urandom(3 * 65536)
+        mnemonicode.mnformat_to(data, Sink())
+        self.assertEqual(len(writes), 3)
+        self.assertEqual(
+            b"".join(writes), mnemonicode.mnformat(data).encode('ascii'),
+        )
+
+    def test_invalid_sink(self):
+        self.assertRaises(TypeError, mnemonicode.mnformat_to, b"abcd", [])
+        self.assertRaises(
+            TypeError, mnemonicode.mnformat_to, b"abcd", io.StringIO(),
+        )
+
+
+class TestEncodeMany(unittest.TestCase):
+    def test_matches_mnencode(self):
+        records = [b"", b"a", b"abcd", b"abcdefg", bytearray(b"abcdefgh")]
+        self.assertEqual(
+            list(mnemonicode.mnencode_many(records)),
+            [list(mnemonicode.mnencode(record)) for record in records],
+        )
+
+    def test_lazy(self):
+        def records():
+            yield b"abc"
+            raise AssertionError("consumed too far")  # pragma: no cover
+
+        results = mnemonicode.mnencode_many(records())
+        self.assertEqual(next(results), [("hazard", "velvet", "jet")])
+
+    def test_not_bytes(self):
+        self.assertRaises(
+            TypeError, list, mnemonicode.mnencode_many([b"abc", "abc"])
+        )
+
+
+class TestFormatMany(unittest.TestCase):
+    def test_matches_mnformat(self):
+        records = [
+            b"", b"a", b"ab", b"abc", b"abcd", b"abcde", b"abcdefgh",
+            bytearray(b"abcdefghi"), bytes(range(256)),
+        ]
+        self.assertEqual(
+            list(mnemonicode.mnformat_many(records)),
+            [mnemonicode.mnformat(record) for record in records],
+        )
+
+    def test_separators(self):
+        self.assertEqual(
+            list(mnemonicode.mnformat_many(
+                [b"abcde", b"ab"], word_separator=" ", group_separator=", ",
+            )),
+            ["bogart atlas safari, cannon", "zero albert"],
+        )
+
+    def test_buffer_protocol(self):
+        self.assertEqual(
+            list(mnemonicode.mnformat_many([
+                memoryview(b"abc"), array.array('B', b"abcdefgh"),
+            ])),
+            [mnemonicode.mnformat(b"abc"), mnemonicode.mnformat(b"abcdefgh")],
+        )
+
+    def test_not_bytes(self):
+        self.assertRaises(
+            TypeError, list, mnemonicode.mnformat_many([b"abc", 123])
+        )
+
+
+class TestStreamFormatter(unittest.TestCase):
+    def test_matches_mnformat(self):
+        data = bytes(range(256)) + b"abc"
+        for size in [1, 3, 4, 5, 8, 13, 300]:
+            formatter = mnemonicode._StreamFormatter()
+            text = ''.join(
+                formatter.feed(data[offset:offset + size])
+                for offset in range(0, len(data), size)
+            )
+            text += formatter.feed(b'', final=True)
+            self.assertEqual(text, mnemonicode.mnformat(data))
+
+    def test_separators(self):
+        formatter = mnemonicode._StreamFormatter(
+            word_separator=" ", group_separator=", ",
+        )
+        self.assertEqual(formatter.feed(b"abcdef"), "bogart atlas safari")
+        self.assertEqual(formatter.feed(b"", final=True), ", david albino")
+
+    def test_empty(self):
+        formatter = mnemonicode._StreamFormatter()
+        self.assertEqual(formatter.feed(b""), "")
+        self.assertEqual(formatter.feed(b"", final=True), "")
+
 
 class TestDecode(unittest.TestCase):
     def test_words_to_block(self):
@@ -171,6 +377,38 @@ class TestDecode(unittest.TestCase):
     def test_early_three_byte_word(self):
         self.assertRaises(ValueError, mnemonicode.mndecode, [("jet",)])
 
+    def test_misplaced_three_byte_word(self):
+        self.assertRaises(
+            ValueError, mnemonicode.mndecode, [("ego", "academy", "ego")]
+        )
+
+    def test_first_three_byte_word_misplaced(self):
+        # "ego" is the first word of the second list.  It used to get past
+        # the check for misplaced words, and was only rejected later, as an
+        # invalid digit.
+        for words in [
+            ("ego", "academy", "academy"),
+            ("academy", "ego", "academy"),
+            ("ego", "academy"),
+        ]:
+            with self.assertRaisesRegex(
+                ValueError, "unexpected three byte word: 'ego'",
+            ):
+                mnemonicode.mndecode([words])
+
+    def test_block_overflow(self):
+        # "amen" is the highest index in the main word list.
+        self.assertRaises(ValueError, mnemonicode.mndecode, [("amen",)])
+        self.assertRaises(
+            ValueError, mnemonicode.mndecode, [("amen", "amen")]
+        )
+        self.assertRaises(
+            ValueError, mnemonicode.mndecode, [("amen", "amen", "yes")]
+        )
+        self.assertRaises(
+            ValueError, mnemonicode.mndecode, [("amen", "amen", "amen")]
+        )
+
     def test_unknown_word(self):
         self.assertRaises(ValueError, mnemonicode.mndecode, [("kazoo",)])
 
@@ -204,190 +442,2032 @@ class TestParse(unittest.TestCase):
         test(b"ab", "zero-albert")
         test(b"abcde", "bogart-atlas-safari--cannon")
 
+    def test_long(self):
+        for size in (256, 257, 258, 259, 100000):
+            data = os.urandom(size)
+            for word_separator, group_separator in [
+                ("-", "--"), (" ", "\n"), ("-", " "), ("X", "Y"),
+            ]:
+                self.assertEqual(data, mnemonicode.mnparse(
+                    mnemonicode.mnformat(
+                        data, word_separator=word_separator,
+                        group_separator=group_separator,
+                    ),
+                    word_separator=word_separator,
+                    group_separator=group_separator,
+                ))
+
+    def test_long_errors(self):
+        string = mnemonicode.mnformat(os.urandom(400))
+        for bad, message in [
+            (string + "--", "word not recognized"),
+            (string + "---", "word not recognized"),
+            (string.replace("-", "-kazoo-", 1), "too many words in block"),
+            (string.replace("-", "-Kazoo-", 1), "too many words in block"),
+            ("ego-" + string, "too many words in block"),
+            (
+                "academy-ego-academy--" + string,
+                "unexpected three byte word: 'ego'",
+            ),
+            ("amen-amen-amen--" + string, "block overflow"),
+            (string + "--amen-amen-amen", "block overflow"),
+            (string + "-ego", "too many words in block"),
+        ]:
+            with self.assertRaises(ValueError) as cm:
+                mnemonicode.mnparse(bad)
+            self.assertEqual(str(cm.exception), message)
+
+    def test_normalize(self):
+        string = mnemonicode.mnformat(b"tomatoes and potatoes")
+        self.assertEqual(mnemonicode.mnparse(
+            "\n".join(
+                string.upper()[i:i + 10] for i in range(0, len(string), 10)
+            ),
+            normalize=True,
+        ), b"tomatoes and potatoes")
+        self.assertEqual(mnemonicode.mnparse(
+            " \tSCOOP-limit-recycle\r\n", normalize=True,
+        ), b"toma")
+
+    def test_normalize_whitespace_separators(self):
+        self.assertEqual(mnemonicode.mnparse(
+            "\n Scoop Limit Recycle, Ferrari Album \n",
+            word_separator=" ", group_separator=", ", normalize=True,
+        ), b"tomato")
+
+    def test_normalize_disabled(self):
+        for string in ["Scoop-limit-recycle", " scoop-limit-recycle"]:
+            self.assertRaises(ValueError, mnemonicode.mnparse, string)
+
+
+class TestAbbreviations(unittest.TestCase):
+    def test_complete(self):
+        self.assertEqual(
+            mnemonicode.complete("ala"),
+            ['alabama', 'aladdin', 'alamo', 'alarm', 'alaska'],
+        )
+        self.assertEqual(mnemonicode.complete("alas"), ['alaska'])
+        self.assertEqual(mnemonicode.complete("alaska"), ['alaska'])
+        self.assertEqual(mnemonicode.complete("alaskan"), [])
+        self.assertEqual(mnemonicode.complete("zz"), [])
+        self.assertEqual(len(mnemonicode.complete("")), 1633)
+
+    def test_complete_type(self):
+        self.assertRaises(TypeError, mnemonicode.complete, b"ala")
+
+    def test_shortest_prefixes(self):
+        # Every word should be recoverable from the shortest of its prefixes
+        # that completes to only that word.
+        data = os.urandom(4000)
+        groups = []
+        for group in mnemonicode.mnencode(data):
+            abbreviated = []
+            for word in group:
+                for end in range(1, len(word) + 1):
+                    if len(mnemonicode.complete(word[:end])) == 1:
+                        abbreviated.append(word[:end])
+                        break
+            groups.append(tuple(abbreviated))
+        self.assertEqual(mnemonicode.mndecode(groups, abbreviated=True), data)
+
+    def test_parse(self):
+        self.assertEqual(
+            mnemonicode.mnparse('scoo-limi-recy--ferr-albu', abbreviated=True),
+            b"tomato",
+        )
 
-def _try_kill(p):  # pragma: no cover
-    p.terminate()
-    try:
-        p.wait(timeout=1)
-    except subprocess.TimeoutExpired:
-        p.kill()
+    def test_disabled_by_default(self):
+        self.assertRaises(
+            ValueError, mnemonicode.mnparse, 'scoo-limi-recy--ferr-albu',
+        )
 
+    def test_full_words(self):
+        self.assertEqual(
+            mnemonicode.mnparse("zero-albert", abbreviated=True), b"ab",
+        )
 
-class TestEncodeCommand(unittest.TestCase):
-    def test_basic(self):
-        try:
-            p = subprocess.Popen(
-                ['mnencode'], stdin=subprocess.PIPE, stdout=subprocess.PIPE
-            )
-            stdout, stderr = p.communicate(b"rambutan", timeout=1)
-            self.assertEqual(
-                stdout, b"bridge-office-report--ruby-tiger-suzuki"
-            )
-            self.assertFalse(stderr)
+    def test_ambiguous(self):
+        with self.assertRaises(ValueError) as cm:
+            mnemonicode.mnparse('ala-zero', abbreviated=True)
+        self.assertEqual(str(cm.exception), "ambiguous word: 'ala'")
 
-            p.wait(timeout=1)
-            self.assertEqual(p.returncode, 0)
-        except BaseException:  # pragma: no cover
-            _try_kill(p)
-            raise
+    def test_unrecognized(self):
+        for string in ('zzz-zero', 'zero-', 'alaskan'):
+            with self.assertRaises(ValueError) as cm:
+                mnemonicode.mnparse(string, abbreviated=True)
+            self.assertEqual(str(cm.exception), "word not recognized")
 
-    def test_binary(self):
+    def test_cache_enabled(self):
+        mnemonicode.enable_cache()
         try:
-            p = subprocess.Popen(
-                ['mnencode'], stdin=subprocess.PIPE, stdout=subprocess.PIPE
-            )
-            stdout, stderr = p.communicate(
-                bytes([0, 1, 2, 3, 4, 251, 252, 253, 254, 255]), timeout=1
+            self.assertEqual(
+                mnemonicode.mndecode([('zer', 'albe')], abbreviated=True),
+                b"ab",
             )
+        finally:
+            mnemonicode.disable_cache()
+
+    def test_iterparse(self):
+        self.assertEqual(b''.join(mnemonicode.mniterparse(
+            ['scoo-limi-re', 'cy--fe', 'rr-albu'], abbreviated=True,
+        )), b"tomato")
+
+
+class TestCorrection(unittest.TestCase):
+    def test_parse(self):
+        for string in [
+            'scoop-limti-recycle--ferrari-album',  # Transposition.
+            'scoop-limit-recyle--ferrari-album',  # Deletion.
+            'scoop-limiit-recycle--ferrari-album',  # Insertion.
+            'scoop-limit-recycle--ferrari-alpum',  # Substitution.
+        ]:
             self.assertEqual(
-                stdout,
-                b"battery-cinema-alex--spirit-rose-weather--neutral-archive"
+                mnemonicode.mnparse(string, correct=True), b"tomato",
             )
-            self.assertFalse(stderr)
 
-            p.wait(timeout=1)
-            self.assertEqual(p.returncode, 0)
-        except BaseException:  # pragma: no cover
-            _try_kill(p)
-            raise
+    def test_disabled_by_default(self):
+        self.assertRaises(
+            ValueError, mnemonicode.mnparse, 'scoop-limti-recycle',
+        )
 
-    def test_input_file(self):
-        f = tempfile.NamedTemporaryFile('wb', delete=False)
-        try:  # pragma: no cover
-            f.write(b"cherry")
-            f.close()
+    def test_decode(self):
+        self.assertEqual(
+            mnemonicode.mndecode([('zeero', 'albert')], correct=True), b"ab",
+        )
 
-            p = subprocess.Popen(
-                ['mnencode', f.name], stdout=subprocess.PIPE,
-            )
-            stdout, stderr = p.communicate(timeout=1)
-            self.assertEqual(stdout, b"rondo-presto-total--daniel-alex")
-            self.assertFalse(stderr)
+    def test_iterparse(self):
+        self.assertEqual(b''.join(mnemonicode.mniterparse(
+            ['scoop-limti-rec', 'ycle--ferari-album'], correct=True,
+        )), b"tomato")
+
+    def test_abbreviated(self):
+        self.assertEqual(mnemonicode.mnparse(
+            'scoo-limti-recy--ferr-albu', abbreviated=True, correct=True,
+        ), b"tomato")
+
+    def test_ambiguous(self):
+        # Both "jet" and "job" are a single substitution away.
+        with self.assertRaises(ValueError) as cm:
+            mnemonicode.mnparse('zero-albert-jeb', correct=True)
+        self.assertEqual(str(cm.exception), "ambiguous correction: 'jeb'")
+
+    def test_unrecognized(self):
+        for string in ('zero-xxxxxx', 'zero-'):
+            with self.assertRaises(ValueError) as cm:
+                mnemonicode.mnparse(string, correct=True)
+            self.assertEqual(str(cm.exception), "word not recognized")
+
+    def test_mncorrect(self):
+        self.assertEqual(
+            mnemonicode.mncorrect(
+                'scoop-limti-recycle, ferari-album',
+                group_separator=", ",
+            ),
+            ('scoop-limit-recycle, ferrari-album', [
+                mnemonicode.Correction(6, 'limti', 'limit'),
+                mnemonicode.Correction(21, 'ferari', 'ferrari'),
+            ]),
+        )
 
-            p.wait(timeout=1)
-            self.assertEqual(p.returncode, 0)
-        except BaseException:  # pragma: no cover
-            _try_kill(p)
-            raise
-        finally:
-            os.unlink(f.name)
+    def test_mncorrect_nothing_to_correct(self):
+        self.assertEqual(mnemonicode.mncorrect(''), ('', []))
+        self.assertEqual(
+            mnemonicode.mncorrect('zero-albert'), ('zero-albert', []),
+        )
 
-    def test_output_file(self):
-        with tempfile.TemporaryDirectory() as d:
-            output_path = os.path.join(d, "output")
-            try:
-                p = subprocess.Popen(
-                    ['mnencode', '-o', output_path], stdin=subprocess.PIPE,
-                )
-                stdout, stderr = p.communicate(b"tamarillo", timeout=1)
-                self.assertFalse(stdout)
-                self.assertFalse(stderr)
+    def test_mncorrect_errors(self):
+        for string, message in [
+            ('zero-jeb', "ambiguous correction: 'jeb' (position 5)"),
+            ('zero--xxxxxx', "word not recognized (position 6)"),
+        ]:
+            with self.assertRaises(ValueError) as cm:
+                mnemonicode.mncorrect(string)
+            self.assertEqual(str(cm.exception), message)
+
+    def test_mncorrect_type(self):
+        self.assertRaises(TypeError, mnemonicode.mncorrect, b"zero")
+
+
+class TestDecodeInto(unittest.TestCase):
+    def test_parse_into(self):
+        for size in [0, 1, 2, 3, 4, 5, 100, 1000]:
+            data = os.urandom(size)
+            string = mnemonicode.mnformat(data)
+            buffer = bytearray(size + 4)
+            self.assertEqual(mnemonicode.mnparse_into(string, buffer), size)
+            self.assertEqual(buffer[:size], data)
+
+    def test_parse_into_reused(self):
+        buffer = bytearray(8)
+        mnemonicode.mnparse_into(mnemonicode.mnformat(b"abcdefgh"), buffer)
+        self.assertEqual(
+            mnemonicode.mnparse_into("scoop-limit-recycle", buffer), 4,
+        )
+        self.assertEqual(buffer, b"tomaefgh")
 
-                p.wait(timeout=1)
-                self.assertEqual(p.returncode, 0)
-            except BaseException:  # pragma: no cover
-                _try_kill(p)
-                raise
+    def test_parse_into_memoryview(self):
+        buffer = bytearray(12)
+        string = mnemonicode.mnformat(bytes(range(200)))
+        self.assertRaises(
+            ValueError, mnemonicode.mnparse_into, string, buffer,
+        )
+        view = memoryview(bytearray(300))[50:]
+        self.assertEqual(mnemonicode.mnparse_into(string, view), 200)
+        self.assertEqual(view[:200], bytes(range(200)))
 
-            with open(output_path, 'rb') as f:
-                self.assertEqual(
-                    f.read(),
-                    b"status-libra-recycle--radar-animal-stone--carlo"
-                )
+    def test_parse_into_mmap(self):
+        buffer = mmap.mmap(-1, 16)
+        self.assertEqual(
+            mnemonicode.mnparse_into(
+                "scoop-limit-recycle--ferrari-album", buffer,
+            ),
+            6,
+        )
+        self.assertEqual(buffer[:6], b"tomato")
+
+    def test_parse_into_options(self):
+        buffer = bytearray(6)
+        self.assertEqual(mnemonicode.mnparse_into(
+            "Scoo-Limi-Recy, Ferr-Albu", buffer, word_separator="-",
+            group_separator=",", abbreviated=True, normalize=True,
+        ), 6)
+        self.assertEqual(buffer, b"tomato")
+
+    def test_parse_into_buffer_too_small(self):
+        string = mnemonicode.mnformat(b"tomato")
+        with self.assertRaisesRegex(ValueError, "buffer too small"):
+            mnemonicode.mnparse_into(string, bytearray(5))
+
+    def test_parse_into_invalid(self):
+        self.assertRaises(
+            ValueError, mnemonicode.mnparse_into, "camera-kazoo",
+            bytearray(4),
+        )
 
+    def test_parse_into_read_only(self):
+        self.assertRaises(
+            TypeError, mnemonicode.mnparse_into, "camera", b"xxxx",
+        )
 
-class TestDecodeCommand(unittest.TestCase):
-    def test_basic(self):
-        try:
-            p = subprocess.Popen(
-                ['mndecode'], stdin=subprocess.PIPE, stdout=subprocess.PIPE
-            )
-            stdout, stderr = p.communicate(
-                b"bridge-office-report--ruby-tiger-suzuki", timeout=1
-            )
-            self.assertEqual(stdout, b"rambutan")
-            self.assertFalse(stderr)
+    def test_decode_into(self):
+        buffer = bytearray(6)
+        self.assertEqual(mnemonicode.mndecode_into(
+            [("turtle", "special", "recycle"), ("ferrari", "album")], buffer,
+        ), 6)
+        self.assertEqual(buffer, b"potato")
 
-            p.wait(timeout=1)
-            self.assertEqual(p.returncode, 0)
-        except BaseException:  # pragma: no cover
-            _try_kill(p)
-            raise
+    def test_decode_into_buffer_too_small(self):
+        self.assertRaises(
+            ValueError, mnemonicode.mndecode_into,
+            [("turtle", "special", "recycle")], bytearray(3),
+        )
 
-    def test_binary(self):
-        try:
-            p = subprocess.Popen(
-                ['mndecode'], stdin=subprocess.PIPE, stdout=subprocess.PIPE
-            )
-            stdout, stderr = p.communicate(
-                b"battery-cinema-alex--spirit-rose-weather--neutral-archive",
-                timeout=1
+    def test_encoded_length(self):
+        for size in [0, 1, 2, 3, 4, 5, 6, 7, 8, 100]:
+            data = os.urandom(size)
+            self.assertEqual(
+                mnemonicode.encoded_length(data),
+                len(mnemonicode.mnformat(data)),
             )
             self.assertEqual(
-                stdout, bytes([0, 1, 2, 3, 4, 251, 252, 253, 254, 255])
+                mnemonicode.encoded_length(
+                    data, word_separator=" ", group_separator=", ",
+                ),
+                len(mnemonicode.mnformat(
+                    data, word_separator=" ", group_separator=", ",
+                )),
             )
-            self.assertFalse(stderr)
 
-            p.wait(timeout=1)
-            self.assertEqual(p.returncode, 0)
-        except BaseException:  # pragma: no cover
-            _try_kill(p)
-            raise
+    def test_max_encoded_length(self):
+        self.assertEqual(mnemonicode.max_encoded_length(0), 0)
+        for size in [1, 2, 3, 4, 5, 6, 7, 8, 100]:
+            for _ in range(20):
+                self.assertLessEqual(
+                    len(mnemonicode.mnformat(os.urandom(size))),
+                    mnemonicode.max_encoded_length(size),
+                )
+        self.assertRaises(ValueError, mnemonicode.max_encoded_length, -1)
+
+    def test_decoded_length(self):
+        for size in [0, 1, 2, 3, 4, 5, 6, 7, 8, 100]:
+            string = mnemonicode.mnformat(os.urandom(size))
+            self.assertEqual(mnemonicode.decoded_length(string), size)
+            string = mnemonicode.mnformat(
+                os.urandom(size), word_separator=" ", group_separator=", ",
+            )
+            self.assertEqual(mnemonicode.decoded_length(
+                string, word_separator=" ", group_separator=", ",
+            ), size)
 
-    def test_input_file(self):
-        f = tempfile.NamedTemporaryFile('wb', delete=False)
-        try:
-            f.write(b"rondo-presto-total--daniel-alex")
-            f.close()
+    def test_decoded_length_not_string(self):
+        self.assertRaises(TypeError, mnemonicode.decoded_length, b"camera")
 
-            p = subprocess.Popen(
-                ['mndecode', f.name], stdout=subprocess.PIPE,
-            )
-            stdout, stderr = p.communicate(timeout=1)
-            self.assertEqual(stdout, b"cherry")
-            self.assertFalse(stderr)
 
-            p.wait(timeout=1)
-            self.assertEqual(p.returncode, 0)
-        except BaseException:  # pragma: no cover
-            _try_kill(p)
-            raise
-        finally:
-            os.unlink(f.name)
+class TestIntegers(unittest.TestCase):
+    numbers = [
+        0, 1, 255, 256, 1625, 1626, 0x64636261, 0xffffffff,
+        0x100000000, 0x123456789abcdef0, 0xffffffffffffffff,
+    ]
 
-    def test_output_file(self):
-        with tempfile.TemporaryDirectory() as d:
-            output_path = os.path.join(d, "output")
-            try:
-                p = subprocess.Popen(
-                    ['mndecode', '-o', output_path], stdin=subprocess.PIPE,
-                )
-                stdout, stderr = p.communicate(
-                    b"status-libra-recycle--radar-animal-stone--carlo",
-                    timeout=1
+    def test_format_matches_bytes(self):
+        for width in (4, 8):
+            for num in self.numbers:
+                if num >> (8 * width):
+                    continue
+                self.assertEqual(
+                    mnemonicode.mnformat_int(num, width=width),
+                    mnemonicode.mnformat(num.to_bytes(width, 'little')),
                 )
-                self.assertFalse(stdout)
-                self.assertFalse(stderr)
 
-                p.wait(timeout=1)
-                self.assertEqual(p.returncode, 0)
-            except BaseException:  # pragma: no cover
-                _try_kill(p)
-                raise
+    def test_format_separators(self):
+        self.assertEqual(
+            mnemonicode.mnformat_int(
+                0x100000000, width=8,
+                word_separator=" ", group_separator=", ",
+            ),
+            "academy academy academy, acrobat academy academy",
+        )
 
-            with open(output_path, 'rb') as f:
-                self.assertEqual(f.read(), b"tamarillo")
+    def test_parse_matches_bytes(self):
+        for width in (4, 8):
+            for num in self.numbers:
+                if num >> (8 * width):
+                    continue
+                string = mnemonicode.mnformat(num.to_bytes(width, 'little'))
+                self.assertEqual(mnemonicode.mnparse_int(string), num)
+
+    def test_parse_partial_blocks(self):
+        for data in [b"", b"a", b"ab", b"abc", b"abcde", b"abcdefg"]:
+            self.assertEqual(
+                mnemonicode.mnparse_int(mnemonicode.mnformat(data)),
+                int.from_bytes(data, 'little'),
+            )
+
+    def test_parse_separators(self):
+        self.assertEqual(
+            mnemonicode.mnparse_int(
+                "academy academy academy, acrobat academy academy",
+                word_separator=" ", group_separator=", ",
+            ),
+            0x100000000,
+        )
+
+    def test_format_out_of_range(self):
+        self.assertRaises(ValueError, mnemonicode.mnformat_int, -1)
+        self.assertRaises(ValueError, mnemonicode.mnformat_int, 1 << 32)
+        self.assertRaises(
+            ValueError, mnemonicode.mnformat_int, 1 << 64, width=8,
+        )
+
+    def test_format_bad_width(self):
+        self.assertRaises(ValueError, mnemonicode.mnformat_int, 1, width=2)
+
+    def test_format_not_int(self):
+        self.assertRaises(TypeError, mnemonicode.mnformat_int, b"abcd")
+
+    def test_parse_invalid(self):
+        self.assertRaises(ValueError, mnemonicode.mnparse_int, "kazoo")
+        self.assertRaises(
+            ValueError, mnemonicode.mnparse_int, "amen-amen-amen",
+        )
+        self.assertRaises(
+            ValueError, mnemonicode.mnparse_int, "jet-academy-academy",
+        )
+        self.assertRaises(TypeError, mnemonicode.mnparse_int, b"camera")
+
+
+class TestCache(unittest.TestCase):
+    def tearDown(self):
+        mnemonicode.disable_cache()
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(mnemonicode.cache_info())
+
+    def test_encode_matches_uncached(self):
+        data = bytes(range(256)) * 3 + b"abc"
+        records = [b"", b"a", b"abcd", b"abcd", b"abcdefg", data]
+
+        expected_format = mnemonicode.mnformat(data)
+        expected_encode = list(mnemonicode.mnencode(data))
+        expected_many = list(mnemonicode.mnformat_many(records))
+
+        mnemonicode.enable_cache(maxsize=16)
+        self.assertEqual(mnemonicode.mnformat(data), expected_format)
+        self.assertEqual(list(mnemonicode.mnencode(data)), expected_encode)
+        self.assertEqual(
+            list(mnemonicode.mnformat_many(records)), expected_many,
+        )
+
+    def test_decode_matches_uncached(self):
+        strings = [
+            "", "camera", "bogart-atlas-safari--cannon",
+            mnemonicode.mnformat(bytes(range(256)) * 3),
+            "kazoo", "jet-jet",
+        ]
+        expected = mnemonicode.mnparse_many(strings, errors="collect")
+
+        mnemonicode.enable_cache(maxsize=16)
+        self.assertEqual(
+            mnemonicode.mnparse_many(strings, errors="collect"), expected,
+        )
+        self.assertEqual(
+            mnemonicode.mnparse(strings[3]), bytes(range(256)) * 3,
+        )
+        self.assertRaises(ValueError, mnemonicode.mnparse, "kazoo")
+        self.assertRaises(ValueError, mnemonicode.mnparse, "kazoo")
+
+    def test_statistics(self):
+        mnemonicode.enable_cache(maxsize=2)
+
+        mnemonicode.mnformat(b"aaaabbbbaaaacccc")
+        self.assertEqual(
+            mnemonicode.cache_info().encode,
+            mnemonicode.CacheInfo(
+                hits=1, misses=3, evictions=1, maxsize=2, currsize=2,
+            ),
+        )
+
+        mnemonicode.mnparse("camera--camera")
+        self.assertEqual(
+            mnemonicode.cache_info().decode,
+            mnemonicode.CacheInfo(
+                hits=1, misses=1, evictions=0, maxsize=2, currsize=1,
+            ),
+        )
+
+    def test_enable_resets(self):
+        mnemonicode.enable_cache()
+        mnemonicode.mnformat(b"abcd")
+        mnemonicode.enable_cache()
+        self.assertEqual(mnemonicode.cache_info().encode.misses, 0)
+
+    def test_invalid_maxsize(self):
+        self.assertRaises(ValueError, mnemonicode.enable_cache, 0)
+
+    def test_threads(self):
+        mnemonicode.enable_cache(maxsize=8)
+        records = [
+            bytes([i % 13, i % 7, i % 5, i % 3]) * 4 for i in range(200)
+        ]
+        expected = list(mnemonicode.mnformat_many(records))
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(20):
+                    result = list(mnemonicode.mnformat_many(records))
+                    if result != expected:  # pragma: no cover
+                        errors.append(result)
+            except BaseException as e:  # pragma: no cover
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+
+class TestIterParse(unittest.TestCase):
+    def test_matches_mnparse(self):
+        data = bytes(range(256)) + b"abc"
+        string = mnemonicode.mnformat(data)
+        for size in [1, 2, 3, 7, 20, 1000]:
+            chunks = [
+                string[offset:offset + size]
+                for offset in range(0, len(string), size)
+            ]
+            self.assertEqual(b"".join(mnemonicode.mniterparse(chunks)), data)
+
+    def test_file(self):
+        data = bytes(range(256))
+        stream = io.StringIO(mnemonicode.mnformat(data))
+        self.assertEqual(
+            b"".join(mnemonicode.mniterparse(stream, chunk_size=5)), data,
+        )
+
+    def test_separators(self):
+        self.assertEqual(
+            b"".join(mnemonicode.mniterparse(
+                ["bogart atlas safari,", " cannon"],
+                word_separator=" ", group_separator=", ",
+            )),
+            b"abcde",
+        )
+
+    def test_empty(self):
+        self.assertEqual(list(mnemonicode.mniterparse([])), [])
+        self.assertEqual(list(mnemonicode.mniterparse(["", ""])), [])
+
+    def test_trailing_group_separator(self):
+        self.assertRaises(
+            ValueError, list, mnemonicode.mniterparse(["camera--"]),
+        )
+
+    def test_invalid(self):
+        self.assertRaises(
+            ValueError, list, mnemonicode.mniterparse(["camera-kazoo"]),
+        )
+
+    def test_not_string(self):
+        self.assertRaises(
+            TypeError, list, mnemonicode.mniterparse([b"camera"]),
+        )
+
+    def test_group_too_long(self):
+        chunks = mnemonicode.mniterparse(iter(lambda: "academy-", None))
+        self.assertRaises(ValueError, list, chunks)
+
+    def test_correct_max_length_words(self):
+        # Each word is as long as the longest in the wordlist, with an extra
+        # character inserted.
+        string = "acaqdemy-acrqobat-admqiral--acaqdemy-acrqobat-admqiral"
+        self.assertEqual(
+            b"".join(mnemonicode.mniterparse(list(string), correct=True)),
+            mnemonicode.mnparse(string, correct=True),
+        )
+
+
+class TestDecodingReader(unittest.TestCase):
+    def test_read(self):
+        data = bytes(range(256))
+        reader = mnemonicode.DecodingReader(
+            io.StringIO(mnemonicode.mnformat(data)),
+        )
+        self.assertTrue(reader.readable())
+        self.assertEqual(reader.read(5), data[:5])
+        self.assertEqual(reader.read(100), data[5:105])
+        self.assertEqual(reader.read(), data[105:])
+        self.assertEqual(reader.read(), b"")
+
+    def test_buffered(self):
+        data = bytes(range(256))
+        reader = io.BufferedReader(mnemonicode.DecodingReader(
+            [mnemonicode.mnformat(data)]
+        ))
+        self.assertEqual(reader.read(), data)
+
+
+class TestCodec(unittest.TestCase):
+    def test_encode(self):
+        self.assertEqual(
+            codecs.encode(b"tomato", "mnemonicode"),
+            "scoop-limit-recycle--ferrari-album",
+        )
+
+    def test_decode(self):
+        self.assertEqual(
+            codecs.decode("scoop-limit-recycle--ferrari-album", "mnemonicode"),
+            b"tomato",
+        )
+
+    def test_decode_invalid(self):
+        self.assertRaises(
+            ValueError, codecs.decode, "camera-kazoo", "mnemonicode",
+        )
+
+    def test_not_text_encoding(self):
+        self.assertRaises(LookupError, "camera".encode, "mnemonicode")
+
+    def test_errors(self):
+        self.assertRaises(
+            ValueError, codecs.encode, b"tomato", "mnemonicode", "ignore",
+        )
+
+    def test_iterencode(self):
+        data = bytes(range(256)) + b"abc"
+        for size in [1, 2, 3, 7, 1000]:
+            chunks = chunk_sequence(data, size)
+            self.assertEqual(
+                "".join(codecs.iterencode(chunks, "mnemonicode")),
+                mnemonicode.mnformat(data),
+            )
+
+    def test_iterdecode(self):
+        data = bytes(range(256)) + b"abc"
+        string = mnemonicode.mnformat(data)
+        for size in [1, 2, 3, 7, 1000]:
+            chunks = chunk_sequence(string, size)
+            self.assertEqual(
+                b"".join(codecs.iterdecode(chunks, "mnemonicode")), data,
+            )
+
+    def test_iterdecode_empty(self):
+        self.assertEqual(list(codecs.iterdecode([], "mnemonicode")), [])
+
+    def test_incremental_reset(self):
+        encoder = codecs.getincrementalencoder("mnemonicode")()
+        self.assertEqual(encoder.encode(b"tom"), "")
+        encoder.reset()
+        self.assertEqual(encoder.encode(b"to", final=True), "ferrari-album")
+
+    def test_stream_writer(self):
+        stream = io.StringIO()
+        writer = codecs.getwriter("mnemonicode")(stream)
+        writer.write(b"t")
+        writer.write(b"omat")
+        self.assertEqual(stream.getvalue(), "scoop-limit-recycle")
+        writer.write(b"o")
+        writer.reset()
+        self.assertEqual(
+            stream.getvalue(), "scoop-limit-recycle--ferrari-album",
+        )
+        writer.write(b"abcd")
+        writer.reset()
+        self.assertEqual(
+            mnemonicode.mnparse(stream.getvalue()), b"tomatoabcd",
+        )
+
+    def test_stream_writer_close(self):
+        stream = io.StringIO()
+        stream.close = lambda: None  # type: ignore
+        with codecs.getwriter("mnemonicode")(stream) as writer:
+            writer.write(b"tomato")
+        self.assertEqual(
+            stream.getvalue(), "scoop-limit-recycle--ferrari-album",
+        )
+
+    def test_stream_reader(self):
+        data = bytes(range(256))
+        reader = codecs.getreader("mnemonicode")(
+            io.StringIO(mnemonicode.mnformat(data)),
+        )
+        self.assertEqual(reader.read(5), data[:5])
+        self.assertEqual(reader.read(100), data[5:105])
+        self.assertEqual(reader.read(), data[105:])
+        self.assertEqual(reader.read(), b"")
+
+    def test_stream_reader_binary(self):
+        data = bytes(range(256))
+        reader = codecs.getreader("mnemonicode")(
+            io.BytesIO(mnemonicode.mnformat(data).encode('ascii')),
+        )
+        self.assertEqual(reader.read(5), data[:5])
+        self.assertEqual(reader.read(), data[5:])
+        self.assertEqual(reader.read(), b"")
+
+    def test_stream_writer_binary(self):
+        stream = io.BytesIO()
+        writer = codecs.getwriter("mnemonicode")(stream)
+        writer.write(b"tom")
+        writer.write(b"ato")
+        writer.reset()
+        self.assertEqual(
+            stream.getvalue(), b"scoop-limit-recycle--ferrari-album",
+        )
+
+    def test_stream_writer_writelines(self):
+        stream = io.StringIO()
+        writer = codecs.getwriter("mnemonicode")(stream)
+        writer.writelines([b"tom", b"ato"])
+        writer.reset()
+        self.assertEqual(
+            stream.getvalue(), "scoop-limit-recycle--ferrari-album",
+        )
+
+
+class TestSeekableDecodingReader(unittest.TestCase):
+    def _reader(self, data, **kwargs):
+        word_separator = kwargs.get('word_separator', '-')
+        group_separator = kwargs.get('group_separator', '--')
+        return mnemonicode.SeekableDecodingReader(io.BytesIO(
+            mnemonicode.mnformat(
+                data, word_separator=word_separator,
+                group_separator=group_separator,
+            ).encode('utf-8') + b"\n"
+        ), **kwargs)
+
+    def test_read(self):
+        data = os.urandom(1001)
+        reader = self._reader(data, index_interval=4)
+        self.assertTrue(reader.readable())
+        self.assertTrue(reader.seekable())
+        self.assertEqual(reader.read(5), data[:5])
+        self.assertEqual(reader.read(100), data[5:105])
+        self.assertEqual(reader.read(), data[105:])
+        self.assertEqual(reader.read(), b"")
+
+    def test_seek(self):
+        data = os.urandom(1001)
+        reader = self._reader(data, index_interval=4)
+        for start, size in [(0, 4), (3, 9), (500, 1), (998, 10), (77, 200)]:
+            self.assertEqual(reader.seek(start), start)
+            self.assertEqual(reader.read(size), data[start:start + size])
+            self.assertEqual(reader.tell(), min(start + size, len(data)))
+
+    def test_seek_whence(self):
+        data = os.urandom(10)
+        reader = self._reader(data)
+        self.assertEqual(reader.seek(0, io.SEEK_END), 10)
+        self.assertEqual(reader.seek(-3, io.SEEK_END), 7)
+        self.assertEqual(reader.seek(-2, io.SEEK_CUR), 5)
+        self.assertEqual(reader.read(), data[5:])
+        self.assertEqual(reader.seek(20), 20)
+        self.assertEqual(reader.read(), b"")
+        self.assertRaises(ValueError, reader.seek, -1)
+        self.assertRaises(ValueError, reader.seek, 0, 3)
+
+    def test_separators(self):
+        data = os.urandom(101)
+        reader = self._reader(
+            data, word_separator=" ", group_separator="\n",
+            index_interval=1,
+        )
+        reader.seek(37)
+        self.assertEqual(reader.read(20), data[37:57])
+        self.assertEqual(reader.seek(0, io.SEEK_END), 101)
+
+    def test_empty(self):
+        reader = mnemonicode.SeekableDecodingReader(io.BytesIO(b"\n"))
+        self.assertEqual(reader.seek(0, io.SEEK_END), 0)
+        self.assertEqual(reader.read(), b"")
+
+    def test_buffered(self):
+        data = os.urandom(100000)
+        reader = io.BufferedReader(self._reader(data))
+        reader.seek(12345)
+        self.assertEqual(reader.read(10), data[12345:12355])
+        reader.seek(0)
+        self.assertEqual(reader.read(), data)
+
+    def test_partial_block(self):
+        reader = mnemonicode.SeekableDecodingReader(io.BytesIO(
+            b"academy-academy-jet--academy"
+        ))
+        self.assertRaises(ValueError, reader.read)
+
+    def test_invalid(self):
+        reader = mnemonicode.SeekableDecodingReader(io.BytesIO(
+            b"academy-academy-academy--camera-kazoo"
+        ))
+        self.assertRaises(ValueError, reader.read)
+
+    def test_separator_across_chunks(self):
+        data = os.urandom(1001)
+        chunk_size = mnemonicode._INDEX_CHUNK_SIZE
+        try:
+            for size in [1, 2, 3, 7]:
+                mnemonicode._INDEX_CHUNK_SIZE = size
+                reader = self._reader(data, index_interval=3)
+                self.assertEqual(reader.seek(0, io.SEEK_END), len(data))
+                reader.seek(500)
+                self.assertEqual(reader.read(100), data[500:600])
+        finally:
+            mnemonicode._INDEX_CHUNK_SIZE = chunk_size
+
+    def test_no_separators(self):
+        # The index is built a chunk at a time, and the final group is only
+        # read if it could be valid, so this never holds the whole file.
+        source = io.BytesIO(b"academy-" * (1 << 18) + b"academy")
+        sizes = []
+        read = source.read
+
+        def tracked(size=-1):
+            data = read(size)
+            sizes.append(len(data))
+            return data
+
+        source.read = tracked
+        reader = mnemonicode.SeekableDecodingReader(source)
+        with self.assertRaisesRegex(ValueError, "group too long"):
+            reader.read()
+        self.assertLessEqual(max(sizes), mnemonicode._INDEX_CHUNK_SIZE)
+
+
+class TestFind(unittest.TestCase):
+    def _find(self, text, **kwargs):
+        return [
+            (offset, text[offset:offset + length], data)
+            for offset, length, data in mnemonicode.mnfind(text, **kwargs)
+        ]
+
+    def test_basic(self):
+        self.assertEqual(self._find(
+            "id: scoop-limit-recycle--ferrari-album, "
+            "next: bridge-office-report--ruby-tiger-suzuki."
+        ), [
+            (4, "scoop-limit-recycle--ferrari-album", b"tomato"),
+            (46, "bridge-office-report--ruby-tiger-suzuki", b"rambutan"),
+        ])
+
+    def test_min_length(self):
+        text = "alpha ego scoop-limit-recycle zero-albert camera"
+        self.assertEqual(
+            [data for _, _, data in self._find(text)], [b"toma"],
+        )
+        self.assertEqual(
+            [data for _, _, data in self._find(text, min_length=1)],
+            [b"\x18", b"toma", b"ab", b"a"],
+        )
+
+    def test_word_boundaries(self):
+        for text in [
+            "xscoop-limit-recycle",
+            "scoop-limit-recyclex",
+            "9scoop-limit-recycle",
+            "scoop-limit-recycleX",
+        ]:
+            self.assertEqual(self._find(text), [])
+
+    def test_split_on_invalid_group(self):
+        self.assertEqual(self._find(
+            "scoop-limit-recycle--kazoo-limit-recycle--scoop-limit-recycle"
+        ), [
+            (0, "scoop-limit-recycle", b"toma"),
+            (42, "scoop-limit-recycle", b"toma"),
+        ])
+
+    def test_split_after_partial_block(self):
+        # Three byte blocks can only appear at the end of an encoding.
+        text = mnemonicode.mnformat(b"abc") + "--" + mnemonicode.mnformat(
+            b"abcd"
+        )
+        self.assertEqual(
+            [data for _, _, data in self._find(text, min_length=3)],
+            [b"abc", b"abcd"],
+        )
+
+    def test_uppercase_ignored(self):
+        self.assertEqual(self._find("SCOOP-LIMIT-RECYCLE"), [])
+
+    def test_separators(self):
+        self.assertEqual(self._find(
+            "Scoop Limit Recycle. scoop limit recycle, ferrari album",
+            word_separator=" ", group_separator=", ",
+        ), [
+            (21, "scoop limit recycle, ferrari album", b"tomato"),
+        ])
+
+    def test_invalid_separators(self):
+        for word_separator, group_separator in [
+            ("", "--"), ("-", ""), ("x", "--"), ("-", "and"),
+        ]:
+            self.assertRaises(ValueError, list, mnemonicode.mnfind(
+                "", word_separator=word_separator,
+                group_separator=group_separator,
+            ))
+
+    def test_chunked(self):
+        data = [os.urandom(size) for size in (4, 7, 100, 1000, 5)]
+        text = "\n".join(
+            "line {index}: {string}!".format(
+                index=index, string=mnemonicode.mnformat(record),
+            )
+            for index, record in enumerate(data)
+        )
+        expected = list(mnemonicode.mnfind(text))
+        self.assertEqual([found.data for found in expected], data)
+
+        for size in (1, 2, 3, 5, 64, 1000):
+            self.assertEqual(list(mnemonicode.mnfind(
+                text[i:i + size] for i in range(0, len(text), size)
+            )), expected)
+            self.assertEqual(list(mnemonicode.mnfind(
+                io.StringIO(text), chunk_size=size,
+            )), expected)
+
+    def test_long_run(self):
+        # Runs without any break longer than the finder is willing to buffer
+        # are carried over between pieces, rather than buffered.
+        data = os.urandom(100000)
+        text = "start " + mnemonicode.mnformat(data) + " end"
+        self.assertEqual(list(mnemonicode.mnfind(
+            text[i:i + 1000] for i in range(0, len(text), 1000)
+        )), [mnemonicode.Occurrence(6, len(text) - 10, data)])
+
+
+def _custom_wordlist():
+    return [
+        mnemonicode.mnformat(index.to_bytes(2, 'little')).replace('-', '_')
+        for index in range(1633)
+    ]
+
+
+class TestCodecClass(unittest.TestCase):
+    def test_default(self):
+        codec = mnemonicode.Codec()
+        for size in [0, 1, 2, 3, 4, 5, 100, 1000]:
+            data = os.urandom(size)
+            string = mnemonicode.mnformat(data)
+            self.assertEqual(codec.format(data), string)
+            self.assertEqual(
+                list(codec.encode(data)), list(mnemonicode.mnencode(data)),
+            )
+            self.assertEqual(codec.parse(string), data)
+            self.assertEqual(codec.decode(codec.encode(data)), data)
+
+    def test_separators(self):
+        codec = mnemonicode.Codec(word_separator=" ", group_separator=", ")
+        self.assertEqual(codec.word_separator, " ")
+        self.assertEqual(codec.group_separator, ", ")
+        self.assertEqual(
+            codec.format(b"tomato"), "scoop limit recycle, ferrari album",
+        )
+        self.assertEqual(
+            codec.parse("scoop limit recycle, ferrari album"), b"tomato",
+        )
+
+    def test_custom_wordlist(self):
+        wordlist = _custom_wordlist()
+        codec = mnemonicode.Codec(wordlist)
+        self.assertEqual(codec.wordlist, tuple(wordlist))
+        self.assertEqual(
+            codec.format(b"\x00\x00\x00\x00"),
+            "academy_academy-academy_academy-academy_academy",
+        )
+        for size in [0, 1, 2, 3, 4, 5, 100, 1000]:
+            data = os.urandom(size)
+            string = codec.format(data)
+            self.assertEqual(codec.parse(string), data)
+            self.assertEqual(codec.decode(codec.encode(data)), data)
+
+            sink = bytearray()
+            self.assertEqual(codec.format_to(data, sink), len(sink))
+            self.assertEqual(sink, string.encode('utf-8'))
+
+    def test_custom_wordlist_errors(self):
+        codec = mnemonicode.Codec(_custom_wordlist())
+        self.assertRaises(ValueError, codec.parse, "academy-academy")
+        # Errors name words from the custom wordlist.
+        group = "-".join(codec.wordlist[index] for index in (1626, 0, 0))
+        with self.assertRaisesRegex(ValueError, repr(codec.wordlist[1626])):
+            codec.parse(group)
+        with self.assertRaisesRegex(ValueError, repr(codec.wordlist[1626])):
+            codec.parse("--".join([codec.format(b"abcd")] * 100 + [group]))
+        self.assertRaises(TypeError, codec.parse, b"academy")
+        self.assertRaises(TypeError, codec.decode, [["academy"]])
+
+    def test_abbreviated(self):
+        codec = mnemonicode.Codec(word_separator=" ", group_separator=", ")
+        self.assertEqual(codec.complete('alas'), ['alaska'])
+        self.assertRaises(TypeError, codec.complete, b'alas')
+        self.assertEqual(
+            codec.parse('scoo limi recy, ferr albu', abbreviated=True),
+            b'tomato',
+        )
+        self.assertRaises(ValueError, codec.parse, 'scoo limi recy, ferr albu')
+        self.assertEqual(
+            codec.decode([('scoo', 'limi', 'recy')], abbreviated=True),
+            b'toma',
+        )
+
+    def test_correct(self):
+        codec = mnemonicode.Codec(word_separator=" ", group_separator=", ")
+        self.assertEqual(
+            codec.correct('scoop limti recycle, ferari album'),
+            ('scoop limit recycle, ferrari album', [
+                mnemonicode.Correction(6, 'limti', 'limit'),
+                mnemonicode.Correction(21, 'ferari', 'ferrari'),
+            ]),
+        )
+        self.assertEqual(
+            codec.parse('scoop limti recycle, ferari album', correct=True),
+            b'tomato',
+        )
+        self.assertRaises(
+            ValueError, codec.parse, 'scoop limti recycle, ferari album',
+        )
+
+    def test_custom_wordlist_abbreviated_and_correct(self):
+        codec = mnemonicode.Codec(_custom_wordlist())
+        # Abbreviations and corrections come from the codec's own wordlist.
+        self.assertEqual(
+            codec.complete('academy_ac'),
+            ['academy_academy', 'academy_acrobat'],
+        )
+        self.assertEqual(codec.complete('alaska'), ['alaska_academy'])
+
+        data = os.urandom(100)
+        groups = [
+            tuple(word[:-1] for word in group) for group in codec.encode(data)
+        ]
+        self.assertEqual(codec.decode(groups, abbreviated=True), data)
+
+        string = codec.format(data)
+        typos = string.replace('_academy', '_acadmey')
+        self.assertEqual(codec.parse(typos, correct=True), data)
+        corrected, corrections = codec.correct(typos)
+        self.assertEqual(corrected, string)
+        self.assertEqual(len(corrections), string.count('_academy'))
+
+    def test_default_codec(self):
+        codec = mnemonicode._DEFAULT_CODEC
+        self.assertIsInstance(codec, mnemonicode.Codec)
+        mnemonicode.mnparse('scoo-limi-recy', abbreviated=True)
+        self.assertIsNotNone(codec._prefix_trie)
+
+    def test_invalid_wordlist(self):
+        wordlist = _custom_wordlist()
+        self.assertRaises(ValueError, mnemonicode.Codec, wordlist[:-1])
+        self.assertRaises(
+            ValueError, mnemonicode.Codec, wordlist[:-1] + [wordlist[0]],
+        )
+        self.assertRaises(
+            ValueError, mnemonicode.Codec, wordlist[:-1] + [""],
+        )
+        self.assertRaises(
+            TypeError, mnemonicode.Codec, wordlist[:-1] + [b"word"],
+        )
+        self.assertRaises(
+            ValueError, mnemonicode.Codec, wordlist, word_separator="_",
+        )
+
+    def test_invalid_separators(self):
+        self.assertRaises(ValueError, mnemonicode.Codec, word_separator="")
+        self.assertRaises(TypeError, mnemonicode.Codec, group_separator=b"-")
+
+    def test_immutable(self):
+        codec = mnemonicode.Codec()
+        with self.assertRaises(AttributeError):
+            codec.word_separator = " "  # type: ignore
+        with self.assertRaises(AttributeError):
+            codec._words = []  # type: ignore
+        with self.assertRaises(AttributeError):
+            codec.other = 1  # type: ignore
+        with self.assertRaises(AttributeError):
+            del codec._words
+
+
+class TestParseMany(unittest.TestCase):
+    def test_matches_mnparse(self):
+        strings = [
+            "", "camera", "zero-albert", "bogart-atlas-safari--cannon",
+            mnemonicode.mnformat(bytes(range(256))),
+        ]
+        self.assertEqual(
+            mnemonicode.mnparse_many(strings),
+            ([mnemonicode.mnparse(string) for string in strings], []),
+        )
+
+    def test_separators(self):
+        self.assertEqual(
+            mnemonicode.mnparse_many(
+                ["bogart atlas safari, cannon"],
+                word_separator=" ", group_separator=", ",
+            ),
+            ([b"abcde"], []),
+        )
+
+    def test_raise(self):
+        self.assertRaises(
+            ValueError, mnemonicode.mnparse_many, ["camera", "kazoo"],
+        )
+        self.assertRaises(
+            TypeError, mnemonicode.mnparse_many, ["camera", b"camera"],
+        )
+
+    def test_skip(self):
+        self.assertEqual(
+            mnemonicode.mnparse_many(
+                ["camera", "kazoo", b"camera", "zero-albert"], errors="skip",
+            ),
+            ([b"a", b"ab"], []),
+        )
+
+    def test_collect(self):
+        results, failures = mnemonicode.mnparse_many([
+            "camera",
+            "kazoo",
+            "bogart-atlas-safari--jet-jet",
+            "academy-academy-academy-academy",
+            "bogart-atlas-safari--cannon--",
+            "amen",
+            b"camera",
+        ], errors="collect")
+        self.assertEqual(results, [b"a"] + [None] * 6)
+        self.assertEqual(failures, [
+            mnemonicode.ParseFailure(1, 0, "word not recognized"),
+            mnemonicode.ParseFailure(
+                2, 21, "unexpected three byte word: 'jet'",
+            ),
+            mnemonicode.ParseFailure(3, 0, "too many words in block"),
+            mnemonicode.ParseFailure(4, 29, "word not recognized"),
+            mnemonicode.ParseFailure(5, 0, "block overflow"),
+            mnemonicode.ParseFailure(6, 0, "expected string, got bytes"),
+        ])
+
+    def test_unknown_errors_scheme(self):
+        self.assertRaises(
+            ValueError, mnemonicode.mnparse_many, [], errors="ignore",
+        )
+
+
+class TestColumnar(unittest.TestCase):
+    records = [
+        b"", b"a", b"ab", b"abc", b"abcd", b"abcdefg", bytes(range(256)), b"",
+    ]
+
+    def test_encode(self):
+        offsets, data = mnemonicode.columnar.encode_column(self.records)
+        self.assertEqual(offsets.typecode, 'i')
+        self.assertEqual(offsets[0], 0)
+        self.assertEqual(len(offsets), len(self.records) + 1)
+        self.assertEqual(
+            [
+                data[offsets[i]:offsets[i + 1]].decode('utf-8')
+                for i in range(len(self.records))
+            ],
+            [mnemonicode.mnformat(record) for record in self.records],
+        )
+
+    def test_encode_large(self):
+        offsets, data = mnemonicode.columnar.encode_column(
+            [b"abc"], large=True,
+        )
+        self.assertEqual(offsets.typecode, 'q')
+        self.assertEqual(offsets.itemsize, 8)
+        self.assertEqual(list(offsets), [0, 17])
+
+    def test_encode_separators(self):
+        offsets, data = mnemonicode.columnar.encode_column(
+            [b"abcde"], word_separator=" ", group_separator=", ",
+        )
+        self.assertEqual(data, b"bogart atlas safari, cannon")
+
+    def test_encode_not_bytes(self):
+        self.assertRaises(
+            TypeError, mnemonicode.columnar.encode_column, ["abc"],
+        )
+
+    def test_round_trip(self):
+        offsets, data = mnemonicode.columnar.decode_column(
+            *mnemonicode.columnar.encode_column(self.records)
+        )
+        self.assertEqual(
+            [
+                bytes(data[offsets[i]:offsets[i + 1]])
+                for i in range(len(self.records))
+            ],
+            self.records,
+        )
+
+    def test_decode_memoryview(self):
+        offsets, data = mnemonicode.columnar.encode_column(self.records)
+        offsets, data = mnemonicode.columnar.decode_column(
+            memoryview(offsets), memoryview(data), large=True,
+        )
+        self.assertEqual(offsets.typecode, 'q')
+        self.assertEqual(bytes(data), b"".join(self.records))
+
+    def test_decode_invalid(self):
+        self.assertRaises(
+            ValueError, mnemonicode.columnar.decode_column,
+            [0, 6, 11], b"camerakazoo",
+        )
+
+
+class TestParallel(unittest.TestCase):
+    def test_format(self):
+        for size in [0, 1, 7, 8, 9, 100, 1001]:
+            data = os.urandom(size)
+            for chunk_size in [1, 4, 6, 64]:
+                self.assertEqual(
+                    mnemonicode.parallel.parallel_mnformat(
+                        data, jobs=2, chunk_size=chunk_size,
+                    ),
+                    mnemonicode.mnformat(data),
+                )
+
+    def test_format_separators(self):
+        self.assertEqual(
+            mnemonicode.parallel.parallel_mnformat(
+                b"abcde", word_separator=" ", group_separator=", ",
+                jobs=2, chunk_size=4,
+            ),
+            "bogart atlas safari, cannon",
+        )
+
+    def test_parse(self):
+        for size in [0, 1, 7, 8, 9, 100, 1001]:
+            data = os.urandom(size)
+            string = mnemonicode.mnformat(data)
+            for chunk_size in [1, 20, 64]:
+                self.assertEqual(
+                    mnemonicode.parallel.parallel_mnparse(
+                        string, jobs=2, chunk_size=chunk_size,
+                    ),
+                    data,
+                )
+
+    def test_parse_abbreviated(self):
+        self.assertEqual(
+            mnemonicode.parallel.parallel_mnparse(
+                "pari-pear-ultr--gent-press-tota", abbreviated=True,
+                jobs=2, chunk_size=1,
+            ),
+            b"cucumber",
+        )
+
+    def test_parse_errors(self):
+        # Errors, including their positions, should match `mnparse`.
+        for string in [
+            'alice-isotope-jet--battery-scorpio-xyzzy',
+            'alice-isotope-jet--battery-scorpio-samba--',
+            'alice-isotope-jet----battery-scorpio-samba',
+        ]:
+            with self.assertRaises(ValueError) as expected:
+                mnemonicode.mnparse(string)
+            with self.assertRaises(ValueError) as cm:
+                mnemonicode.parallel.parallel_mnparse(
+                    string, jobs=2, chunk_size=1,
+                )
+            self.assertEqual(str(cm.exception), str(expected.exception))
+
+    def test_parse_type(self):
+        self.assertRaises(
+            TypeError, mnemonicode.parallel.parallel_mnparse, b"alice",
+        )
+
+    def test_invalid_chunk_size(self):
+        self.assertRaises(
+            ValueError, mnemonicode.parallel.parallel_mnformat, b"fig",
+            chunk_size=0,
+        )
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestNumpy(unittest.TestCase):
+    def setUp(self):
+        import mnemonicode.numpy
+        self.mnnumpy = mnemonicode.numpy
+
+    def test_encode_uint32(self):
+        blocks = numpy.array([0, 1, 0x64636261, 0xffffffff], dtype='<u4')
+        self.assertEqual(
+            self.mnnumpy.encode_indices(blocks).tolist(),
+            [
+                list(mnemonicode._block_to_indices(block))
+                for block in (
+                    b'\x00\x00\x00\x00', b'\x01\x00\x00\x00', b'abcd',
+                    b'\xff\xff\xff\xff',
+                )
+            ],
+        )
+
+    def test_encode_big_endian_uint32(self):
+        blocks = numpy.array([0x64636261], dtype='>u4')
+        self.assertEqual(
+            self.mnnumpy.encode_indices(blocks).tolist(), [[1285, 52, 637]],
+        )
+
+    def test_encode_bytes(self):
+        no_word = self.mnnumpy.NO_WORD
+        for length in range(13):
+            data = bytes(range(250, 250 - length, -1))
+            expected = []
+            for offset in range(0, length, 4):
+                row = list(mnemonicode._block_to_indices(
+                    data[offset:offset + 4]
+                ))
+                expected.append(row + [no_word] * (3 - len(row)))
+
+            self.assertEqual(
+                self.mnnumpy.encode_indices(data).tolist(), expected,
+            )
+            self.assertEqual(
+                self.mnnumpy.encode_indices(
+                    numpy.frombuffer(data, dtype=numpy.uint8),
+                ).tolist(),
+                expected,
+            )
+
+    def test_encode_wrong_dtype(self):
+        self.assertRaises(
+            TypeError,
+            self.mnnumpy.encode_indices, numpy.zeros(4, dtype=numpy.int16),
+        )
+
+    def test_round_trip(self):
+        for length in range(13):
+            data = bytes(range(250, 250 - length, -1))
+            indices = self.mnnumpy.encode_indices(data)
+            self.assertEqual(
+                self.mnnumpy.decode_indices(indices).tobytes(), data,
+            )
+
+    def test_round_trip_uint32(self):
+        blocks = numpy.array([0, 7, 0x64636261, 0xffffffff], dtype="u4")
+        indices = self.mnnumpy.encode_indices(blocks)
+        self.assertEqual(
+            self.mnnumpy.decode_indices(indices).view('<u4').tolist(),
+            blocks.tolist(),
+        )
+
+    def test_decode_invalid(self):
+        no_word = self.mnnumpy.NO_WORD
+        for indices in [
+            [[0, 0, 0, 0]],
+            [[1626, 0, 0], [0, 0, 0]],
+            [[1625, 1625, 1625]],
+            [[0, 0, 1626], [0, 0, 0]],
+            [[0, no_word, no_word], [0, 0, 0]],
+            [[0, no_word, 0]],
+            [[1000, no_word, no_word]],
+            [[-1, 0, 0]],
+        ]:
+            self.assertRaises(
+                ValueError, self.mnnumpy.decode_indices, indices,
+            )
+
+    def test_indices_to_words(self):
+        indices = self.mnnumpy.encode_indices(b"abcdefg")
+        self.assertEqual(
+            self.mnnumpy.indices_to_words(indices).tolist(),
+            [list(group) for group in mnemonicode.mnencode(b"abcdefg")],
+        )
+
+
+class TestImport(unittest.TestCase):
+    def _run(self, code):
+        # Importing in a fresh interpreter is the only way to see what the
+        # import itself pulls in.
+        return subprocess.check_output(
+            [sys.executable, '-c', code], timeout=10,
+        ).decode('ascii').strip()
+
+    def test_argparse_not_imported(self):
+        self.assertEqual(self._run(
+            "import sys, mnemonicode; print('argparse' in sys.modules)"
+        ), "False")
+
+    def test_re_not_imported(self):
+        self.assertEqual(self._run(
+            "import sys, mnemonicode; print('re' in sys.modules)"
+        ), "False")
+
+    def test_cli_concurrent_futures_not_imported(self):
+        self.assertEqual(self._run(
+            "import sys, mnemonicode._cli; "
+            "print('concurrent.futures' in sys.modules)"
+        ), "False")
+
+    def test_word_indices_built_lazily(self):
+        self.assertEqual(self._run(
+            "import mnemonicode, mnemonicode._wordlist as w; "
+            "print(w._WORD_INDECES is None); "
+            "mnemonicode.mnformat(b'abc'); "
+            "print(w._WORD_INDECES is None); "
+            "mnemonicode.mnparse('camera'); "
+            "print(w._WORD_INDECES is None)"
+        ), "True\nTrue\nFalse")
+
+    def test_parse_tables_built_lazily(self):
+        self.assertEqual(self._run(
+            "import mnemonicode; "
+            "mnemonicode.mnparse('camera'); "
+            "print(mnemonicode._PARSE_TABLES is None); "
+            "mnemonicode.mnparse(mnemonicode.mnformat(bytes(64))); "
+            "print(mnemonicode._PARSE_TABLES is None)"
+        ), "True\nFalse")
+
+    def test_word_bytes_built_lazily(self):
+        self.assertEqual(self._run(
+            "import mnemonicode, mnemonicode._wordlist as w; "
+            "mnemonicode.mnformat(b'abc'); "
+            "print(w._WORD_BYTES is None); "
+            "mnemonicode.mnformat_to(b'abc', bytearray()); "
+            "print(w._WORD_BYTES is None)"
+        ), "True\nFalse")
+
+
+def _try_kill(p):  # pragma: no cover
+    p.terminate()
+    try:
+        p.wait(timeout=1)
+    except subprocess.TimeoutExpired:
+        p.kill()
+
+
+class TestEncodeCommand(unittest.TestCase):
+    def test_basic(self):
+        try:
+            p = subprocess.Popen(
+                ['mnencode'], stdin=subprocess.PIPE, stdout=subprocess.PIPE
+            )
+            stdout, stderr = p.communicate(b"rambutan", timeout=1)
+            self.assertEqual(
+                stdout, b"bridge-office-report--ruby-tiger-suzuki"
+            )
+            self.assertFalse(stderr)
+
+            p.wait(timeout=1)
+            self.assertEqual(p.returncode, 0)
+        except BaseException:  # pragma: no cover
+            _try_kill(p)
+            raise
+
+    def test_binary(self):
+        try:
+            p = subprocess.Popen(
+                ['mnencode'], stdin=subprocess.PIPE, stdout=subprocess.PIPE
+            )
+            stdout, stderr = p.communicate(
+                bytes([0, 1, 2, 3, 4, 251, 252, 253, 254, 255]), timeout=1
+            )
+            self.assertEqual(
+                stdout,
+                b"battery-cinema-alex--spirit-rose-weather--neutral-archive"
+            )
+            self.assertFalse(stderr)
+
+            p.wait(timeout=1)
+            self.assertEqual(p.returncode, 0)
+        except BaseException:  # pragma: no cover
+            _try_kill(p)
+            raise
+
+    def test_input_file(self):
+        f = tempfile.NamedTemporaryFile('wb', delete=False)
+        try:  # pragma: no cover
+            f.write(b"cherry")
+            f.close()
+
+            p = subprocess.Popen(
+                ['mnencode', f.name], stdout=subprocess.PIPE,
+            )
+            stdout, stderr = p.communicate(timeout=1)
+            self.assertEqual(stdout, b"rondo-presto-total--daniel-alex")
+            self.assertFalse(stderr)
+
+            p.wait(timeout=1)
+            self.assertEqual(p.returncode, 0)
+        except BaseException:  # pragma: no cover
+            _try_kill(p)
+            raise
+        finally:
+            os.unlink(f.name)
+
+    def test_input_file_chunks(self):
+        # Regular files are memory mapped and read a chunk at a time.
+        data = os.urandom(3 * mmap.PAGESIZE + 5)
+        f = tempfile.NamedTemporaryFile('wb', delete=False)
+        try:  # pragma: no cover
+            f.write(data)
+            f.close()
+
+            p = subprocess.Popen(
+                ['mnencode', '--buffer-size', '1000', f.name],
+                stdout=subprocess.PIPE,
+            )
+            stdout, stderr = p.communicate(timeout=5)
+            self.assertEqual(
+                stdout, mnemonicode.mnformat(data).encode('ascii'),
+            )
+            self.assertFalse(stderr)
+
+            p.wait(timeout=1)
+            self.assertEqual(p.returncode, 0)
+        except BaseException:  # pragma: no cover
+            _try_kill(p)
+            raise
+        finally:
+            os.unlink(f.name)
+
+    def test_input_file_empty(self):
+        # Empty files can't be memory mapped.
+        f = tempfile.NamedTemporaryFile('wb', delete=False)
+        try:  # pragma: no cover
+            f.close()
+
+            p = subprocess.Popen(
+                ['mnencode', f.name], stdout=subprocess.PIPE,
+            )
+            stdout, stderr = p.communicate(timeout=1)
+            self.assertEqual(stdout, b"")
+            self.assertFalse(stderr)
+
+            p.wait(timeout=1)
+            self.assertEqual(p.returncode, 0)
+        except BaseException:  # pragma: no cover
+            _try_kill(p)
+            raise
+        finally:
+            os.unlink(f.name)
+
+    def test_stdin_file(self):
+        # Only the part of the file after the current position is encoded.
+        with tempfile.TemporaryFile() as f:
+            f.write(b"xxxxcherry")
+            f.seek(4)
+            try:
+                p = subprocess.Popen(
+                    ['mnencode'], stdin=f, stdout=subprocess.PIPE,
+                )
+                stdout, stderr = p.communicate(timeout=1)
+                self.assertEqual(stdout, b"rondo-presto-total--daniel-alex")
+                self.assertFalse(stderr)
+
+                p.wait(timeout=1)
+                self.assertEqual(p.returncode, 0)
+            except BaseException:  # pragma: no cover
+                _try_kill(p)
+                raise
+
+    def test_output_file(self):
+        with tempfile.TemporaryDirectory() as d:
+            output_path = os.path.join(d, "output")
+            try:
+                p = subprocess.Popen(
+                    ['mnencode', '-o', output_path], stdin=subprocess.PIPE,
+                )
+                stdout, stderr = p.communicate(b"tamarillo", timeout=1)
+                self.assertFalse(stdout)
+                self.assertFalse(stderr)
+
+                p.wait(timeout=1)
+                self.assertEqual(p.returncode, 0)
+            except BaseException:  # pragma: no cover
+                _try_kill(p)
+                raise
+
+            with open(output_path, 'rb') as f:
+                self.assertEqual(
+                    f.read(),
+                    b"status-libra-recycle--radar-animal-stone--carlo"
+                )
+
+    def test_buffer_size(self):
+        data = bytes(range(256)) * 5 + b"abc"
+        for buffer_size in ['4', '9', '1024', '65536']:
+            try:
+                p = subprocess.Popen(
+                    ['mnencode', '--buffer-size', buffer_size],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                )
+                stdout, stderr = p.communicate(data, timeout=1)
+                self.assertEqual(
+                    stdout, mnemonicode.mnformat(data).encode('ascii'),
+                )
+                self.assertFalse(stderr)
+
+                p.wait(timeout=1)
+                self.assertEqual(p.returncode, 0)
+            except BaseException:  # pragma: no cover
+                _try_kill(p)
+                raise
+
+    def test_lines(self):
+        for buffer_size in ['4', '65536']:
+            try:
+                p = subprocess.Popen(
+                    ['mnencode', '--lines', '--buffer-size', buffer_size],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                )
+                stdout, stderr = p.communicate(
+                    b"fig\n\nrambutan\nlime", timeout=1
+                )
+                self.assertEqual(stdout, (
+                    b"alice-isotope-jet\n"
+                    b"\n"
+                    b"bridge-office-report--ruby-tiger-suzuki\n"
+                    b"battery-scorpio-samba\n"
+                ))
+                self.assertFalse(stderr)
+
+                p.wait(timeout=1)
+                self.assertEqual(p.returncode, 0)
+            except BaseException:  # pragma: no cover
+                _try_kill(p)
+                raise
+
+    def test_null(self):
+        try:
+            p = subprocess.Popen(
+                ['mnencode', '--null'],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            )
+            stdout, stderr = p.communicate(b"fig\nlime\0lime\0", timeout=1)
+            self.assertEqual(stdout, (
+                mnemonicode.mnformat(b"fig\nlime").encode('ascii') + b"\0"
+                b"battery-scorpio-samba\0"
+            ))
+            self.assertFalse(stderr)
+
+            p.wait(timeout=1)
+            self.assertEqual(p.returncode, 0)
+        except BaseException:  # pragma: no cover
+            _try_kill(p)
+            raise
+
+    def test_jobs(self):
+        data = bytes(range(256)) * 5 + b"abc"
+        for buffer_size in ['4', '12', '65536']:
+            try:
+                p = subprocess.Popen(
+                    ['mnencode', '--jobs', '2', '--buffer-size', buffer_size],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                )
+                stdout, stderr = p.communicate(data, timeout=5)
+                self.assertEqual(
+                    stdout, mnemonicode.mnformat(data).encode('ascii'),
+                )
+                self.assertFalse(stderr)
+
+                p.wait(timeout=1)
+                self.assertEqual(p.returncode, 0)
+            except BaseException:  # pragma: no cover
+                _try_kill(p)
+                raise
+
+
+class TestDecodeCommand(unittest.TestCase):
+    def test_basic(self):
+        try:
+            p = subprocess.Popen(
+                ['mndecode'], stdin=subprocess.PIPE, stdout=subprocess.PIPE
+            )
+            stdout, stderr = p.communicate(
+                b"bridge-office-report--ruby-tiger-suzuki", timeout=1
+            )
+            self.assertEqual(stdout, b"rambutan")
+            self.assertFalse(stderr)
+
+            p.wait(timeout=1)
+            self.assertEqual(p.returncode, 0)
+        except BaseException:  # pragma: no cover
+            _try_kill(p)
+            raise
+
+    def test_binary(self):
+        try:
+            p = subprocess.Popen(
+                ['mndecode'], stdin=subprocess.PIPE, stdout=subprocess.PIPE
+            )
+            stdout, stderr = p.communicate(
+                b"battery-cinema-alex--spirit-rose-weather--neutral-archive",
+                timeout=1
+            )
+            self.assertEqual(
+                stdout, bytes([0, 1, 2, 3, 4, 251, 252, 253, 254, 255])
+            )
+            self.assertFalse(stderr)
+
+            p.wait(timeout=1)
+            self.assertEqual(p.returncode, 0)
+        except BaseException:  # pragma: no cover
+            _try_kill(p)
+            raise
+
+    def test_abbreviated(self):
+        try:
+            p = subprocess.Popen(
+                ['mndecode', '--abbreviated'],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            )
+            stdout, stderr = p.communicate(
+                b"brid-off-repo--ruby-tig-suz", timeout=1
+            )
+            self.assertEqual(stdout, b"rambutan")
+            self.assertFalse(stderr)
+
+            p.wait(timeout=1)
+            self.assertEqual(p.returncode, 0)
+        except BaseException:  # pragma: no cover
+            _try_kill(p)
+            raise
+
+    def test_input_file(self):
+        f = tempfile.NamedTemporaryFile('wb', delete=False)
+        try:
+            f.write(b"rondo-presto-total--daniel-alex")
+            f.close()
+
+            p = subprocess.Popen(
+                ['mndecode', f.name], stdout=subprocess.PIPE,
+            )
+            stdout, stderr = p.communicate(timeout=1)
+            self.assertEqual(stdout, b"cherry")
+            self.assertFalse(stderr)
+
+            p.wait(timeout=1)
+            self.assertEqual(p.returncode, 0)
+        except BaseException:  # pragma: no cover
+            _try_kill(p)
+            raise
+        finally:
+            os.unlink(f.name)
+
+    def test_input_file_newlines(self):
+        # Newlines are translated as if the file was opened in text mode.
+        f = tempfile.NamedTemporaryFile('wb', delete=False)
+        try:  # pragma: no cover
+            f.write(b"bridge-office-report\r\nruby-tiger-suzuki\r\n")
+            f.close()
+
+            p = subprocess.Popen(
+                ['mndecode', '--group-separator', '\n', f.name],
+                stdout=subprocess.PIPE,
+            )
+            stdout, stderr = p.communicate(timeout=1)
+            self.assertEqual(stdout, b"rambutan")
+            self.assertFalse(stderr)
+
+            p.wait(timeout=1)
+            self.assertEqual(p.returncode, 0)
+        except BaseException:  # pragma: no cover
+            _try_kill(p)
+            raise
+        finally:
+            os.unlink(f.name)
+
+    def test_output_file(self):
+        with tempfile.TemporaryDirectory() as d:
+            output_path = os.path.join(d, "output")
+            try:
+                p = subprocess.Popen(
+                    ['mndecode', '-o', output_path], stdin=subprocess.PIPE,
+                )
+                stdout, stderr = p.communicate(
+                    b"status-libra-recycle--radar-animal-stone--carlo",
+                    timeout=1
+                )
+                self.assertFalse(stdout)
+                self.assertFalse(stderr)
+
+                p.wait(timeout=1)
+                self.assertEqual(p.returncode, 0)
+            except BaseException:  # pragma: no cover
+                _try_kill(p)
+                raise
+
+            with open(output_path, 'rb') as f:
+                self.assertEqual(f.read(), b"tamarillo")
+
+    def test_buffer_size(self):
+        data = bytes(range(256)) * 5 + b"abc"
+        encoded = b"\n  " + mnemonicode.mnformat(data).encode('ascii') + b" \n"
+        for buffer_size in ['1', '9', '1024', '65536']:
+            try:
+                p = subprocess.Popen(
+                    ['mndecode', '--buffer-size', buffer_size],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                )
+                stdout, stderr = p.communicate(encoded, timeout=1)
+                self.assertEqual(stdout, data)
+                self.assertFalse(stderr)
+
+                p.wait(timeout=1)
+                self.assertEqual(p.returncode, 0)
+            except BaseException:  # pragma: no cover
+                _try_kill(p)
+                raise
+
+    def test_lines(self):
+        for buffer_size in ['1', '65536']:
+            try:
+                p = subprocess.Popen(
+                    ['mndecode', '--lines', '--buffer-size', buffer_size],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                )
+                stdout, stderr = p.communicate((
+                    b"alice-isotope-jet\r\n"
+                    b"\n"
+                    b"  bridge-office-report--ruby-tiger-suzuki \n"
+                    b"battery-scorpio-samba"
+                ), timeout=1)
+                self.assertEqual(stdout, b"fig\n\nrambutan\nlime\n")
+                self.assertFalse(stderr)
+
+                p.wait(timeout=1)
+                self.assertEqual(p.returncode, 0)
+            except BaseException:  # pragma: no cover
+                _try_kill(p)
+                raise
+
+    def test_null(self):
+        try:
+            p = subprocess.Popen(
+                ['mndecode', '--null', '--abbreviated'],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            )
+            stdout, stderr = p.communicate(
+                b"alic-isot-jet\0batt-scor-samb\0", timeout=1
+            )
+            self.assertEqual(stdout, b"fig\0lime\0")
+            self.assertFalse(stderr)
+
+            p.wait(timeout=1)
+            self.assertEqual(p.returncode, 0)
+        except BaseException:  # pragma: no cover
+            _try_kill(p)
+            raise
+
+    def test_record_errors_fail(self):
+        try:
+            p = subprocess.Popen(
+                ['mndecode', '--lines'], stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            )
+            stdout, stderr = p.communicate(
+                b"alice-isotope-jet\nalice-xyzzy\nbattery-scorpio-samba\n",
+                timeout=1,
+            )
+            self.assertEqual(stdout, b"fig\n")
+            self.assertEqual(
+                stderr,
+                b"mndecode: record 2: word not recognized (position 0)\n",
+            )
+
+            p.wait(timeout=1)
+            self.assertEqual(p.returncode, 1)
+        except BaseException:  # pragma: no cover
+            _try_kill(p)
+            raise
+
+    def test_record_errors_skip(self):
+        try:
+            p = subprocess.Popen(
+                ['mndecode', '--lines', '--errors', 'skip'],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            )
+            stdout, stderr = p.communicate(
+                b"alice-isotope-jet\nalice-xyzzy\nbattery-scorpio-samba\n",
+                timeout=1,
+            )
+            self.assertEqual(stdout, b"fig\nlime\n")
+            self.assertFalse(stderr)
+
+            p.wait(timeout=1)
+            self.assertEqual(p.returncode, 0)
+        except BaseException:  # pragma: no cover
+            _try_kill(p)
+            raise
+
+    def test_record_errors_marker(self):
+        try:
+            p = subprocess.Popen(
+                ['mndecode', '--null', '--errors', 'marker', '--marker', '?'],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            )
+            stdout, stderr = p.communicate(
+                b"alice-isotope-jet\0alice-xyzzy\0battery-scorpio-samba\0",
+                timeout=1,
+            )
+            self.assertEqual(stdout, b"fig\0?\0lime\0")
+            self.assertFalse(stderr)
+
+            p.wait(timeout=1)
+            self.assertEqual(p.returncode, 0)
+        except BaseException:  # pragma: no cover
+            _try_kill(p)
+            raise
+
+    def test_errors_without_records(self):
+        try:
+            p = subprocess.Popen(
+                ['mndecode', '--errors', 'skip'], stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            )
+            stdout, stderr = p.communicate(b"alice-isotope-jet", timeout=1)
+            self.assertFalse(stdout)
+            self.assertIn(b"--errors requires --lines or --null", stderr)
+
+            p.wait(timeout=1)
+            self.assertEqual(p.returncode, 2)
+        except BaseException:  # pragma: no cover
+            _try_kill(p)
+            raise
+
+    def test_jobs(self):
+        data = bytes(range(256)) * 5 + b"abc"
+        encoded = b"\n  " + mnemonicode.mnformat(data).encode('ascii') + b" \n"
+        for buffer_size in ['1', '9', '65536']:
+            try:
+                p = subprocess.Popen(
+                    ['mndecode', '--jobs', '2', '--buffer-size', buffer_size],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                )
+                stdout, stderr = p.communicate(encoded, timeout=5)
+                self.assertEqual(stdout, data)
+                self.assertFalse(stderr)
+
+                p.wait(timeout=1)
+                self.assertEqual(p.returncode, 0)
+            except BaseException:  # pragma: no cover
+                _try_kill(p)
+                raise
+
+    def test_jobs_records(self):
+        try:
+            p = subprocess.Popen(
+                [
+                    'mndecode', '--lines', '--jobs', '2', '--buffer-size', '4',
+                    '--errors', 'skip',
+                ],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            )
+            stdout, stderr = p.communicate(
+                b"alice-isotope-jet\nalice-xyzzy\nbattery-scorpio-samba\n",
+                timeout=5,
+            )
+            self.assertEqual(stdout, b"fig\nlime\n")
+            self.assertFalse(stderr)
+
+            p.wait(timeout=1)
+            self.assertEqual(p.returncode, 0)
+        except BaseException:  # pragma: no cover
+            _try_kill(p)
+            raise
+
+
+class TestFindCommand(unittest.TestCase):
+    def test_basic(self):
+        try:
+            p = subprocess.Popen(
+                ['mnfind'], stdin=subprocess.PIPE, stdout=subprocess.PIPE
+            )
+            stdout, stderr = p.communicate((
+                "caf\u00e9 scoop-limit-recycle--ferrari-album\n"
+                "x rambutan: bridge-office-report--ruby-tiger-suzuki\n"
+            ).encode('utf-8'), timeout=1)
+            # Offsets are in bytes, not characters.
+            self.assertEqual(stdout, (
+                b"6\t34\t746f6d61746f\n"
+                b"53\t39\t72616d627574616e\n"
+            ))
+            self.assertFalse(stderr)
+
+            p.wait(timeout=1)
+            self.assertEqual(p.returncode, 0)
+        except BaseException:  # pragma: no cover
+            _try_kill(p)
+            raise
+
+    def test_min_length(self):
+        try:
+            p = subprocess.Popen(
+                ['mnfind', '--min-length', '1'],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            )
+            stdout, stderr = p.communicate(b"camera, zero-albert", timeout=1)
+            self.assertEqual(stdout, b"0\t6\t61\n8\t11\t6162\n")
+            self.assertFalse(stderr)
+
+            p.wait(timeout=1)
+            self.assertEqual(p.returncode, 0)
+        except BaseException:  # pragma: no cover
+            _try_kill(p)
+            raise
+
+    def test_invalid_separator(self):
+        try:
+            p = subprocess.Popen(
+                ['mnfind', '-w', 'x'], stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            )
+            stdout, stderr = p.communicate(b"", timeout=1)
+            self.assertEqual(stdout, b"")
+            self.assertIn(b"lower case letters", stderr)
+
+            p.wait(timeout=1)
+            self.assertEqual(p.returncode, 2)
+        except BaseException:  # pragma: no cover
+            _try_kill(p)
+            raise
 
 
 loader = unittest.TestLoader()
 suite = unittest.TestSuite((
     loader.loadTestsFromTestCase(TestBaseConversion),
     loader.loadTestsFromTestCase(TestChunkSequence),
+    loader.loadTestsFromTestCase(TestWordlist),
     loader.loadTestsFromTestCase(TestEncode),
     loader.loadTestsFromTestCase(TestFormat),
+    loader.loadTestsFromTestCase(TestFormatTo),
+    loader.loadTestsFromTestCase(TestEncodeMany),
+    loader.loadTestsFromTestCase(TestFormatMany),
+    loader.loadTestsFromTestCase(TestStreamFormatter),
     loader.loadTestsFromTestCase(TestDecode),
     loader.loadTestsFromTestCase(TestParse),
+    loader.loadTestsFromTestCase(TestAbbreviations),
+    loader.loadTestsFromTestCase(TestCorrection),
+    loader.loadTestsFromTestCase(TestDecodeInto),
+    loader.loadTestsFromTestCase(TestIntegers),
+    loader.loadTestsFromTestCase(TestCache),
+    loader.loadTestsFromTestCase(TestIterParse),
+    loader.loadTestsFromTestCase(TestDecodingReader),
+    loader.loadTestsFromTestCase(TestSeekableDecodingReader),
+    loader.loadTestsFromTestCase(TestCodec),
+    loader.loadTestsFromTestCase(TestFind),
+    loader.loadTestsFromTestCase(TestCodecClass),
+    loader.loadTestsFromTestCase(TestParseMany),
+    loader.loadTestsFromTestCase(TestColumnar),
+    loader.loadTestsFromTestCase(TestParallel),
+    loader.loadTestsFromTestCase(TestNumpy),
+    loader.loadTestsFromTestCase(TestImport),
     loader.loadTestsFromTestCase(TestEncodeCommand),
     loader.loadTestsFromTestCase(TestDecodeCommand),
+    loader.loadTestsFromTestCase(TestFindCommand),
     doctest.DocTestSuite(mnemonicode),  # type: ignore
+    doctest.DocTestSuite(mnemonicode.columnar),  # type: ignore
+    doctest.DocTestSuite(mnemonicode.parallel),  # type: ignore
 ))
+
+if numpy is not None:  # pragma: no cover
+    import mnemonicode.numpy
+    suite.addTest(doctest.DocTestSuite(mnemonicode.numpy))
+
+# Imported last, as the server tests use helpers from this module.
+from mnemonicode.tests import test_server  # noqa: E402
+suite.addTest(loader.loadTestsFromModule(test_server))
@@ -0,0 +1,333 @@
+"""Tests for :mod:`mnemonicode.server`.
+
+These are kept separate from the rest of the suite.
+"""
+import asyncio
+import binascii
+import os
+import socket
+import subprocess
+import tempfile
+import threading
+import unittest
+
+import mnemonicode
+import mnemonicode.server
+from mnemonicode.tests import _try_kill
+
+
+def _start_server(**kwargs):
+    # Runs a server listening on an arbitrary local port in a background
+    # thread.
+    loop = asyncio.new_event_loop()
+    server = mnemonicode.server.Server(**kwargs)
+    loop.run_until_complete(server.start_tcp())
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+    return server, loop, thread
+
+
+def _stop_server(server, loop, thread):
+    async def close():
+        server.close()
+        await server.wait_closed()
+
+    asyncio.run_coroutine_threadsafe(close(), loop).result(timeout=5)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+    loop.close()
+
+
+def _raw_requests(port, requests):
+    # Sends all of the requests before reading any of the responses.
+    with socket.create_connection(('127.0.0.1', port), timeout=5) as sock:
+        sock.sendall(requests)
+        sock.shutdown(socket.SHUT_WR)
+        with sock.makefile('rb') as f:
+            return f.read().splitlines()
+
+
+class TestServer(unittest.TestCase):
+    def setUp(self):
+        self.server, self.loop, self.thread = _start_server()
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    def tearDown(self):
+        _stop_server(self.server, self.loop, self.thread)
+
+    def test_encode_decode(self):
+        with mnemonicode.server.Client(port=self.port, timeout=5) as client:
+            for data in [b"", b"a", b"cucumber", os.urandom(1001)]:
+                string = client.encode(data)
+                self.assertEqual(string, mnemonicode.mnformat(data))
+                self.assertEqual(client.decode(string), data)
+
+    def test_decode_error(self):
+        with mnemonicode.server.Client(port=self.port, timeout=5) as client:
+            with self.assertRaises(ValueError) as cm:
+                client.decode("alice-isotope-jet--alice-xyzzy")
+            self.assertEqual(
+                str(cm.exception), "word not recognized (position 19)",
+            )
+
+            # The connection can still be used after an error.
+            self.assertEqual(client.decode("alice-isotope-jet"), b"fig")
+
+    def test_decode_invalid(self):
+        with mnemonicode.server.Client(port=self.port, timeout=5) as client:
+            self.assertRaises(TypeError, client.decode, b"alice")
+            self.assertRaises(ValueError, client.decode, "alice\nalice")
+
+    def test_protocol_errors(self):
+        self.assertEqual(
+            _raw_requests(self.port, (
+                b"bogus\n"
+                b"encode xyz\n"
+                b"decode \xff\n"
+                b"encode 666967\r\n"
+            )),
+            [
+                b"error unknown command: 'bogus'",
+                b"error invalid hex",
+                b"error invalid utf-8",
+                b"ok alice-isotope-jet",
+            ],
+        )
+
+    def test_pipelined(self):
+        records = [os.urandom(size) for size in range(100)]
+        responses = _raw_requests(self.port, b"".join(
+            b"encode " + binascii.hexlify(record) + b"\n"
+            for record in records
+        ))
+        self.assertEqual(responses, [
+            ("ok " + mnemonicode.mnformat(record)).rstrip().encode('ascii')
+            for record in records
+        ])
+
+        # Requests that arrive together should be converted together.
+        statistics = self.server.statistics()
+        self.assertEqual(statistics.requests, 100)
+        self.assertLess(statistics.batches, 100)
+
+    def test_concurrent_clients(self):
+        failures = []
+
+        def run():
+            try:
+                with mnemonicode.server.Client(
+                    port=self.port, timeout=5,
+                ) as client:
+                    for _ in range(20):
+                        data = os.urandom(16)
+                        if client.decode(client.encode(data)) != data:
+                            failures.append(data)  # pragma: no cover
+            except Exception as e:  # pragma: no cover
+                failures.append(e)
+
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(failures, [])
+        self.assertEqual(self.server.statistics().requests, 8 * 20 * 2)
+
+    def test_statistics(self):
+        with mnemonicode.server.Client(port=self.port, timeout=5) as client:
+            client.encode(b"fig")
+            self.assertRaises(ValueError, client.decode, "xyzzy")
+            statistics = client.statistics()
+
+        self.assertEqual(statistics.requests, 2)
+        self.assertEqual(statistics.errors, 1)
+        self.assertEqual(statistics.batches, 2)
+        self.assertGreater(statistics.uptime, 0)
+        self.assertGreater(statistics.throughput, 0)
+        self.assertGreaterEqual(
+            statistics.max_latency, statistics.mean_latency,
+        )
+
+
+class TestServerOptions(unittest.TestCase):
+    def test_separators(self):
+        server, loop, thread = _start_server(
+            word_separator=" ", group_separator=", ",
+        )
+        try:
+            port = server.sockets[0].getsockname()[1]
+            with mnemonicode.server.Client(port=port, timeout=5) as client:
+                self.assertEqual(
+                    client.encode(b"abcde"), "bogart atlas safari, cannon",
+                )
+                self.assertEqual(
+                    client.decode("bogart atlas safari, cannon"), b"abcde",
+                )
+        finally:
+            _stop_server(server, loop, thread)
+
+    def test_max_batch_size(self):
+        server, loop, thread = _start_server(max_batch_size=1)
+        try:
+            port = server.sockets[0].getsockname()[1]
+            _raw_requests(port, b"encode 00\n" * 10)
+            self.assertEqual(server.statistics().batches, 10)
+        finally:
+            _stop_server(server, loop, thread)
+
+    def test_request_too_long(self):
+        limit = mnemonicode.server.MAX_LINE_LENGTH
+        mnemonicode.server.MAX_LINE_LENGTH = 64
+        try:
+            server, loop, thread = _start_server()
+        finally:
+            mnemonicode.server.MAX_LINE_LENGTH = limit
+        try:
+            port = server.sockets[0].getsockname()[1]
+            self.assertEqual(
+                _raw_requests(port, b"encode 00\nencode " + b"00" * 64),
+                [b"ok academy", b"error request too long"],
+            )
+        finally:
+            _stop_server(server, loop, thread)
+
+    @unittest.skipUnless(
+        hasattr(socket, 'AF_UNIX'), "unix sockets are not supported",
+    )
+    def test_unix_socket(self):
+        loop = asyncio.new_event_loop()
+        server = mnemonicode.server.Server()
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "socket")
+            loop.run_until_complete(server.start_unix(path))
+            thread = threading.Thread(target=loop.run_forever)
+            thread.start()
+            try:
+                with mnemonicode.server.Client(path=path, timeout=5) as client:
+                    self.assertEqual(
+                        client.encode(b"fig"), "alice-isotope-jet",
+                    )
+            finally:
+                _stop_server(server, loop, thread)
+
+    def test_batch_failure(self):
+        # An unexpected error while converting a batch fails the requests in
+        # it, but not any that arrive later.
+        def fail(*args, **kwargs):
+            raise RuntimeError("broken")
+
+        server, loop, thread = _start_server()
+        parse_many = mnemonicode.server.mnparse_many
+        mnemonicode.server.mnparse_many = fail
+        try:
+            port = server.sockets[0].getsockname()[1]
+            with mnemonicode.server.Client(port=port, timeout=5) as client:
+                with self.assertRaises(ValueError) as cm:
+                    client.decode("alice-isotope-jet")
+                self.assertEqual(str(cm.exception), "internal error: broken")
+
+                self.assertEqual(client.encode(b"fig"), "alice-isotope-jet")
+                mnemonicode.server.mnparse_many = parse_many
+                self.assertEqual(client.decode("alice-isotope-jet"), b"fig")
+        finally:
+            mnemonicode.server.mnparse_many = parse_many
+            _stop_server(server, loop, thread)
+
+    def test_invalid_arguments(self):
+        self.assertRaises(
+            ValueError, mnemonicode.server.Server, group_separator="",
+        )
+        self.assertRaises(
+            ValueError, mnemonicode.server.Server, word_separator="",
+        )
+        self.assertRaises(
+            ValueError, mnemonicode.server.Server, group_separator="\n",
+        )
+        self.assertRaises(
+            ValueError, mnemonicode.server.Server, max_batch_size=0,
+        )
+        self.assertRaises(TypeError, mnemonicode.server.Client)
+        self.assertRaises(
+            TypeError, mnemonicode.server.Client, path="socket", port=1,
+        )
+
+
+@unittest.skipUnless(
+    hasattr(socket, 'AF_UNIX'), "unix sockets are not supported",
+)
+class TestServerCommand(unittest.TestCase):
+    def _client(self, path, command, data):
+        try:
+            p = subprocess.Popen(
+                ['mnemonicode', 'client', '--socket', path, command],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+            stdout, stderr = p.communicate(data, timeout=5)
+            p.wait(timeout=1)
+            return p.returncode, stdout, stderr
+        except BaseException:  # pragma: no cover
+            _try_kill(p)
+            raise
+
+    def test_serve(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "socket")
+            try:
+                server = subprocess.Popen(
+                    ['mnemonicode', 'serve', '--socket', path],
+                    stderr=subprocess.PIPE,
+                )
+                self.assertEqual(
+                    server.stderr.readline(),
+                    "listening on {path}\n".format(path=path).encode('utf-8'),
+                )
+
+                self.assertEqual(
+                    self._client(path, 'encode', b"fig"),
+                    (0, b"alice-isotope-jet", b""),
+                )
+                self.assertEqual(
+                    self._client(path, 'decode', b"alice-isotope-jet\n"),
+                    (0, b"fig", b""),
+                )
+                self.assertEqual(
+                    self._client(path, 'decode', b"alice-xyzzy"),
+                    (
+                        1, b"",
+                        b"mnemonicode client: word not recognized "
+                        b"(position 0)\n",
+                    ),
+                )
+
+                returncode, stdout, stderr = self._client(path, 'stats', b"")
+                self.assertEqual(returncode, 0)
+                self.assertTrue(
+                    stdout.startswith(b"requests=3 errors=1 batches=3 "),
+                )
+                self.assertFalse(stderr)
+
+                server.terminate()
+                _, stderr = server.communicate(timeout=5)
+                self.assertTrue(stderr.startswith(b"requests=4 errors=1 "))
+                self.assertEqual(server.returncode, 0)
+                self.assertFalse(os.path.exists(path))
+            except BaseException:  # pragma: no cover
+                _try_kill(server)
+                raise
+
+    def test_no_address(self):
+        try:
+            p = subprocess.Popen(
+                ['mnemonicode', 'serve'],
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            )
+            stdout, stderr = p.communicate(timeout=1)
+            self.assertFalse(stdout)
+            self.assertIn(b"-s/--socket -p/--port is required", stderr)
+
+            p.wait(timeout=1)
+            self.assertEqual(p.returncode, 2)
+        except BaseException:  # pragma: no cover
+            _try_kill(p)
+            raise
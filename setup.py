@@ -30,7 +30,6 @@ setup(
         'License :: OSI Approved :: BSD License',
         'Operating System :: OS Independent',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.4',
         'Programming Language :: Python :: 3.5',
         'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
@@ -39,14 +38,20 @@ setup(
     ],
     install_requires=[
     ],
+    extras_require={
+        'numpy': ['numpy'],
+    },
+    python_requires='>=3.5.2',
     packages=find_packages(),
     package_data={
         '': ['*.pyi', 'py.typed'],
     },
     entry_points={
         'console_scripts': [
-            'mnencode=mnemonicode:_mnencode_main',
-            'mndecode=mnemonicode:_mndecode_main',
+            'mnencode=mnemonicode._cli:mnencode_main',
+            'mndecode=mnemonicode._cli:mndecode_main',
+            'mnfind=mnemonicode._cli:mnfind_main',
+            'mnemonicode=mnemonicode._cli:mnemonicode_main',
         ],
     },
     test_suite='mnemonicode.tests.suite',